@@ -0,0 +1,8 @@
+# gerador_readme_ia/__main__.py
+"""Permite ``python -m gerador_readme_ia batch <dir>``."""
+import sys
+
+from .cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,268 @@
+# gerador_readme_ia/cli.py
+"""Modo headless: gera READMEs para todos os ZIPs (ou tarballs) de um diretório.
+
+Uso: ``python -m gerador_readme_ia batch <dir> [opções]``. Não importa
+customtkinter, podendo rodar em CI sem display.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from .config_manager import ConfigManager
+from .constants import APP_AUTHOR, APP_NAME, APP_VERSION
+from .gui.logic import (
+    DEFAULT_MAX_FILE_SIZE_KB,
+    DEFAULT_MAX_FILES,
+    clean_readme_content,
+    extract_project_data_from_zip,
+)
+from .gui.summarizer import build_generation_prompt
+from .logger_setup import setup_logging
+from .utils.extraction_cache import ExtractionCache
+from .utils.file_helper import get_readme_output_filename
+from .utils.manifest import build_manifest, load_manifest, manifest_path_for, save_manifest
+from .utils.sources import ARCHIVE_SUFFIXES, source_size
+
+logger = setup_logging(
+    f"{APP_NAME}.cli",
+    app_author=APP_AUTHOR,
+    debug=os.getenv("APP_DEBUG", "false").lower() == "true",
+)
+
+DEFAULT_BATCH_WORKERS = 4
+
+
+class BatchResult(NamedTuple):
+    zip_path: str
+    output_path: Optional[str]
+    error: Optional[str]
+    elapsed: float
+    input_bytes: int
+    model: Optional[str] = None
+
+
+def find_archives(input_dir: str, include_dirs: bool = False, exclude: Sequence[str] = ()) -> List[str]:
+    """Lista os ``.zip``/``.tar.gz``/``.tar.zst`` do diretório (não recursivo), em
+    ordem alfabética; com ``include_dirs``, cada subpasta também é um projeto.
+    """
+    excluded = {os.path.abspath(path) for path in exclude}
+    archives = []
+    for path in Path(input_dir).iterdir():
+        if path.is_file() and path.name.lower().endswith(ARCHIVE_SUFFIXES):
+            archives.append(str(path))
+        elif (
+            include_dirs
+            and path.is_dir()
+            and not path.name.startswith(".")
+            and os.path.abspath(path) not in excluded
+        ):
+            archives.append(str(path))
+    return sorted(archives)
+
+
+def generate_readme_for_archive(
+    zip_path: str,
+    output_dir: str,
+    config: Dict[str, object],
+    client,
+    cache: Optional[ExtractionCache] = None,
+    summary_cache: Optional[ExtractionCache] = None,
+    section_cache: Optional[ExtractionCache] = None,
+) -> BatchResult:
+    """Pipeline completo para um arquivo; erros viram ``BatchResult.error``.
+
+    O manifesto do ZIP é gravado ao lado do README; com ``config["incremental"]``
+    o manifesto anterior permite reaproveitar as seções inalteradas.
+    """
+    started_at = time.perf_counter()
+    input_bytes = source_size(zip_path)
+    manifest_path = manifest_path_for(zip_path, output_dir)
+    try:
+        previous_manifest = load_manifest(manifest_path) if config.get("incremental") else None
+        project_data = extract_project_data_from_zip(
+            zip_path,
+            config,
+            cache=cache,
+            section_cache=section_cache,
+            previous_manifest=previous_manifest,
+        )
+        prompt = build_generation_prompt(project_data, config, client, summary_cache)
+        readme = clean_readme_content(
+            client.send_conversational_prompt(
+                prompt, use_cache=bool(config.get("use_response_cache"))
+            ) or ""
+        )
+        if not readme:
+            raise ValueError("A IA não retornou conteúdo.")
+
+        output_path = get_readme_output_filename(os.path.basename(zip_path), output_dir)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(readme)
+        save_manifest(manifest_path, build_manifest(zip_path), os.path.basename(zip_path))
+        return BatchResult(
+            zip_path,
+            output_path,
+            None,
+            time.perf_counter() - started_at,
+            input_bytes,
+            getattr(client, "last_served_model", None),
+        )
+    except Exception as e:
+        logger.error(f"Falha ao gerar README para {zip_path}: {type(e).__name__} - {e}")
+        return BatchResult(zip_path, None, str(e), time.perf_counter() - started_at, input_bytes)
+
+
+def run_batch(
+    archives: Sequence[str],
+    output_dir: str,
+    config: Dict[str, object],
+    client,
+    workers: int = DEFAULT_BATCH_WORKERS,
+    cache: Optional[ExtractionCache] = None,
+    summary_cache: Optional[ExtractionCache] = None,
+    section_cache: Optional[ExtractionCache] = None,
+) -> List[BatchResult]:
+    """Processa os arquivos concorrentemente, devolvendo resultados na ordem de entrada."""
+    def job(zip_path: str) -> BatchResult:
+        result = generate_readme_for_archive(
+            zip_path, output_dir, config, client, cache, summary_cache, section_cache
+        )
+        status = "OK  " if result.error is None else "ERRO"
+        detail = result.output_path if result.error is None else result.error
+        served_by = f", {result.model}" if result.model else ""
+        print(f"[{status}] {os.path.basename(zip_path)} ({result.elapsed:.1f}s{served_by}) -> {detail}", flush=True)
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="batch") as executor:
+        return list(executor.map(job, archives))
+
+
+def format_summary(results: Sequence[BatchResult], wall_time: float) -> str:
+    ok = sum(1 for result in results if result.error is None)
+    total_mb = sum(result.input_bytes for result in results) / (1024 * 1024)
+    per_minute = len(results) / wall_time * 60 if wall_time > 0 else 0.0
+    mb_per_second = total_mb / wall_time if wall_time > 0 else 0.0
+    return (
+        f"{len(results)} arquivos em {wall_time:.1f}s: {ok} gerados, {len(results) - ok} com erro | "
+        f"{per_minute:.1f} arquivos/min, {mb_per_second:.2f} MB/s de entrada"
+    )
+
+
+def build_config(args: argparse.Namespace) -> Dict[str, object]:
+    return {
+        "readme_style": args.style,
+        "max_files": args.max_files,
+        "max_file_size_kb": args.max_file_size_kb,
+        "extract_workers": args.extract_workers,
+        "include_tests": not args.no_tests,
+        "include_docs": not args.no_docs,
+        "include_config": not args.no_config,
+        "respect_gitignore": not args.no_gitignore,
+        "include_badges": True,
+        "include_toc": True,
+        "include_examples": True,
+        "use_response_cache": args.response_cache,
+        "map_reduce": args.map_reduce,
+        "incremental": args.incremental,
+    }
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m gerador_readme_ia",
+        description="Gerador de README.md Inteligente - modo headless",
+    )
+    parser.add_argument("--version", action="version", version=f"%(prog)s {APP_VERSION}")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    batch = subparsers.add_parser("batch", help="Gera READMEs para todos os ZIPs de um diretório")
+    batch.add_argument("input_dir", help="Diretório com os arquivos .zip, .tar.gz ou .tar.zst")
+    batch.add_argument("-o", "--output", help="Diretório de saída (padrão: <input_dir>/readmes)")
+    batch.add_argument("-j", "--workers", type=int, default=DEFAULT_BATCH_WORKERS,
+                       help="Arquivos processados em paralelo")
+    batch.add_argument("--model", help="Modelo Gemini (padrão: configuração salva ou GEMINI_MODEL)")
+    batch.add_argument("--style", default="profissional", help="Estilo do README")
+    batch.add_argument("--max-files", type=int, default=DEFAULT_MAX_FILES)
+    batch.add_argument("--max-file-size-kb", type=int, default=DEFAULT_MAX_FILE_SIZE_KB)
+    batch.add_argument("--extract-workers", type=int, default=1,
+                       help="Threads de descompactação por arquivo")
+    batch.add_argument("--no-tests", action="store_true", help="Ignorar arquivos de teste")
+    batch.add_argument("--no-docs", action="store_true", help="Ignorar documentação")
+    batch.add_argument("--no-config", action="store_true", help="Ignorar arquivos de configuração")
+    batch.add_argument("--no-gitignore", action="store_true",
+                       help="Não aplicar os .gitignore do projeto nem os padrões de ignorados da aplicação")
+    batch.add_argument("--no-cache", action="store_true", help="Desativar caches de extração e de resumos")
+    batch.add_argument("--response-cache", action="store_true",
+                       help="Reutilizar respostas idênticas do Gemini")
+    batch.add_argument("--map-reduce", action="store_true",
+                       help="Resumir por pasta os projetos que não cabem no contexto do modelo")
+    batch.add_argument("--incremental", action="store_true",
+                       help="Reextrair só os arquivos alterados desde o último manifesto na saída")
+    batch.add_argument("--dirs", action="store_true",
+                       help="Tratar também cada subpasta de input_dir como um projeto")
+    return parser
+
+
+def _run_batch_command(args: argparse.Namespace) -> int:
+    # Importado aqui para que --help funcione mesmo sem google-generativeai
+    from .ia_client.gemini_client import GeminiClient
+    from .ia_client.response_cache import RESPONSE_CACHE_FILE_NAME, ResponseCache
+
+    if not os.path.isdir(args.input_dir):
+        print(f"Diretório não encontrado: {args.input_dir}", file=sys.stderr)
+        return 2
+
+    output_dir = args.output or os.path.join(args.input_dir, "readmes")
+    archives = find_archives(args.input_dir, include_dirs=args.dirs, exclude=[output_dir])
+    if not archives:
+        print(f"Nenhum projeto (.zip, .tar.gz, .tar.zst) encontrado em {args.input_dir}", file=sys.stderr)
+        return 1
+
+    config_mgr = ConfigManager()
+    api_key = config_mgr.get_api_key()
+    if not api_key:
+        print("API Key não configurada. Defina GEMINI_API_KEY ou configure pela GUI.", file=sys.stderr)
+        return 2
+
+    response_cache = None
+    if args.response_cache:
+        response_cache = ResponseCache(os.path.join(config_mgr.get_cache_dir(), RESPONSE_CACHE_FILE_NAME))
+    client = GeminiClient(api_key, args.model or config_mgr.get_gemini_model(), response_cache=response_cache)
+
+    config = build_config(args)
+    config["token_budget"] = client.get_prompt_token_budget()
+    cache = None if args.no_cache else ExtractionCache(config_mgr.get_cache_dir("extraction"))
+    summary_cache = None if args.no_cache else ExtractionCache(config_mgr.get_cache_dir("summaries"))
+    section_cache = None if args.no_cache else ExtractionCache(config_mgr.get_cache_dir("sections"))
+
+    print(f"Processando {len(archives)} arquivos com {args.workers} workers ({client.model_name})...")
+    started_at = time.perf_counter()
+    try:
+        results = run_batch(
+            archives, output_dir, config, client, args.workers, cache, summary_cache, section_cache
+        )
+    finally:
+        client.close()
+        if response_cache is not None:
+            response_cache.close()
+
+    print(format_summary(results, time.perf_counter() - started_at))
+    status = client.get_rate_limit_status()
+    print(
+        f"Rate limiter: espera média {status['average_wait_seconds']:.2f}s, "
+        f"máxima {status['max_wait_seconds']:.2f}s em {status['total_requests']:.0f} requisições"
+    )
+    return 0 if all(result.error is None for result in results) else 1
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if args.command == "batch":
+        return _run_batch_command(args)
+    return 2
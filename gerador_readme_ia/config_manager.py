@@ -1,17 +1,21 @@
 # gerador_readme_ia/config_manager.py
 import configparser
+import hashlib
 import logging
 import os
+import time
 from typing import Optional
 
-from appdirs import user_config_dir
+from appdirs import user_cache_dir, user_config_dir
 
 from .constants import (
     APP_AUTHOR,
     APP_NAME,
     CONFIG_FILE_NAME,
     CONFIG_KEY_API_KEY,
+    CONFIG_KEY_LAST_VALIDATED_AT,
     CONFIG_KEY_MODEL,
+    CONFIG_KEY_VALIDATED_KEY_HASH,
     CONFIG_SECTION_API,
     DEFAULT_GEMINI_MODEL,
 )
@@ -127,11 +131,43 @@ class ConfigManager:
             logger.error(f"Erro ao salvar modelo Gemini: {e}", exc_info=True)
             raise
 
+    @staticmethod
+    def _hash_api_key(api_key: str) -> str:
+        return hashlib.sha256(api_key.strip().encode("utf-8")).hexdigest()
+
+    def get_last_validated_at(self, api_key: str) -> Optional[float]:
+        """Momento (epoch) da última validação bem-sucedida desta API Key"""
+        try:
+            key_hash = self.config.get(CONFIG_SECTION_API, CONFIG_KEY_VALIDATED_KEY_HASH, fallback=None)
+            if not api_key or key_hash != self._hash_api_key(api_key):
+                return None
+            return self.config.getfloat(CONFIG_SECTION_API, CONFIG_KEY_LAST_VALIDATED_AT, fallback=None)
+        except ValueError as e:
+            logger.warning(f"Registro de validação inválido na configuração: {e}")
+            return None
+
+    def set_last_validated_at(self, api_key: str, timestamp: Optional[float] = None):
+        """Registra a validação da API Key (apenas o hash da chave é gravado)"""
+        if not api_key or not api_key.strip():
+            return
+        try:
+            self.config.set(CONFIG_SECTION_API, CONFIG_KEY_VALIDATED_KEY_HASH, self._hash_api_key(api_key))
+            self.config.set(
+                CONFIG_SECTION_API,
+                CONFIG_KEY_LAST_VALIDATED_AT,
+                f"{timestamp if timestamp is not None else time.time():.0f}",
+            )
+            self._save_config()
+        except Exception as e:
+            logger.error(f"Erro ao registrar validação da API Key: {e}", exc_info=True)
+
     def clear_api_key(self):
         """Remove a API Key da configuração"""
         try:
             if self.config.has_option(CONFIG_SECTION_API, CONFIG_KEY_API_KEY):
                 self.config.remove_option(CONFIG_SECTION_API, CONFIG_KEY_API_KEY)
+                self.config.remove_option(CONFIG_SECTION_API, CONFIG_KEY_VALIDATED_KEY_HASH)
+                self.config.remove_option(CONFIG_SECTION_API, CONFIG_KEY_LAST_VALIDATED_AT)
                 self._save_config()
                 logger.info("API Key removida da configuração.")
         except Exception as e:
@@ -143,6 +179,11 @@ class ConfigManager:
         model = self.get_gemini_model()
         return bool(api_key and model)
 
+    def get_cache_dir(self, name: str = "") -> str:
+        """Diretório de cache do usuário (opcionalmente uma subpasta)"""
+        cache_dir = user_cache_dir(self.app_name_const, self.app_author_const)
+        return os.path.join(cache_dir, name) if name else cache_dir
+
     def get_config_file_path(self) -> str:
         """Retorna o caminho do arquivo de configuração"""
         return self.config_file_path
\ No newline at end of file
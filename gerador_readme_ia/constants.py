@@ -17,6 +17,11 @@ CONFIG_FILE_NAME = "settings_readme_generator.ini"
 CONFIG_SECTION_API = "API_Gemini"
 CONFIG_KEY_API_KEY = "google_api_key"
 CONFIG_KEY_MODEL = "gemini_model"
+CONFIG_KEY_LAST_VALIDATED_AT = "last_validated_at"
+CONFIG_KEY_VALIDATED_KEY_HASH = "validated_key_hash"
+
+# Dentro desta janela a API Key validada não é reconferida na rede ao iniciar
+API_VALIDATION_TTL_SECONDS = 24 * 60 * 60
 
 # Lista de modelos conhecidos e testados (em ordem de preferência)
 KNOWN_WORKING_MODELS = [
@@ -26,6 +31,30 @@ KNOWN_WORKING_MODELS = [
     "gemini-2.0-flash-exp"   # Experimental
 ]
 
+# Janela de contexto (tokens de entrada) por família de modelo; nomes com
+# sufixo (ex.: "gemini-1.5-flash-002") usam o prefixo mais longo conhecido
+MODEL_CONTEXT_WINDOWS = {
+    "gemini-1.0-pro": 30_720,
+    "gemini-1.5-flash": 1_048_576,
+    "gemini-1.5-pro": 2_097_152,
+    "gemini-2.0-flash": 1_048_576,
+}
+DEFAULT_CONTEXT_WINDOW = 30_720
+MAX_OUTPUT_TOKENS = 8192
+
+# Estimativa grosseira usada para orçamento de contexto e rate limiting
+CHARS_PER_TOKEN = 4
+
+# Limites do cliente por família de modelo: (requisições/min, tokens/min).
+# Valores do plano gratuito; ajuste conforme a quota da sua API Key.
+MODEL_RATE_LIMITS = {
+    "gemini-1.0-pro": (15, 32_000),
+    "gemini-1.5-flash": (15, 1_000_000),
+    "gemini-1.5-pro": (2, 32_000),
+    "gemini-2.0-flash": (10, 1_000_000),
+}
+DEFAULT_MODEL_RATE_LIMITS = (10, 250_000)
+
 # Links úteis
 GOOGLE_AI_STUDIO_URL = "https://aistudio.google.com/app/apikey"
 GEMINI_PRICING_URL = "https://ai.google.dev/pricing"
@@ -597,3 +626,24 @@ Estruture um README.md **focado em colaboração e comunidade** com **12 seçõe
 
 # Prompt legado para compatibilidade (será removido em versões futuras)
 PROMPT_README_GENERATION = PROMPTS["profissional"]
+
+# ---------------------------------------------------------------------
+# RESUMO EM DUAS FASES (MAP-REDUCE) PARA PROJETOS GRANDES
+# ---------------------------------------------------------------------
+
+# Modelo barato usado na fase de mapa (um resumo por diretório de topo)
+SUMMARY_MODEL = "gemini-1.5-flash"
+
+PROMPT_SUMMARIZE_GROUP = r"""
+Você está analisando uma parte de um projeto de software para ajudar a escrever o README.md.
+Os arquivos abaixo pertencem ao diretório **{group}**.
+
+Resuma em até 200 palavras, em Português (Brasil), mantendo termos técnicos em inglês:
+- Propósito do diretório e principais responsabilidades
+- Módulos, classes, funções ou comandos importantes (com nomes exatos)
+- Dependências, configurações e pontos de entrada relevantes
+
+Não invente informações; responda apenas com o resumo em tópicos.
+
+{project_data}
+"""
@@ -1,33 +1,33 @@
 # gerador_readme_ia/gui/__init__.py
-"""Módulo GUI modernizado com CustomTkinter para o Gerador de README IA"""
+"""Módulo GUI modernizado com CustomTkinter para o Gerador de README IA
 
-from .app_gui import ReadmeGeneratorApp
-from .ctk_theme_manager import Windows11ThemeManager, theme_manager
-from .ctk_widgets import (
-    APIKeyDialog,
-    ConsoleWidget,
-    InfoCard,
-    ModelSelectionDialog,
-    ModernButton,
-    ModernFrame,
-    ModernSection,
-    ModernTextWidget,
-    ProgressDialog,
-    QuotaExceededDialog,
-)
+Os widgets são importados sob demanda, para que ``gui.logic`` possa ser usado
+em modo headless (CLI) sem carregar o customtkinter.
+"""
 
-__all__ = [
-    'ReadmeGeneratorApp',
-    'theme_manager',
-    'Windows11ThemeManager',
-    'ModernFrame',
-    'ModernButton', 
-    'ModernSection',
-    'ModernTextWidget',
-    'ConsoleWidget',
-    'APIKeyDialog',
-    'ModelSelectionDialog',
-    'QuotaExceededDialog',
-    'ProgressDialog',
-    'InfoCard'
-]
\ No newline at end of file
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    'ReadmeGeneratorApp': '.app_gui',
+    'theme_manager': '.ctk_theme_manager',
+    'Windows11ThemeManager': '.ctk_theme_manager',
+    'ModernFrame': '.ctk_widgets',
+    'ModernButton': '.ctk_widgets',
+    'ModernSection': '.ctk_widgets',
+    'ModernTextWidget': '.ctk_widgets',
+    'ConsoleWidget': '.ctk_widgets',
+    'APIKeyDialog': '.ctk_widgets',
+    'ModelSelectionDialog': '.ctk_widgets',
+    'QuotaExceededDialog': '.ctk_widgets',
+    'ProgressDialog': '.ctk_widgets',
+    'InfoCard': '.ctk_widgets',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
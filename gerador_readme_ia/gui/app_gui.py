@@ -5,19 +5,31 @@ Interface principal modernizada com CustomTkinter estilo Windows 11
 from __future__ import annotations
 
 import os
-import threading
+import time
 import tkinter as tk
+from concurrent.futures import Future
 from pathlib import Path
 from tkinter import filedialog, messagebox
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 import customtkinter as ctk
-import google.generativeai as genai
 
 from ..config_manager import ConfigManager
-from ..constants import APP_DISPLAY_NAME, APP_NAME, APP_VERSION, DEFAULT_GEMINI_MODEL
+from ..constants import (
+    API_VALIDATION_TTL_SECONDS,
+    APP_DISPLAY_NAME,
+    APP_NAME,
+    APP_VERSION,
+    DEFAULT_GEMINI_MODEL,
+)
 from ..ia_client.gemini_client import GeminiClient, QuotaExceededException
+from ..ia_client.model_catalog import get_model_catalog
+from ..ia_client.response_cache import RESPONSE_CACHE_FILE_NAME, ResponseCache
 from ..logger_setup import setup_logging
+from ..utils.cancellation import JobCancelledException
+from ..utils.extraction_cache import ExtractionCache
+from ..utils.manifest import build_manifest, load_manifest, manifest_path_for, save_manifest
+from ..utils.sources import source_label, source_stem
 from .ctk_theme_manager import theme_manager
 from .ctk_widgets import (
     APIKeyDialog,
@@ -29,14 +41,49 @@ from .ctk_widgets import (
     ModernTextWidget,
     QuotaExceededDialog,
 )
+from .job_queue import (
+    QUEUE_CANCELLED,
+    QUEUE_DONE,
+    QUEUE_FAILED,
+    QUEUE_QUEUED,
+    QUEUE_RUNNING,
+    GenerationQueue,
+    QueueEntry,
+    queue_concurrency,
+    save_generated_readme,
+)
+from .jobs import GenerationJob
 from .logic import (
-    build_prompt,
     clean_readme_content,
     extract_project_data_from_zip,
 )
+from .progress_channel import ProgressChannel
+from .summarizer import build_generation_prompt
+from .task_executor import LANE_CPU, LANE_NETWORK, TaskExecutor
 
 logger = setup_logging(f"{APP_NAME}.gui", debug=False)
 
+# Intervalo mínimo entre atualizações do preview durante o streaming (segundos)
+STREAM_PREVIEW_INTERVAL = 0.1
+
+PROJECT_FILE_TYPES = [
+    ("Projetos compactados", "*.zip *.tar.gz *.tgz *.tar.zst *.tar"),
+    ("Arquivos ZIP", "*.zip"),
+    ("Tarballs", "*.tar.gz *.tgz *.tar.zst *.tar"),
+]
+
+# Abas fixas do painel direito; as de resultado da fila não podem repetir esses nomes
+PREVIEW_TAB = "README Gerado"
+QUEUE_TAB = "Fila"
+SETTINGS_TAB = "Configurações Avançadas"
+
+QUEUE_STATUS_COLORS = {
+    QUEUE_RUNNING: "info",
+    QUEUE_DONE: "success",
+    QUEUE_FAILED: "error",
+    QUEUE_CANCELLED: "warning",
+}
+
 
 class ReadmeGeneratorApp(ctk.CTk):
     """Interface principal modernizada com CustomTkinter"""
@@ -63,15 +110,34 @@ class ReadmeGeneratorApp(ctk.CTk):
         self.model_name: str = self.config_mgr.get_gemini_model() or DEFAULT_GEMINI_MODEL
         self.available_models: list[str] = []
         self.gemini_client: Optional[GeminiClient] = None
+        self.model_catalog = get_model_catalog()
+        self.extraction_cache = ExtractionCache(self.config_mgr.get_cache_dir("extraction"))
+        self.summary_cache = ExtractionCache(self.config_mgr.get_cache_dir("summaries"))
+        self.section_cache = ExtractionCache(self.config_mgr.get_cache_dir("sections"))
+        self.response_cache = ResponseCache(
+            os.path.join(self.config_mgr.get_cache_dir(), RESPONSE_CACHE_FILE_NAME)
+        )
         self.zip_file_path: Optional[str] = None
         self.generated_readme: str = ""
+        # Onde o último README foi salvo: lá fica o manifesto da regeneração incremental
+        self._last_output_dir: Optional[str] = None
+        # Progresso vindo dos workers, entregue à barra no máximo 30 vezes por segundo
+        self.progress_channel = ProgressChannel(self.after, self._update_progress)
         
         # Estados de validação
         self._api_key_validated = False
         self._models_loaded = False
         
-        # Controle de threads
-        self._active_threads: list = []
+        # Tarefas em segundo plano: lanes limitadas de rede e de CPU
+        self.executor = TaskExecutor(self.after)
+        self._current_job: Optional[GenerationJob] = None
+        
+        # Fila de vários projetos: config congelada ao iniciar, ``None`` com a fila parada
+        self.generation_queue = GenerationQueue()
+        self.queue_output_dir: Optional[str] = None
+        self._queue_config: Optional[Dict] = None
+        self._queue_rows: Dict[int, tuple] = {}
+        self._result_tab_names: Dict[int, str] = {}
 
         # Interface
         self._setup_ui()
@@ -196,15 +262,33 @@ class ReadmeGeneratorApp(ctk.CTk):
         )
         path_label.pack(fill="x", pady=(0, 10))
         
-        # Botão de seleção
+        # Botões de seleção: arquivo compactado ou pasta local
         self.select_file_btn = ModernButton(
             section.content_frame,
-            text="Selecionar Arquivo ZIP",
+            text="Selecionar Arquivo ZIP / TAR",
             command=self._select_zip_file,
             width=300,
             height=40
         )
         self.select_file_btn.pack(fill="x")
+
+        self.select_dir_btn = ModernButton(
+            section.content_frame,
+            text="Selecionar Pasta",
+            command=self._select_project_dir,
+            width=300,
+            height=32
+        )
+        self.select_dir_btn.pack(fill="x", pady=(6, 0))
+
+        self.add_to_queue_btn = ModernButton(
+            section.content_frame,
+            text="Adicionar Vários à Fila",
+            command=self._add_archives_to_queue,
+            width=300,
+            height=32
+        )
+        self.add_to_queue_btn.pack(fill="x", pady=(6, 0))
         
         return section
 
@@ -273,6 +357,14 @@ class ReadmeGeneratorApp(ctk.CTk):
         )
         self.config_model_btn.grid(row=0, column=1, padx=(5, 0), sticky="ew")
         
+        self.test_connection_btn = ModernButton(
+            buttons_frame,
+            text="Testar conexão",
+            command=self._test_connection,
+            height=30
+        )
+        self.test_connection_btn.grid(row=1, column=0, columnspan=2, pady=(8, 0), sticky="ew")
+        
         return section
 
     def _create_console_section(self, parent):
@@ -297,11 +389,15 @@ class ReadmeGeneratorApp(ctk.CTk):
         self.tabview.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
         
         # Tab de preview
-        preview_tab = self.tabview.add("README Gerado")
+        preview_tab = self.tabview.add(PREVIEW_TAB)
         self._create_preview_tab(preview_tab)
         
+        # Tab da fila de projetos
+        queue_tab = self.tabview.add(QUEUE_TAB)
+        self._create_queue_tab(queue_tab)
+        
         # Tab de configurações
-        settings_tab = self.tabview.add("Configurações Avançadas")
+        settings_tab = self.tabview.add(SETTINGS_TAB)
         self._create_settings_tab(settings_tab)
 
     def _create_preview_tab(self, parent):
@@ -353,6 +449,105 @@ class ReadmeGeneratorApp(ctk.CTk):
         self.preview_container.grid_columnconfigure(0, weight=1)
         self.preview_container.grid_columnconfigure(1, weight=0)
 
+    def _create_queue_tab(self, parent):
+        """Tab da fila: vários projetos gerados em paralelo e salvos automaticamente"""
+        parent.grid_columnconfigure(0, weight=1)
+        parent.grid_rowconfigure(2, weight=1)
+        
+        # Toolbar da fila
+        toolbar = ctk.CTkFrame(parent, height=50)
+        toolbar.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 0))
+        
+        add_files_btn = ModernButton(
+            toolbar,
+            text="Adicionar Arquivos",
+            command=self._add_archives_to_queue,
+            width=130,
+            height=30
+        )
+        add_files_btn.pack(side="left", padx=(10, 5), pady=8)
+        
+        add_dir_btn = ModernButton(
+            toolbar,
+            text="Adicionar Pasta",
+            command=self._add_dir_to_queue,
+            width=110,
+            height=30
+        )
+        add_dir_btn.pack(side="left", padx=(0, 5), pady=8)
+        
+        self.start_queue_btn = ModernButton(
+            toolbar,
+            text="Iniciar Fila",
+            command=self._start_queue,
+            width=100,
+            height=30
+        )
+        self.start_queue_btn.pack(side="left", padx=(0, 5), pady=8)
+        
+        self.cancel_queue_btn = ModernButton(
+            toolbar,
+            text="Cancelar Fila",
+            command=self._cancel_queue,
+            width=100,
+            height=30
+        )
+        self.cancel_queue_btn.pack(side="left", padx=(0, 5), pady=8)
+        self.cancel_queue_btn.configure(state="disabled")
+        
+        clear_btn = ModernButton(
+            toolbar,
+            text="Limpar Concluídos",
+            command=self._clear_finished_queue,
+            width=120,
+            height=30
+        )
+        clear_btn.pack(side="left", padx=(0, 5), pady=8)
+        
+        close_tabs_btn = ModernButton(
+            toolbar,
+            text="Fechar Resultados",
+            command=self._close_result_tabs,
+            width=120,
+            height=30
+        )
+        close_tabs_btn.pack(side="left", pady=8)
+        
+        # Destino dos READMEs e resumo
+        info_frame = ctk.CTkFrame(parent, fg_color="transparent")
+        info_frame.grid(row=1, column=0, sticky="ew", padx=5, pady=(5, 0))
+        info_frame.grid_columnconfigure(0, weight=1)
+        
+        self.queue_output_var = tk.StringVar(value="Saída: pasta de cada projeto")
+        ctk.CTkLabel(
+            info_frame,
+            textvariable=self.queue_output_var,
+            font=ctk.CTkFont(size=11),
+            text_color=theme_manager.get_color("text_secondary"),
+            anchor="w"
+        ).grid(row=0, column=0, sticky="w", padx=10)
+        
+        output_btn = ModernButton(
+            info_frame,
+            text="Pasta de Saída",
+            command=self._select_queue_output_dir,
+            width=110,
+            height=28
+        )
+        output_btn.grid(row=0, column=1, sticky="e", padx=10)
+        
+        self.queue_summary_var = tk.StringVar(value="Nenhum projeto na fila")
+        ctk.CTkLabel(
+            info_frame,
+            textvariable=self.queue_summary_var,
+            font=ctk.CTkFont(size=11),
+            anchor="w"
+        ).grid(row=1, column=0, columnspan=2, sticky="w", padx=10, pady=(5, 0))
+        
+        # Lista de projetos
+        self.queue_list = ctk.CTkScrollableFrame(parent)
+        self.queue_list.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
+
     def _create_settings_tab(self, parent):
         """Tab de configurações avançadas"""
         # Scrollable frame para as configurações
@@ -416,6 +611,10 @@ class ReadmeGeneratorApp(ctk.CTk):
         self.include_config.grid(row=1, column=0, sticky="w", pady=2)
         self.include_config.select()
         
+        self.respect_gitignore = ctk.CTkCheckBox(filters_frame, text="Respeitar .gitignore")
+        self.respect_gitignore.grid(row=1, column=1, sticky="w", pady=2)
+        self.respect_gitignore.select()
+        
         # Configurações numéricas
         numeric_frame = ctk.CTkFrame(section.content_frame, fg_color="transparent")
         numeric_frame.pack(fill="x")
@@ -437,6 +636,14 @@ class ReadmeGeneratorApp(ctk.CTk):
         self.max_files.grid(row=1, column=1, sticky="e", pady=5)
         self.max_files.insert(0, "30")
         
+        # Threads de extração (1 = sequencial)
+        workers_label = ctk.CTkLabel(numeric_frame, text="Threads de extração:")
+        workers_label.grid(row=2, column=0, sticky="w", pady=5)
+        
+        self.extract_workers = ctk.CTkEntry(numeric_frame, width=100, placeholder_text="1")
+        self.extract_workers.grid(row=2, column=1, sticky="e", pady=5)
+        self.extract_workers.insert(0, "1")
+        
         return section
 
     def _create_style_section(self, parent):
@@ -476,6 +683,12 @@ class ReadmeGeneratorApp(ctk.CTk):
         self.include_examples.grid(row=1, column=0, sticky="w", pady=2)
         self.include_examples.select()
         
+        self.use_response_cache = ctk.CTkCheckBox(options_frame, text="Reutilizar respostas em cache")
+        self.use_response_cache.grid(row=1, column=1, sticky="w", pady=2)
+        
+        self.map_reduce = ctk.CTkCheckBox(options_frame, text="Resumir projetos grandes por pasta")
+        self.map_reduce.grid(row=2, column=0, columnspan=2, sticky="w", pady=2)
+        
         return section
 
     def _create_footer(self):
@@ -506,6 +719,15 @@ class ReadmeGeneratorApp(ctk.CTk):
         self.progress_bar.grid(row=1, column=0, sticky="ew", pady=(5, 0))
         self.progress_bar.set(0)
         
+        self.cancel_btn = ModernButton(
+            self.progress_frame,
+            text="Cancelar",
+            command=self._cancel_generation,
+            width=90,
+            height=28
+        )
+        self.cancel_btn.grid(row=0, column=1, rowspan=2, sticky="e", padx=(10, 0))
+        
         # Ocultar progress inicialmente
         self.progress_frame.grid_remove()
         
@@ -539,19 +761,34 @@ class ReadmeGeneratorApp(ctk.CTk):
             self.custom_prompt_text.configure(state="disabled")
 
     def _select_zip_file(self):
-        """Seleciona arquivo ZIP do projeto"""
+        """Seleciona arquivo ZIP (ou tarball) do projeto"""
         file_path = filedialog.askopenfilename(
-            title="Selecionar arquivo ZIP do projeto",
+            title="Selecionar arquivo do projeto",
             initialdir=str(Path.home()),
-            filetypes=[("Arquivos ZIP", "*.zip")]
+            filetypes=PROJECT_FILE_TYPES
         )
         
         if file_path:
-            self.zip_file_path = file_path
-            filename = os.path.basename(file_path)
-            self.file_path_var.set(filename)
-            self.console.append_step("Arquivo", "success", filename)
-            self._update_generate_button_state()
+            self._set_project_source(file_path)
+
+    def _select_project_dir(self):
+        """Seleciona uma pasta de projeto, lida diretamente sem compactar"""
+        dir_path = filedialog.askdirectory(
+            title="Selecionar pasta do projeto",
+            initialdir=str(Path.home()),
+            mustexist=True
+        )
+
+        if dir_path:
+            self._set_project_source(dir_path)
+
+    def _set_project_source(self, path: str):
+        self.zip_file_path = path
+        name = os.path.basename(os.path.normpath(path))
+        label = f"{name}{os.sep}" if os.path.isdir(path) else name
+        self.file_path_var.set(label)
+        self.console.append_step(source_label(path), "success", label)
+        self._update_generate_button_state()
 
     def _configure_api_key(self):
         """Configura a API Key do Gemini"""
@@ -582,70 +819,210 @@ class ReadmeGeneratorApp(ctk.CTk):
 
     def _generate_readme(self):
         """Inicia a geração do README"""
-        if not self._can_generate():
+        if self._current_job is not None or not self._can_generate():
             return
         
         # Configurar interface para geração
         self.generate_btn.configure(state="disabled", text="Gerando...")
+        self.cancel_btn.configure(state="normal", text="Cancelar")
         self.progress_frame.grid()
         self.progress_bar.set(0)
         self.progress_label.configure(text="Preparando...")
         
         # Obter configurações
         config = self._get_generation_config()
+        config["token_budget"] = self.gemini_client.get_prompt_token_budget()
         
-        # Iniciar geração em thread separada
+        # Extração na lane de CPU; a chamada à IA segue depois na lane de rede
         self.console.append_step("Geração", "progress", "Iniciando...")
-        thread = threading.Thread(
-            target=self._generate_readme_worker,
-            args=(self.zip_file_path, config),
-            daemon=True
+        job = GenerationJob(self.zip_file_path, config)
+        self._current_job = job
+        # Extração ocupa 10-40% da barra, medida pelos bytes lidos
+        self.progress_channel.start_phase("Extraindo dados do projeto", 10, 40)
+        self.executor.submit(
+            LANE_CPU,
+            self._extract_job_data,
+            job,
+            self._append_step_from_worker,
+            self.progress_channel.update_bytes,
+            on_done=lambda future: self._on_job_data_extracted(job, future),
         )
-        thread.start()
-        self._active_threads.append(thread)
 
-    def _generate_readme_worker(self, zip_path: str, config: Dict):
-        """Worker thread para gerar README"""
-        try:
-            # Atualizar progress
-            self.after(0, lambda: self._update_progress("Extraindo dados do projeto", 10))
-            
-            # Extrair dados
-            project_data = extract_project_data_from_zip(zip_path, config)
-            
-            # Montar prompt
-            self.after(0, lambda: self._update_progress("Preparando prompt para IA", 40))
-            prompt = build_prompt(project_data, config)
-            
-            # Gerar com IA
-            self.after(0, lambda: self._update_progress("Consultando Gemini AI", 70))
-            if not self.gemini_client:
-                raise Exception("Cliente Gemini não está disponível")
-            
-            response = self.gemini_client.send_conversational_prompt(prompt)
-            
-            # Processar resposta
-            self.after(0, lambda: self._update_progress("Finalizando", 95))
-            readme = clean_readme_content(response or "")
-            
-            # Sucesso
-            self.after(0, lambda: self._generation_success(readme))
-            
-        except QuotaExceededException as error:
-            self.after(0, lambda err=error: self._generation_quota_error(err))
-        except Exception as error:
-            self.after(0, lambda err=error: self._generation_error(str(err)))
+    def _extract_job_data(
+        self,
+        job: GenerationJob,
+        step_cb: Callable[[str, str, str], None],
+        bytes_cb: Optional[Callable[[int, int], None]] = None,
+        output_dir: Optional[str] = None,
+    ) -> str:
+        """Etapa de CPU: extrai os dados do projeto do job"""
+        # Incremental se houver manifesto no destino (fila) ou ao lado do último README salvo
+        manifest_dir = output_dir or self._last_output_dir or os.path.dirname(job.source_path)
+        return extract_project_data_from_zip(
+            job.source_path,
+            job.config,
+            step_cb=step_cb,
+            cache=self.extraction_cache,
+            section_cache=self.section_cache,
+            previous_manifest=load_manifest(manifest_path_for(job.source_path, manifest_dir)),
+            bytes_cb=bytes_cb,
+            cancel_token=job.cancel_token,
+        )
+
+    def _on_job_data_extracted(self, job: GenerationJob, future: Future):
+        """Na thread da UI: encaminha os dados extraídos para a lane de rede"""
+        error = future.exception()
+        if error is not None:
+            self._on_job_failed(job, error)
+            return
+        if job.cancelled:
+            self._generation_cancelled(job)
+            return
+        self.executor.submit(
+            LANE_NETWORK,
+            self._request_job_readme,
+            job,
+            future.result(),
+            on_done=lambda done: self._on_job_finished(job, done),
+        )
+
+    def _request_job_readme(self, job: GenerationJob, project_data: str) -> str:
+        """Etapa de rede: monta o prompt e consulta o Gemini"""
+        # Montar prompt
+        self.progress_channel.set("Preparando prompt para IA", 40)
+        prompt = self._build_job_prompt(job, project_data, self._append_step_from_worker)
+        
+        # Gerar com IA
+        self.progress_channel.set("Consultando Gemini AI", 70)
+        
+        response = self._stream_response_to_preview(prompt, job.config, job.cancel_token)
+        self._report_response_source(self._append_step_from_worker)
+        
+        # Processar resposta
+        self.progress_channel.set("Finalizando", 95)
+        return clean_readme_content(response or "")
+
+    def _build_job_prompt(
+        self, job: GenerationJob, project_data: str, step_cb: Callable[[str, str, str], None]
+    ) -> str:
+        if not self.gemini_client:
+            raise Exception("Cliente Gemini não está disponível")
+        return build_generation_prompt(
+            project_data,
+            job.config,
+            self.gemini_client,
+            self.summary_cache,
+            step_cb,
+            job.cancel_token,
+        )
+
+    def _report_response_source(self, step_cb: Callable[[str, str, str], None]):
+        """Registra de onde veio a última resposta desta thread: cache, modelo e espera"""
+        if self.gemini_client.last_response_cached:
+            step_cb("Cache", "success", "Resposta reutilizada sem chamar a IA")
+            return
+        served_by = self.gemini_client.last_served_model
+        if served_by and served_by != self.model_name:
+            step_cb("Failover", "warning", f"Resposta gerada por {served_by}")
+        else:
+            step_cb("Modelo", "info", f"Resposta gerada por {served_by}")
+        waited = self.gemini_client.get_rate_limit_status()["last_wait_seconds"]
+        if waited > 0.05:
+            step_cb("Rate limit", "info", f"Aguardou {waited:.1f}s na fila")
+
+    def _on_job_finished(self, job: GenerationJob, future: Future):
+        """Na thread da UI: resultado final do job"""
+        error = future.exception()
+        if error is not None:
+            self._on_job_failed(job, error)
+            return
+        self._generation_success(future.result())
+
+    def _on_job_failed(self, job: GenerationJob, error: BaseException):
+        if isinstance(error, JobCancelledException):
+            self._generation_cancelled(job)
+        elif isinstance(error, QuotaExceededException):
+            self._generation_quota_error(error)
+        else:
+            self._generation_error(str(error))
+
+    def _stream_response_to_preview(self, prompt: str, config: Dict, cancel_token=None) -> str:
+        """Consome o streaming do Gemini, enviando deltas agrupados ao preview"""
+        self.after(0, self._begin_stream_preview)
+        started_at = time.perf_counter()
+        last_flush = started_at
+        received: list[str] = []
+        pending: list[str] = []
+
+        deltas = self.gemini_client.stream_conversational_prompt(
+            prompt, use_cache=bool(config.get("use_response_cache")), cancel_token=cancel_token
+        )
+        for delta in deltas:
+            if not received:
+                first_token = time.perf_counter() - started_at
+                self._append_step_from_worker("Gemini", "info", f"Primeiro token em {first_token:.1f}s")
+                self.progress_channel.set("Recebendo resposta da IA", 80)
+            received.append(delta)
+            pending.append(delta)
+
+            now = time.perf_counter()
+            if now - last_flush >= STREAM_PREVIEW_INTERVAL:
+                batch = "".join(pending)
+                pending.clear()
+                last_flush = now
+                self.after(0, lambda text=batch: self._append_stream_preview(text))
+
+        if pending:
+            batch = "".join(pending)
+            self.after(0, lambda text=batch: self._append_stream_preview(text))
+        return "".join(received)
+
+    def _begin_stream_preview(self):
+        """Limpa o preview para receber a resposta em streaming"""
+        self.readme_preview.set_content("")
+        self.tabview.set(PREVIEW_TAB)
+
+    def _append_stream_preview(self, text: str):
+        """Acrescenta um lote de texto recebido ao preview"""
+        self.readme_preview.insert("end", text)
+        self.readme_preview.see("end")
 
-    def _update_progress(self, message: str, value: int):
-        """Atualiza a barra de progresso"""
+    def _append_step_from_worker(self, step_name: str, status: str, details: str = ""):
+        """Encaminha eventos de threads de trabalho para a fila do console"""
+        self.console.append_step(step_name, status, details)
+
+    def _update_progress(self, message: str, value: float, eta_seconds: Optional[float] = None):
+        """Atualiza a barra de progresso (chamado pelo ``progress_channel``)"""
+        if eta_seconds is not None:
+            message = f"{message} ({value:.0f}%, ~{eta_seconds:.0f}s restantes)"
         self.progress_label.configure(text=message)
         self.progress_bar.set(value / 100)
-        self.update_idletasks()
+
+    def _cancel_generation(self):
+        """Pede o cancelamento do job atual; o worker para no próximo ponto de verificação"""
+        if self._current_job is None or self._current_job.cancelled:
+            return
+        self._current_job.cancel()
+        self.cancel_btn.configure(state="disabled", text="Cancelando...")
+        self.progress_label.configure(text="Cancelando...")
+        self.console.append_step("Geração", "warning", "Cancelamento solicitado")
+
+    def _finish_generation_ui(self):
+        """Restaura os controles ao fim de um job (sucesso, erro ou cancelamento)"""
+        if self._current_job is not None:
+            self._current_job.release()
+            self._current_job = None
+        self.progress_frame.grid_remove()
+        self._update_generate_button_state()
+
+    def _generation_cancelled(self, job: GenerationJob):
+        """Callback para job cancelado"""
+        self._finish_generation_ui()
+        self.console.append_step("Geração", "warning", f"Cancelada após {job.elapsed:.1f}s")
 
     def _generation_success(self, readme_text: str):
         """Callback para geração bem-sucedida"""
-        self.progress_frame.grid_remove()
-        self.generate_btn.configure(state="normal", text="Gerar README")
+        self._finish_generation_ui()
         
         if not readme_text:
             self.console.append_step("README", "error", "IA retornou conteúdo vazio")
@@ -655,21 +1032,19 @@ class ReadmeGeneratorApp(ctk.CTk):
         self.generated_readme = readme_text
         self.readme_preview.set_content(readme_text)
         self.save_readme_btn.configure(state="normal")
-        self.tabview.set("README Gerado")
+        self.tabview.set(PREVIEW_TAB)
         self.console.append_step("README", "success", "Gerado com sucesso")
 
     def _generation_quota_error(self, error: QuotaExceededException):
         """Callback para erro de quota"""
-        self.progress_frame.grid_remove()
-        self.generate_btn.configure(state="normal", text="Gerar README")
+        self._finish_generation_ui()
         self.console.append_step("Quota", "error", f"Limite excedido: {error.model_name}")
         
         QuotaExceededDialog(self, error.model_name, self._configure_model)
 
     def _generation_error(self, error_msg: str):
         """Callback para erro geral"""
-        self.progress_frame.grid_remove()
-        self.generate_btn.configure(state="normal", text="Gerar README")
+        self._finish_generation_ui()
         self.console.append_step("Erro", "error", "Falha na geração")
         messagebox.showerror("Erro na Geração", f"Erro ao gerar README:\n\n{error_msg}")
 
@@ -681,7 +1056,7 @@ class ReadmeGeneratorApp(ctk.CTk):
         
         default_name = "README.md"
         if self.zip_file_path:
-            base_name = os.path.splitext(os.path.basename(self.zip_file_path))[0]
+            base_name = source_stem(self.zip_file_path)
             default_name = f"{base_name}_README.md"
         
         file_path = filedialog.asksaveasfilename(
@@ -695,6 +1070,14 @@ class ReadmeGeneratorApp(ctk.CTk):
             try:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(self.generated_readme)
+                if self.zip_file_path and os.path.exists(self.zip_file_path):
+                    # Manifesto (membro -> CRC32, tamanho) ao lado do README, para regenerações incrementais
+                    save_manifest(
+                        manifest_path_for(self.zip_file_path, os.path.dirname(file_path)),
+                        build_manifest(self.zip_file_path),
+                        os.path.basename(self.zip_file_path),
+                    )
+                self._last_output_dir = os.path.dirname(file_path)
                 messagebox.showinfo("Sucesso", f"README salvo em:\n{file_path}")
                 self.console.append_step("Arquivo", "success", f"Salvo: {os.path.basename(file_path)}")
             except Exception as e:
@@ -707,76 +1090,344 @@ class ReadmeGeneratorApp(ctk.CTk):
             messagebox.showwarning("Aviso", "Nenhum README foi gerado ainda.")
             return
         
+        self._copy_text(self.generated_readme)
+
+    def _copy_text(self, text: str):
         self.clipboard_clear()
-        self.clipboard_append(self.generated_readme)
+        self.clipboard_append(text)
         messagebox.showinfo("Copiado", "README copiado para a área de transferência!")
         self.console.append_step("Clipboard", "success", "README copiado")
 
+    # Fila de geração
+    def _add_archives_to_queue(self):
+        """Adiciona vários projetos compactados à fila"""
+        file_paths = filedialog.askopenfilenames(
+            title="Adicionar projetos à fila",
+            initialdir=str(Path.home()),
+            filetypes=PROJECT_FILE_TYPES
+        )
+        for file_path in file_paths:
+            self._enqueue_source(file_path)
+        if file_paths:
+            self.tabview.set(QUEUE_TAB)
+
+    def _add_dir_to_queue(self):
+        """Adiciona uma pasta de projeto à fila"""
+        dir_path = filedialog.askdirectory(
+            title="Adicionar pasta de projeto à fila",
+            initialdir=str(Path.home()),
+            mustexist=True
+        )
+        if dir_path:
+            self._enqueue_source(dir_path)
+
+    def _enqueue_source(self, path: str):
+        entry = self.generation_queue.add(path)
+        if entry is None:
+            self.console.append_step("Fila", "warning", f"Já está na fila: {os.path.basename(path)}")
+            return
+        self._add_queue_row(entry)
+        # Com a fila rodando, o novo projeto entra assim que houver vaga
+        self._pump_queue()
+        self._refresh_queue_summary()
+
+    def _select_queue_output_dir(self):
+        """Escolhe onde a fila salva os READMEs (padrão: pasta de cada projeto)"""
+        dir_path = filedialog.askdirectory(
+            title="Pasta de saída da fila",
+            initialdir=self.queue_output_dir or str(Path.home())
+        )
+        if dir_path:
+            self.queue_output_dir = dir_path
+            self.queue_output_var.set(f"Saída: {dir_path}")
+
+    def _queue_output_dir_for(self, entry: QueueEntry) -> str:
+        return self.queue_output_dir or os.path.dirname(os.path.abspath(entry.source_path))
+
+    def _start_queue(self):
+        """Inicia a fila com a configuração atual, limitada pelo RPM do modelo"""
+        if not (self._api_key_validated and self.gemini_client is not None):
+            messagebox.showwarning("Fila", "Configure uma API Key válida antes de iniciar a fila.")
+            return
+        queued = self.generation_queue.counts()[QUEUE_QUEUED]
+        if not queued:
+            messagebox.showinfo("Fila", "Adicione projetos à fila primeiro.")
+            return
+        
+        config = self._get_generation_config()
+        config["token_budget"] = self.gemini_client.get_prompt_token_budget()
+        self._queue_config = config
+        self.generation_queue.max_concurrent = queue_concurrency(self.model_name)
+        self.console.append_step(
+            "Fila", "progress",
+            f"{queued} projeto(s), até {self.generation_queue.max_concurrent} em paralelo"
+        )
+        self._pump_queue()
+
+    def _pump_queue(self):
+        """Inicia as entradas que cabem no limite; encerra a fila quando nada mais roda"""
+        if self._queue_config is None:
+            return
+        for entry in self.generation_queue.start_ready(
+            lambda ready: GenerationJob(ready.source_path, dict(self._queue_config))
+        ):
+            self._refresh_queue_row(entry)
+            self.executor.submit(
+                LANE_CPU,
+                self._extract_job_data,
+                entry.job,
+                self._queue_step_cb(entry),
+                None,
+                self._queue_output_dir_for(entry),
+                on_done=lambda future, entry=entry: self._on_queue_entry_extracted(entry, future),
+            )
+        if self.generation_queue.is_idle:
+            self._queue_config = None
+            self.console.append_step("Fila", "success", self.generation_queue.summary())
+        self._refresh_queue_summary()
+
+    def _queue_step_cb(self, entry: QueueEntry) -> Callable[[str, str, str], None]:
+        """Eventos do console prefixados com o projeto, já que vários rodam juntos"""
+        def step_cb(step_name: str, status: str, details: str = ""):
+            self._append_step_from_worker(f"[{entry.name}] {step_name}", status, details)
+        return step_cb
+
+    def _on_queue_entry_extracted(self, entry: QueueEntry, future: Future):
+        """Na thread da UI: encaminha a entrada extraída para a lane de rede"""
+        error = future.exception()
+        if error is None and entry.job.cancelled:
+            error = JobCancelledException()
+        if error is not None:
+            self._on_queue_entry_failed(entry, error)
+            return
+        self.executor.submit(
+            LANE_NETWORK,
+            self._generate_queue_readme,
+            entry.job,
+            future.result(),
+            self._queue_step_cb(entry),
+            self._queue_output_dir_for(entry),
+            on_done=lambda done: self._on_queue_entry_finished(entry, done),
+        )
+
+    def _generate_queue_readme(
+        self,
+        job: GenerationJob,
+        project_data: str,
+        step_cb: Callable[[str, str, str], None],
+        output_dir: str,
+    ) -> Tuple[str, str]:
+        """Etapa de rede da fila: gera sem streaming e salva o README e o manifesto"""
+        prompt = self._build_job_prompt(job, project_data, step_cb)
+        response = self.gemini_client.send_conversational_prompt(
+            prompt,
+            use_cache=bool(job.config.get("use_response_cache")),
+            cancel_token=job.cancel_token,
+        )
+        self._report_response_source(step_cb)
+        readme = clean_readme_content(response or "")
+        if not readme:
+            raise ValueError("A IA não retornou conteúdo.")
+        return readme, save_generated_readme(job.source_path, readme, output_dir)
+
+    def _on_queue_entry_finished(self, entry: QueueEntry, future: Future):
+        """Na thread da UI: abre a aba do resultado e libera a vaga"""
+        error = future.exception()
+        if error is not None:
+            self._on_queue_entry_failed(entry, error)
+            return
+        readme, output_path = future.result()
+        self.generation_queue.finish(entry, QUEUE_DONE, output_path=output_path)
+        self._add_result_tab(entry, readme)
+        self.console.append_step("Fila", "success", f"{entry.name} -> {os.path.basename(output_path)}")
+        self._refresh_queue_row(entry)
+        self._pump_queue()
+
+    def _on_queue_entry_failed(self, entry: QueueEntry, error: BaseException):
+        if isinstance(error, JobCancelledException):
+            self.generation_queue.finish(entry, QUEUE_CANCELLED)
+            self.console.append_step("Fila", "warning", f"{entry.name}: cancelado")
+        else:
+            # Sem diálogo por projeto: numa fila grande seriam dezenas de janelas
+            message = (
+                f"Quota excedida: {error.model_name}"
+                if isinstance(error, QuotaExceededException) else str(error)
+            )
+            self.generation_queue.finish(entry, QUEUE_FAILED, error=message)
+            self.console.append_step("Fila", "error", f"{entry.name}: {message}")
+        self._refresh_queue_row(entry)
+        self._pump_queue()
+
+    def _cancel_queue(self):
+        """Cancela as entradas na fila e sinaliza as em execução"""
+        for entry in self.generation_queue.cancel_all():
+            self._refresh_queue_row(entry)
+        self.cancel_queue_btn.configure(state="disabled")
+        self.console.append_step("Fila", "warning", "Cancelamento solicitado")
+        self._pump_queue()
+
+    def _clear_finished_queue(self):
+        """Remove da lista as entradas finalizadas (as abas de resultado ficam)"""
+        for entry in self.generation_queue.clear_finished():
+            row = self._queue_rows.pop(entry.entry_id, None)
+            if row is not None:
+                row[0].destroy()
+        self._refresh_queue_summary()
+
+    def _add_queue_row(self, entry: QueueEntry):
+        row = ctk.CTkFrame(self.queue_list, fg_color="transparent")
+        row.pack(fill="x", pady=2)
+        row.grid_columnconfigure(0, weight=1)
+        
+        ctk.CTkLabel(
+            row,
+            text=entry.name,
+            font=ctk.CTkFont(size=12),
+            anchor="w"
+        ).grid(row=0, column=0, sticky="w", padx=(5, 10))
+        
+        status_label = ctk.CTkLabel(
+            row,
+            text=entry.status_label,
+            font=ctk.CTkFont(size=11),
+            text_color=theme_manager.get_color("text_secondary"),
+            anchor="e"
+        )
+        status_label.grid(row=0, column=1, sticky="e")
+        
+        view_btn = ModernButton(
+            row,
+            text="Ver",
+            command=lambda: self._show_queue_result(entry),
+            width=50,
+            height=26
+        )
+        view_btn.grid(row=0, column=2, padx=(10, 5))
+        view_btn.configure(state="disabled")
+        
+        self._queue_rows[entry.entry_id] = (row, status_label, view_btn)
+
+    def _refresh_queue_row(self, entry: QueueEntry):
+        row = self._queue_rows.get(entry.entry_id)
+        if row is None:
+            return
+        _, status_label, view_btn = row
+        text = entry.status_label
+        if entry.status == QUEUE_DONE:
+            text = f"{text} em {entry.elapsed:.1f}s"
+        elif entry.status == QUEUE_FAILED and entry.error:
+            text = f"{text}: {entry.error[:60]}"
+        status_label.configure(
+            text=text,
+            text_color=theme_manager.get_color(QUEUE_STATUS_COLORS.get(entry.status, "text_secondary"))
+        )
+        view_btn.configure(state="normal" if entry.entry_id in self._result_tab_names else "disabled")
+
+    def _refresh_queue_summary(self):
+        if self.generation_queue.entries:
+            self.queue_summary_var.set(self.generation_queue.summary())
+        else:
+            self.queue_summary_var.set("Nenhum projeto na fila")
+        running = self._queue_config is not None
+        self.start_queue_btn.configure(state="disabled" if running else "normal")
+        self.cancel_queue_btn.configure(state="normal" if running else "disabled")
+
+    def _add_result_tab(self, entry: QueueEntry, readme: str):
+        """Abre uma aba de preview com o README gerado pela fila"""
+        taken = {PREVIEW_TAB, QUEUE_TAB, SETTINGS_TAB, *self._result_tab_names.values()}
+        base_name = source_stem(entry.source_path)
+        tab_name, counter = base_name, 1
+        while tab_name in taken:
+            counter += 1
+            tab_name = f"{base_name} ({counter})"
+        
+        tab = self.tabview.add(tab_name)
+        tab.grid_columnconfigure(0, weight=1)
+        tab.grid_rowconfigure(1, weight=1)
+        
+        toolbar = ctk.CTkFrame(tab, height=40)
+        toolbar.grid(row=0, column=0, sticky="ew", padx=5, pady=(5, 0))
+        toolbar.grid_columnconfigure(0, weight=1)
+        ctk.CTkLabel(
+            toolbar,
+            text=f"Salvo em: {entry.output_path}",
+            font=ctk.CTkFont(size=11),
+            text_color=theme_manager.get_color("text_secondary"),
+            anchor="w"
+        ).grid(row=0, column=0, sticky="w", padx=10, pady=8)
+        
+        preview = ModernTextWidget(tab, wrap="word")
+        preview.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        preview.set_content(readme)
+        
+        ModernButton(
+            toolbar,
+            text="Copiar",
+            command=lambda: self._copy_text(preview.get_content()),
+            width=80,
+            height=30
+        ).grid(row=0, column=1, sticky="e", padx=10)
+        
+        self._result_tab_names[entry.entry_id] = tab_name
+
+    def _show_queue_result(self, entry: QueueEntry):
+        tab_name = self._result_tab_names.get(entry.entry_id)
+        if tab_name is not None:
+            self.tabview.set(tab_name)
+
+    def _close_result_tabs(self):
+        """Fecha as abas de resultado da fila (os arquivos salvos permanecem)"""
+        for tab_name in self._result_tab_names.values():
+            self.tabview.delete(tab_name)
+        self._result_tab_names.clear()
+        for entry in self.generation_queue.entries:
+            self._refresh_queue_row(entry)
+        self.tabview.set(QUEUE_TAB)
+
     # Validation and state management
     def _validate_api_key_async(self):
         """Valida API Key em thread separada"""
         if not self.api_key:
             return
         
-        thread = threading.Thread(
-            target=self._validate_api_key_worker,
-            daemon=True
+        self.executor.submit(
+            LANE_NETWORK,
+            self._validate_api_key_worker,
+            self.api_key,
+            on_done=self._on_api_key_validated,
         )
-        thread.start()
-        self._active_threads.append(thread)
 
-    def _validate_api_key_worker(self):
-        """Worker para validar API Key"""
-        try:
-            genai.configure(api_key=self.api_key)
-            
-            # Carregar modelos disponíveis
-            models_data = list(genai.list_models())
-            available_models = []
-            
-            for model in models_data:
-                if hasattr(model, 'name'):
-                    model_name = model.name
-                    display_name = model_name.replace('models/', '') if model_name.startswith('models/') else model_name
-                    if hasattr(model, 'supported_generation_methods'):
-                        if 'generateContent' in model.supported_generation_methods:
-                            available_models.append(display_name)
-                    else:
-                        available_models.append(display_name)
-            
-            if not available_models:
-                self.after(0, lambda: self._api_validation_failed("Nenhum modelo disponível"))
-                return
-            
-            # Testar conexão
-            test_model = None
-            preferred_models = ['gemini-1.5-flash', 'gemini-1.0-pro', 'gemini-1.5-pro']
-            for preferred in preferred_models:
-                if preferred in available_models:
-                    test_model = f'models/{preferred}'
-                    break
-            
-            if not test_model and available_models:
-                test_model = f'models/{available_models[0]}'
-            
-            if test_model:
-                model = genai.GenerativeModel(test_model)
-                model.generate_content(
-                    "Test",
-                    generation_config=genai.types.GenerationConfig(max_output_tokens=5)
-                )
-            
-            # Sucesso
-            self.after(0, lambda: self._api_validation_success(available_models))
-            
-        except Exception as e:
-            error_msg = str(e)
+    def _validate_api_key_worker(self, api_key: str) -> tuple[list[str], bool]:
+        """Worker para validar API Key (apenas listagem, sem chamada de geração)"""
+        last_validated_at = self.config_mgr.get_last_validated_at(api_key)
+        recently_validated = (
+            last_validated_at is not None
+            and time.time() - last_validated_at < API_VALIDATION_TTL_SECONDS
+        )
+        # Validação recente: o catálogo em cache basta; senão a listagem vai à rede
+        available_models = self.model_catalog.get_generation_model_names(
+            api_key, force_refresh=not recently_validated
+        )
+        return available_models, recently_validated
+
+    def _on_api_key_validated(self, future: Future):
+        """Na thread da UI: resultado da validação da API Key"""
+        error = future.exception()
+        if error is not None:
+            error_msg = str(error)
             if "quota" in error_msg.lower() or "429" in error_msg:
-                self.after(0, lambda: self._api_validation_quota_error())
+                self._api_validation_quota_error()
             else:
-                self.after(0, lambda: self._api_validation_failed(error_msg))
+                self._api_validation_failed(error_msg)
+            return
+        
+        available_models, recently_validated = future.result()
+        if not available_models:
+            self._api_validation_failed("Nenhum modelo disponível")
+            return
+        self._api_validation_success(available_models, recently_validated)
 
-    def _api_validation_success(self, models: list[str]):
+    def _api_validation_success(self, models: list[str], from_cache: bool = False):
         """Callback para validação bem-sucedida"""
         self._api_key_validated = True
         self._models_loaded = True
@@ -784,7 +1435,11 @@ class ReadmeGeneratorApp(ctk.CTk):
         
         self.api_status_var.set("IA Pronta")
         self.api_status_label.configure(text_color=theme_manager.get_color("success"))
-        self.console.append_step("API Key", "success", "Validada")
+        if from_cache:
+            self.console.append_step("API Key", "success", "Validada (registro recente)")
+        else:
+            self.config_mgr.set_last_validated_at(self.api_key)
+            self.console.append_step("API Key", "success", "Validada")
         self.console.append_step("Modelos", "success", f"{len(models)} modelos carregados")
         
         # Verificar modelo atual
@@ -795,6 +1450,35 @@ class ReadmeGeneratorApp(ctk.CTk):
         
         self._initialize_gemini_client()
 
+    def _test_connection(self):
+        """Teste completo sob demanda: faz uma chamada de geração real"""
+        if self.gemini_client is None:
+            messagebox.showwarning("IA não configurada", "Configure uma API Key e um modelo válidos primeiro.")
+            return
+        
+        self.test_connection_btn.configure(state="disabled", text="Testando...")
+        self.console.append_step("Conexão", "info", f"Testando {self.model_name}...")
+        self.executor.submit(
+            LANE_NETWORK,
+            self.gemini_client.test_connection,
+            on_done=lambda future: self._on_connection_tested(future.exception()),
+        )
+
+    def _on_connection_tested(self, error: Optional[Exception]):
+        """Callback do teste de conexão"""
+        self.test_connection_btn.configure(state="normal", text="Testar conexão")
+        if error is None:
+            self.config_mgr.set_last_validated_at(self.api_key)
+            self.console.append_step("Conexão", "success", f"{self.model_name} respondeu")
+            return
+        
+        if isinstance(error, QuotaExceededException):
+            self.console.append_step("Conexão", "warning", f"Quota excedida: {error.model_name}")
+            QuotaExceededDialog(self, error.model_name, self._configure_model)
+        else:
+            self.console.append_step("Conexão", "error", "Teste falhou")
+            messagebox.showerror("Teste de Conexão", f"O modelo não respondeu:\n{error}")
+
     def _api_validation_failed(self, error_msg: str):
         """Callback para falha na validação"""
         self._api_key_validated = False
@@ -836,7 +1520,12 @@ class ReadmeGeneratorApp(ctk.CTk):
             if not model_name.startswith('models/'):
                 model_name = f'models/{model_name}'
             
-            self.gemini_client = GeminiClient(self.api_key, model_name)
+            self.gemini_client = GeminiClient(
+                self.api_key,
+                model_name,
+                response_cache=self.response_cache,
+                model_catalog=self.model_catalog,
+            )
             self.console.append_step("Cliente IA", "success", f"Inicializado: {self.model_name}")
             self._update_generate_button_state()
             
@@ -863,6 +1552,9 @@ class ReadmeGeneratorApp(ctk.CTk):
 
     def _update_generate_button_state(self):
         """Atualiza estado do botão de geração"""
+        if self._current_job is not None:
+            # Job em andamento: o botão segue em "Gerando..." até _finish_generation_ui
+            return
         if self._can_generate():
             self.generate_btn.configure(state="normal", text="Gerar README")
         else:
@@ -873,9 +1565,11 @@ class ReadmeGeneratorApp(ctk.CTk):
         try:
             max_file_size = int(self.max_file_size.get() or "5")
             max_files = int(self.max_files.get() or "30")
+            extract_workers = int(self.extract_workers.get() or "1")
         except ValueError:
             max_file_size = 5
             max_files = 30
+            extract_workers = 1
         
         return {
             "custom_prompt_enabled": self.custom_prompt_enabled.get(),
@@ -883,12 +1577,16 @@ class ReadmeGeneratorApp(ctk.CTk):
             "include_tests": self.include_tests.get(),
             "include_docs": self.include_docs.get(), 
             "include_config": self.include_config.get(),
+            "respect_gitignore": self.respect_gitignore.get(),
             "max_file_size_kb": max_file_size,
             "max_files": max_files,
+            "extract_workers": extract_workers,
             "readme_style": self.readme_style.get().lower(),
             "include_badges": self.include_badges.get(),
             "include_toc": self.include_toc.get(),
             "include_examples": self.include_examples.get(),
+            "use_response_cache": self.use_response_cache.get(),
+            "map_reduce": self.map_reduce.get(),
         }
 
     def _load_initial_config(self):
@@ -903,10 +1601,12 @@ class ReadmeGeneratorApp(ctk.CTk):
 
     def _on_closing(self):
         """Cleanup ao fechar aplicação"""
-        # Aguardar threads ativas
-        for thread in self._active_threads:
-            if thread.is_alive():
-                thread.join(timeout=1)
+        if self._current_job is not None:
+            self._current_job.cancel()
+        self.generation_queue.cancel_all()
+        
+        # Cancela o que está na fila e dá um prazo curto às tarefas em execução
+        self.executor.shutdown(timeout=1.0)
         
         if self.gemini_client:
             try:
@@ -914,6 +1614,7 @@ class ReadmeGeneratorApp(ctk.CTk):
             except Exception:
                 logger.debug("Erro ao fechar cliente Gemini durante encerramento.", exc_info=True)
         
+        self.response_cache.close()
         self.destroy()
 
 
@@ -2,9 +2,10 @@
 """
 Widgets customizados para interface moderna com CustomTkinter
 """
+import queue
 import tkinter as tk
 from datetime import datetime
-from typing import Callable, List
+from typing import Callable, List, Tuple
 
 import customtkinter as ctk
 
@@ -137,10 +138,61 @@ class ModernTextWidget(ctk.CTkTextbox):
         return content
 
 
+# Intervalo do tick que descarrega a fila do console no textbox
+CONSOLE_FLUSH_INTERVAL_MS = 50
+# Linhas mantidas no console (as mais antigas são descartadas)
+CONSOLE_MAX_LINES = 2000
+
+CONSOLE_STATUS_SYMBOLS = {
+    "info": "[INFO]",
+    "success": "[OK]",
+    "warning": "[ATEN]",
+    "error": "[ERRO]",
+    "progress": "[PROC]"
+}
+
+
+def format_console_line(step_name: str, status: str = "info", details: str = "") -> str:
+    """Linha do console com horário do evento (não do momento em que é exibida)"""
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    symbol = CONSOLE_STATUS_SYMBOLS.get(status, "[INFO]")
+    message = f"[{timestamp}] {symbol} {step_name}"
+    if details:
+        message += f" - {details}"
+    return message
+
+
+class ConsoleLineQueue:
+    """Fila thread-safe de linhas do console, drenada em lotes pela thread da UI"""
+
+    def __init__(self, max_lines: int = CONSOLE_MAX_LINES):
+        self.max_lines = max_lines
+        self._queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+
+    def put(self, line: str):
+        self._queue.put(line)
+
+    def drain(self) -> Tuple[List[str], int]:
+        """Retorna as linhas pendentes (no máximo ``max_lines``) e quantas foram descartadas"""
+        lines: List[str] = []
+        while True:
+            try:
+                lines.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        dropped = max(0, len(lines) - self.max_lines)
+        return lines[dropped:], dropped
+
+
 class ConsoleWidget(ctk.CTkTextbox):
-    """Console de log compacto e moderno"""
+    """Console de log compacto e moderno.
+
+    ``append_step`` pode ser chamado de qualquer thread: as linhas entram numa
+    fila e um tick fixo de ``after()`` as insere de uma vez, mantendo no máximo
+    ``max_lines`` linhas no textbox.
+    """
     
-    def __init__(self, parent, **kwargs):
+    def __init__(self, parent, max_lines: int = CONSOLE_MAX_LINES, **kwargs):
         defaults = {
             "corner_radius": 6,
             "border_width": 1,
@@ -158,35 +210,47 @@ class ConsoleWidget(ctk.CTkTextbox):
         super().__init__(parent, **defaults)
         
         self.configure(state="disabled")
+        self._lines = ConsoleLineQueue(max_lines)
+        self._line_count = 0
+        self._flush_job = self.after(CONSOLE_FLUSH_INTERVAL_MS, self._flush)
     
     def append_step(self, step_name: str, status: str = "info", details: str = ""):
-        """Adiciona um step ao console"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        
-        status_symbols = {
-            "info": "[INFO]",
-            "success": "[OK]",
-            "warning": "[ATEN]",
-            "error": "[ERRO]",
-            "progress": "[PROC]"
-        }
-        
-        symbol = status_symbols.get(status, "[INFO]")
-        message = f"[{timestamp}] {symbol} {step_name}"
-        if details:
-            message += f" - {details}"
-        
-        self.configure(state="normal")
-        self.insert("end", message + "\n")
-        self.configure(state="disabled")
-        self.see("end")
+        """Adiciona um step ao console (seguro a partir de qualquer thread)"""
+        self._lines.put(format_console_line(step_name, status, details))
+
+    def _flush(self):
+        """Insere as linhas acumuladas numa única operação e reagenda o tick"""
+        try:
+            lines, dropped = self._lines.drain()
+            if lines:
+                if dropped:
+                    lines.insert(0, format_console_line("Console", "warning", f"{dropped} linhas omitidas"))
+                self.configure(state="normal")
+                self.insert("end", "\n".join(lines) + "\n")
+                self._line_count += len(lines)
+                excess = self._line_count - self._lines.max_lines
+                if excess > 0:
+                    self.delete("1.0", f"{excess + 1}.0")
+                    self._line_count -= excess
+                self.configure(state="disabled")
+                self.see("end")
+        finally:
+            self._flush_job = self.after(CONSOLE_FLUSH_INTERVAL_MS, self._flush)
     
     def clear(self):
         """Limpa o console"""
+        self._lines.drain()
+        self._line_count = 0
         self.configure(state="normal")
         self.delete("1.0", "end")
         self.configure(state="disabled")
 
+    def destroy(self):
+        if self._flush_job is not None:
+            self.after_cancel(self._flush_job)
+            self._flush_job = None
+        super().destroy()
+
 
 class APIKeyDialog:
     """Diálogo para configuração da API Key"""
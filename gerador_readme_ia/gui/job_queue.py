@@ -0,0 +1,171 @@
+# gerador_readme_ia/gui/job_queue.py
+"""Fila de geração da GUI: vários projetos, poucos jobs simultâneos.
+
+A fila só é manipulada na thread da UI (os callbacks do ``TaskExecutor``
+chegam via ``after()``), por isso não usa locks. A concorrência acompanha o
+RPM do modelo: além disso, os jobs só ficariam parados na fila do limitador de
+taxa segurando os dados extraídos em memória.
+"""
+import itertools
+import logging
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+from ..constants import APP_NAME
+from ..ia_client.rate_limiter import get_model_limits
+from ..utils.file_helper import get_readme_output_filename
+from ..utils.manifest import build_manifest, manifest_path_for, save_manifest
+from .jobs import GenerationJob
+
+logger = logging.getLogger(f"{APP_NAME}.job_queue")
+
+QUEUE_QUEUED = "queued"
+QUEUE_RUNNING = "running"
+QUEUE_DONE = "done"
+QUEUE_FAILED = "failed"
+QUEUE_CANCELLED = "cancelled"
+
+QUEUE_STATUS_LABELS: Dict[str, str] = {
+    QUEUE_QUEUED: "Na fila",
+    QUEUE_RUNNING: "Gerando...",
+    QUEUE_DONE: "Concluído",
+    QUEUE_FAILED: "Falhou",
+    QUEUE_CANCELLED: "Cancelado",
+}
+FINISHED_STATUSES = frozenset({QUEUE_DONE, QUEUE_FAILED, QUEUE_CANCELLED})
+
+MAX_QUEUE_CONCURRENCY = 4
+# Requisições por job usadas para dimensionar a concorrência (geração + folga
+# para resumos do map-reduce e novas tentativas)
+REQUESTS_PER_JOB = 2
+
+_entry_ids = itertools.count(1)
+# Escolha do nome livre e gravação precisam ser atômicas entre jobs paralelos
+_save_lock = threading.Lock()
+
+
+def queue_concurrency(model_name: str, limit: int = MAX_QUEUE_CONCURRENCY) -> int:
+    """Jobs simultâneos que o RPM do modelo comporta, entre 1 e ``limit``."""
+    requests_per_minute, _ = get_model_limits(model_name)
+    return max(1, min(limit, int(requests_per_minute // REQUESTS_PER_JOB)))
+
+
+def save_generated_readme(source_path: str, readme: str, output_dir: str) -> str:
+    """Grava o README com nome livre (``get_readme_output_filename``) e o manifesto ao lado."""
+    archive_name = os.path.basename(os.path.normpath(source_path))
+    manifest = build_manifest(source_path)
+    with _save_lock:
+        output_path = get_readme_output_filename(archive_name, output_dir)
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(readme)
+    save_manifest(manifest_path_for(source_path, output_dir), manifest, archive_name)
+    return output_path
+
+
+class QueueEntry:
+    """Um projeto na fila; ``job`` só existe enquanto a geração está em andamento."""
+
+    def __init__(self, source_path: str):
+        self.entry_id = next(_entry_ids)
+        self.source_path = source_path
+        self.status = QUEUE_QUEUED
+        self.job: Optional[GenerationJob] = None
+        self.output_path: Optional[str] = None
+        self.error: Optional[str] = None
+        self.elapsed = 0.0
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(os.path.normpath(self.source_path))
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    @property
+    def status_label(self) -> str:
+        return QUEUE_STATUS_LABELS[self.status]
+
+
+class GenerationQueue:
+    """Ordem FIFO com no máximo ``max_concurrent`` entradas em execução."""
+
+    def __init__(self, max_concurrent: int = 1):
+        self.max_concurrent = max(1, max_concurrent)
+        self.entries: List[QueueEntry] = []
+
+    def add(self, source_path: str) -> Optional[QueueEntry]:
+        """Enfileira o projeto; ``None`` se ele já estiver aguardando ou em execução."""
+        target = os.path.normcase(os.path.abspath(source_path))
+        for entry in self.entries:
+            if not entry.finished and os.path.normcase(os.path.abspath(entry.source_path)) == target:
+                return None
+        entry = QueueEntry(source_path)
+        self.entries.append(entry)
+        return entry
+
+    def start_ready(self, make_job: Callable[[QueueEntry], GenerationJob]) -> List[QueueEntry]:
+        """Marca como em execução as próximas entradas que cabem no limite."""
+        started: List[QueueEntry] = []
+        for entry in self.entries:
+            if self.running_count >= self.max_concurrent:
+                break
+            if entry.status == QUEUE_QUEUED:
+                entry.job = make_job(entry)
+                entry.status = QUEUE_RUNNING
+                started.append(entry)
+        return started
+
+    def finish(
+        self,
+        entry: QueueEntry,
+        status: str,
+        output_path: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        entry.status = status
+        entry.output_path = output_path
+        entry.error = error
+        if entry.job is not None:
+            entry.elapsed = entry.job.elapsed
+            entry.job.release()
+            entry.job = None
+
+    def cancel_all(self) -> List[QueueEntry]:
+        """Cancela as que aguardam e sinaliza as em execução; devolve as já finalizadas."""
+        cancelled: List[QueueEntry] = []
+        for entry in self.entries:
+            if entry.status == QUEUE_QUEUED:
+                self.finish(entry, QUEUE_CANCELLED)
+                cancelled.append(entry)
+            elif entry.job is not None:
+                entry.job.cancel()
+        return cancelled
+
+    def clear_finished(self) -> List[QueueEntry]:
+        removed = [entry for entry in self.entries if entry.finished]
+        self.entries = [entry for entry in self.entries if not entry.finished]
+        return removed
+
+    @property
+    def running_count(self) -> int:
+        return sum(1 for entry in self.entries if entry.status == QUEUE_RUNNING)
+
+    @property
+    def is_idle(self) -> bool:
+        return all(entry.status != QUEUE_RUNNING for entry in self.entries)
+
+    def counts(self) -> Dict[str, int]:
+        counts = dict.fromkeys(QUEUE_STATUS_LABELS, 0)
+        for entry in self.entries:
+            counts[entry.status] += 1
+        return counts
+
+    def summary(self) -> str:
+        counts = self.counts()
+        return (
+            f"{counts[QUEUE_DONE]}/{len(self.entries)} concluídos, "
+            f"{counts[QUEUE_RUNNING]} em execução, {counts[QUEUE_QUEUED]} na fila, "
+            f"{counts[QUEUE_FAILED]} com falha"
+        )
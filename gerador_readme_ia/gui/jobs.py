@@ -0,0 +1,39 @@
+# gerador_readme_ia/gui/jobs.py
+"""Jobs de geração da GUI: entrada, configuração e token de cancelamento.
+
+Não depende do Tk; a janela cria um :class:`GenerationJob` por geração e o
+worker consulta ``job.cancel_token`` em cada etapa.
+"""
+import itertools
+import time
+from typing import Dict
+
+from ..utils.cancellation import CancelToken
+
+_job_ids = itertools.count(1)
+
+
+class GenerationJob:
+    """Uma geração de README em andamento."""
+
+    def __init__(self, source_path: str, config: Dict[str, object]):
+        self.job_id = next(_job_ids)
+        self.source_path = source_path
+        self.config = config
+        self.cancel_token = CancelToken()
+        self.started_at = time.perf_counter()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_token.cancelled
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def cancel(self) -> None:
+        self.cancel_token.cancel()
+
+    def release(self) -> None:
+        """Solta a configuração (com o prompt customizado) ao fim do job."""
+        self.config = {}
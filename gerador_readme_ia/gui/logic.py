@@ -2,16 +2,56 @@
 """Funções de domínio separadas – mantêm app_gui enxuto."""
 from __future__ import annotations
 
+import codecs
+import io
+import itertools
 import os
+import re
+import tarfile
+import time
 import zipfile
-from typing import Callable, Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Callable, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
-from ..constants import PROMPTS
+from ..constants import CHARS_PER_TOKEN, PROMPTS
+from ..utils.cancellation import CancelToken, JobCancelledException
+from ..utils.extraction_cache import ExtractionCache
+from ..utils.ignore_rules import build_ignore_matcher, prune_members
+from ..utils.manifest import Manifest, diff_manifests, relative_member_path, section_cache_key
+from ..utils.path_filters import (
+    PathClassifier,
+    common_root,
+    excluded_categories,
+    format_skip_stats,
+)
+from ..utils.sources import ProjectSource, open_source, source_label
 
 PROMPT_README_GENERATION = PROMPTS["profissional"]  # fallback
 DEFAULT_MAX_FILES = 30
 DEFAULT_MAX_FILE_SIZE_KB = 5
 MAX_BINARY_NULL_THRESHOLD = 1
+# Fração de bytes de controle (fora \t \n \r \f \b ESC) a partir da qual a amostra é binária
+MAX_BINARY_CONTROL_RATIO = 0.3
+# Primeira leitura de cada membro: só o suficiente para decidir se é texto
+BINARY_SNIFF_SIZE = 4 * 1024
+# Membros comprimidos que encolhem menos que isso já eram comprimidos (imagens, arquivos…)
+INCOMPRESSIBLE_RATIO = 0.95
+MIN_RATIO_CHECK_SIZE = 4 * 1024
+DEFAULT_EXTRACT_WORKERS = 1
+PARALLEL_SLICE_SIZE = 8
+STREAM_CHUNK_SIZE = 64 * 1024
+MIN_TRUNCATED_SECTION_TOKENS = 64
+PACKING_TRUNCATED_MARKER = "\n…[TRUNCADO PARA CABER NO CONTEXTO]"
+PACKING_OMITTED_NOTE = "\n\n…[{count} arquivo(s) omitido(s) por limite de contexto]"
+
+# Divide os dados extraídos antes de cada cabeçalho "--- arquivo ---"
+_SECTION_BOUNDARY_RE = re.compile(r"\n(?=--- [^\n]+ ---\n)")
+
+# (nome do membro, trecho de texto) produzido pela extração em streaming
+ProjectRecord = Tuple[str, str]
+# Uso interno: registro mais os bytes do membro lidos para produzi-lo (progresso)
+_MemberRecord = Tuple[str, str, int]
 
 
 def _is_safe_member_path(member_name: str) -> bool:
@@ -19,17 +59,212 @@ def _is_safe_member_path(member_name: str) -> bool:
     return not (normalized.startswith("/") or ".." in normalized.split("/"))
 
 
+# Extensões sempre binárias: decididas sem descompactar nada
+BINARY_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".icns", ".webp", ".tif", ".tiff",
+    ".psd", ".xcf", ".heic", ".avif",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot",
+    ".zip", ".gz", ".tgz", ".bz2", ".xz", ".zst", ".7z", ".rar", ".tar", ".jar", ".war",
+    ".whl", ".egg", ".apk", ".aab", ".ipa", ".dmg", ".iso", ".deb", ".rpm", ".msi",
+    ".exe", ".dll", ".so", ".dylib", ".o", ".obj", ".a", ".lib", ".bin", ".class",
+    ".pyc", ".pyo", ".pyd", ".wasm",
+    ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx", ".odt", ".ods",
+    ".mp3", ".wav", ".ogg", ".flac", ".aac", ".m4a", ".mp4", ".m4v", ".mov", ".avi",
+    ".mkv", ".webm",
+    ".db", ".sqlite", ".sqlite3", ".mdb", ".npy", ".npz", ".pkl", ".pickle", ".h5",
+    ".hdf5", ".parquet", ".onnx", ".pt", ".pth", ".ckpt", ".safetensors", ".tflite",
+})
+
+_TEXT_CONTROL_BYTES = frozenset(b"\t\n\r\f\b\x1b")
+_BINARY_CONTROL_TABLE = bytes(
+    0 if byte >= 0x20 or byte in _TEXT_CONTROL_BYTES else 1 for byte in range(256)
+)
+
+
+def is_binary_member(info: zipfile.ZipInfo) -> bool:
+    """Decide só pelos metadados: extensão conhecida ou conteúdo incompressível.
+
+    ``False`` significa apenas "indeciso": o conteúdo ainda passa pela amostra
+    de :func:`_is_probably_binary`.
+    """
+    name = info.filename.replace("\\", "/").rsplit("/", 1)[-1].lower()
+    if os.path.splitext(name)[1] in BINARY_EXTENSIONS:
+        return True
+    # Pastas, tarballs e membros ZIP_STORED não dizem nada pela razão de compressão
+    if getattr(info, "compress_type", zipfile.ZIP_STORED) == zipfile.ZIP_STORED:
+        return False
+    if info.file_size < MIN_RATIO_CHECK_SIZE:
+        return False
+    return info.compress_size >= info.file_size * INCOMPRESSIBLE_RATIO
+
+
 def _is_probably_binary(content: bytes) -> bool:
     if not content:
         return False
-    return content.count(b"\x00") >= MAX_BINARY_NULL_THRESHOLD
+    if content.count(b"\x00") >= MAX_BINARY_NULL_THRESHOLD:
+        return True
+    # translate() marca bytes de controle com 1; a soma é feita em C
+    controls = sum(content.translate(_BINARY_CONTROL_TABLE))
+    return controls > len(content) * MAX_BINARY_CONTROL_RATIO
+
+# ------------------------------------------------------------------
+# SELEÇÃO DE ARQUIVOS ----------------------------------------------
+# ------------------------------------------------------------------
+
+# Nomes de arquivo (minúsculos) que mais descrevem um projeto
+KEY_FILE_SCORES: Dict[str, float] = {
+    "pyproject.toml": 80, "setup.py": 75, "setup.cfg": 70, "requirements.txt": 65,
+    "package.json": 80, "cargo.toml": 80, "go.mod": 80, "pom.xml": 75,
+    "build.gradle": 75, "build.gradle.kts": 75, "composer.json": 75, "gemfile": 70,
+    "dockerfile": 60, "docker-compose.yml": 55, "docker-compose.yaml": 55,
+    "compose.yml": 55, "compose.yaml": 55, "makefile": 50,
+    "main.py": 50, "__main__.py": 50, "app.py": 45, "cli.py": 45, "manage.py": 45,
+    "run.py": 40, "run_app.py": 40, "wsgi.py": 35, "asgi.py": 35,
+    "index.js": 45, "index.ts": 45, "main.js": 45, "main.ts": 45, "server.js": 40,
+    "main.go": 50, "main.rs": 50, "lib.rs": 45, "program.cs": 45,
+    "__init__.py": 30, "license": 15, "license.md": 15, "license.txt": 15,
+}
+
+# Prefixos de nome com peso próprio (README.md, README.rst, readme_pt.md…)
+KEY_PREFIX_SCORES: Tuple[Tuple[str, float], ...] = (("readme", 100), ("changelog", 10))
+
+EXTENSION_SCORES: Dict[str, float] = {
+    ".py": 20, ".js": 18, ".ts": 18, ".tsx": 16, ".jsx": 16, ".go": 20, ".rs": 20,
+    ".java": 18, ".kt": 18, ".cs": 18, ".rb": 18, ".php": 18, ".c": 15, ".cpp": 15,
+    ".h": 10, ".swift": 18, ".scala": 15, ".sh": 8,
+    ".toml": 10, ".cfg": 10, ".ini": 8, ".yml": 8, ".yaml": 8, ".json": 5,
+    ".md": 5, ".rst": 5, ".txt": 2,
+}
+
+# Penalidades para ruído comum (lockfiles, minificados, pastas de ferramentas)
+LOW_VALUE_FILE_NAMES = frozenset({
+    "package-lock.json", "yarn.lock", "pnpm-lock.yaml", "poetry.lock", "pipfile.lock",
+    "cargo.lock", "composer.lock", "gemfile.lock", "go.sum",
+})
+LOW_VALUE_DIRS = frozenset({
+    ".github", ".vscode", ".idea", "node_modules", "vendor", "third_party", "dist",
+    "build", "venv", ".venv", "__pycache__", "site-packages", "coverage",
+})
+LOW_VALUE_PENALTY = 40.0
+DEPTH_PENALTY = 5.0
+
+# Regras de categoria compiladas uma vez por processo
+DEFAULT_PATH_CLASSIFIER = PathClassifier()
+
+
+def score_member(member_name: str, root: str = "") -> float:
+    """Pontua um membro pelo caminho: arquivos-chave, extensão e profundidade."""
+    path = member_name.replace("\\", "/")
+    if root and path.startswith(root):
+        path = path[len(root):]
+    parts = path.lower().split("/")
+    name = parts[-1]
+    folders = parts[:-1]
+
+    score = KEY_FILE_SCORES.get(name, 0.0)
+    for prefix, prefix_score in KEY_PREFIX_SCORES:
+        if name.startswith(prefix):
+            score = max(score, prefix_score)
+    score += EXTENSION_SCORES.get(os.path.splitext(name)[1], 0.0)
+
+    if name in LOW_VALUE_FILE_NAMES or ".min." in name:
+        score -= LOW_VALUE_PENALTY
+    if any(folder in LOW_VALUE_DIRS or folder.startswith(".") for folder in folders):
+        score -= LOW_VALUE_PENALTY
+
+    return score - DEPTH_PENALTY * len(folders)
+
+
+def rank_members(
+    members: List[zipfile.ZipInfo], max_files: int, root: Optional[str] = None
+) -> List[zipfile.ZipInfo]:
+    """Seleciona os ``max_files`` membros mais relevantes, do mais ao menos relevante.
+
+    Usa somente metadados do diretório central, sem descompactar nada; empates
+    mantêm a ordem original do arquivo.
+    """
+    if root is None:
+        root = common_root([info.filename for info in members])
+    ranked = sorted(
+        enumerate(members),
+        key=lambda item: (-score_member(item[1].filename, root), item[0]),
+    )
+    return [info for _, info in ranked[:max(0, max_files)]]
+
+
+def filter_members(
+    members: List[zipfile.ZipInfo],
+    excluded: frozenset,
+    root: str = "",
+    classifier: Optional[PathClassifier] = None,
+) -> Tuple[List[zipfile.ZipInfo], Dict[str, Dict[str, int]]]:
+    """Remove membros de categorias excluídas antes de qualquer ``zf.open``.
+
+    Retorna os membros mantidos e, por categoria, quantos arquivos e bytes
+    (descompactados) deixaram de ser lidos.
+    """
+    if not excluded:
+        return list(members), {}
+    classifier = classifier or DEFAULT_PATH_CLASSIFIER
+    kept: List[zipfile.ZipInfo] = []
+    stats: Dict[str, Dict[str, int]] = {}
+    for info in members:
+        category = classifier.classify(info.filename, root)
+        if category in excluded:
+            entry = stats.setdefault(category, {"files": 0, "bytes": 0})
+            entry["files"] += 1
+            entry["bytes"] += info.file_size
+        else:
+            kept.append(info)
+    return kept, stats
 
 # ------------------------------------------------------------------
 # BUILD PROMPT ------------------------------------------------------
 # ------------------------------------------------------------------
 
-def build_prompt(project_data: str, config: Dict[str, object]) -> str:
-    """Constrói um prompt customizado a partir da configuração avançada."""
+def estimate_tokens(text: str) -> int:
+    """Estimativa barata de tokens (~4 caracteres por token)."""
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def split_sections(project_data: str) -> List[str]:
+    """Divide os dados extraídos antes de cada cabeçalho ``--- arquivo ---``."""
+    return _SECTION_BOUNDARY_RE.split(project_data)
+
+
+def pack_project_data(project_data: str, token_budget: int) -> str:
+    """Encaixa as seções ``--- arquivo ---`` dentro de ``token_budget`` tokens.
+
+    As seções chegam ordenadas por relevância (ver :func:`rank_members`), então o
+    preenchimento guloso mantém as mais valiosas: seções que cabem entram
+    inteiras, a primeira que não cabe é truncada no fim e as demais que não
+    couberem são omitidas, com um aviso ao final.
+    """
+    if estimate_tokens(project_data) <= token_budget:
+        return project_data
+
+    remaining = max(0, token_budget - estimate_tokens(PACKING_OMITTED_NOTE.format(count=0)))
+    packed: List[str] = []
+    omitted = 0
+    for section in split_sections(project_data):
+        cost = estimate_tokens(section) + 1
+        if cost <= remaining:
+            packed.append(section)
+            remaining -= cost
+        elif remaining >= MIN_TRUNCATED_SECTION_TOKENS:
+            keep_chars = (remaining - estimate_tokens(PACKING_TRUNCATED_MARKER)) * CHARS_PER_TOKEN
+            packed.append(section[:max(0, keep_chars)] + PACKING_TRUNCATED_MARKER)
+            remaining = 0
+        elif section.strip():
+            omitted += 1
+
+    result = "\n".join(packed)
+    if omitted:
+        result += PACKING_OMITTED_NOTE.format(count=omitted)
+    return result
+
+
+def _render_prompt(project_data: str, config: Dict[str, object]) -> str:
     style_key = config.get("readme_style", "profissional").lower()
     base = PROMPTS.get(style_key, PROMPT_README_GENERATION)
 
@@ -48,22 +283,194 @@ def build_prompt(project_data: str, config: Dict[str, object]) -> str:
 
     return base.format(project_data=project_data) + extras_txt
 
+
+def prompt_overhead_tokens(config: Dict[str, object]) -> int:
+    """Tokens estimados do prompt sem os dados do projeto (instruções e flags)."""
+    return estimate_tokens(_render_prompt("", config))
+
+
+def build_prompt(project_data: str, config: Dict[str, object]) -> str:
+    """Constrói um prompt customizado a partir da configuração avançada.
+
+    Com ``config["token_budget"]`` definido, os dados do projeto são
+    empacotados para que o prompt final caiba no orçamento do modelo.
+    """
+    token_budget = int(config.get("token_budget") or 0)
+    if token_budget > 0:
+        project_data = pack_project_data(project_data, token_budget - prompt_overhead_tokens(config))
+
+    return _render_prompt(project_data, config)
+
 # ------------------------------------------------------------------
 # EXTRACT DATA ------------------------------------------------------
 # ------------------------------------------------------------------
 
-def extract_project_data_from_zip(
+def _iter_member_text(fp: IO[bytes], max_size: int) -> Iterator[Tuple[str, int]]:
+    """Decodifica um membro em blocos de até STREAM_CHUNK_SIZE bytes.
+
+    Produz ``(texto, bytes lidos do membro)``. Só a primeira leitura, uma
+    amostra de BINARY_SNIFF_SIZE bytes, decide se o membro é binário: nesse
+    caso nada é produzido; senão sempre sai ao menos um trecho (possivelmente
+    vazio), e um NUL perdido mais adiante não corta a seção já iniciada.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    remaining = max_size
+    first_chunk = True
+    # Bytes já lidos cujo texto o decodificador ainda não entregou
+    unreported = 0
+
+    while remaining > 0:
+        # A primeira leitura é só uma amostra: binários custam BINARY_SNIFF_SIZE bytes
+        raw = fp.read(min(BINARY_SNIFF_SIZE if first_chunk else STREAM_CHUNK_SIZE, remaining))
+        if not raw:
+            break
+        if first_chunk and _is_probably_binary(raw):
+            return
+        remaining -= len(raw)
+        try:
+            text = decoder.decode(raw)
+        except UnicodeDecodeError:
+            pending = decoder.getstate()[0]
+            decoder = codecs.getincrementaldecoder("latin-1")(errors="ignore")
+            text = decoder.decode(pending + raw)
+        unreported += len(raw)
+        if text or first_chunk:
+            yield text, unreported
+            unreported = 0
+        first_chunk = False
+
+    try:
+        tail = decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        tail = decoder.getstate()[0].decode("latin-1", errors="ignore")
+    if tail or first_chunk:
+        yield tail, unreported
+
+    # Cota esgotada: só houve truncamento se ainda restar conteúdo no membro
+    if remaining == 0 and fp.read(1):
+        yield "\n…[TRUNCADO]", 0
+
+
+def _iter_member_records(source: ProjectSource, info: zipfile.ZipInfo, max_size: int) -> Iterator[_MemberRecord]:
+    """Produz os registros de um membro; o primeiro trecho carrega o cabeçalho."""
+    header = f"\n--- {info.filename} ---\n"
+    with source.open(info) as fp:
+        for text, nbytes in _iter_member_text(fp, max_size):
+            yield info.filename, header + text, nbytes
+            header = ""
+
+
+def _replay_records(records: List[_MemberRecord], error: Optional[Exception]) -> Iterator[_MemberRecord]:
+    """Reentrega registros já lidos por um worker, relançando o erro original."""
+    yield from records
+    if error is not None:
+        raise error
+
+
+def _read_member_slice(
+    zip_path: str,
+    infos: List[zipfile.ZipInfo],
+    max_size: int,
+    cancel_token: Optional[CancelToken] = None,
+) -> Tuple[List[Tuple[zipfile.ZipInfo, List[_MemberRecord], Optional[Exception]]], float]:
+    """Lê uma fatia de membros com um handle da fonte próprio do worker."""
+    started_at = time.perf_counter()
+    results = []
+    with open_source(zip_path) as source:
+        for info in infos:
+            if cancel_token is not None and cancel_token.cancelled:
+                # Mantém um resultado por membro; o erro surge ao consumir o registro
+                results.append((info, [], JobCancelledException()))
+                continue
+            records: List[_MemberRecord] = []
+            try:
+                records.extend(_iter_member_records(source, info, max_size))
+                results.append((info, records, None))
+            except Exception as e:
+                results.append((info, records, e))
+    return results, time.perf_counter() - started_at
+
+
+def _iter_parallel_member_records(
+    zip_path: str,
+    infos: List[zipfile.ZipInfo],
+    max_size: int,
+    workers: int,
+    slice_timings: List[float],
+    cancel_token: Optional[CancelToken] = None,
+) -> Iterator[Tuple[zipfile.ZipInfo, Iterator[_MemberRecord]]]:
+    """Descompacta fatias de ``infos`` em paralelo e devolve na ordem do arquivo.
+
+    A zlib libera o GIL durante a descompressão, então threads bastam. Apenas
+    ``2 * workers`` fatias ficam em voo, mantendo a memória limitada.
+    """
+    slice_size = max(1, min(PARALLEL_SLICE_SIZE, -(-len(infos) // workers)))
+    slices = iter([infos[i:i + slice_size] for i in range(0, len(infos), slice_size)])
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zip-extract")
+    try:
+        pending = deque(
+            executor.submit(_read_member_slice, zip_path, chunk, max_size, cancel_token)
+            for chunk in itertools.islice(slices, workers * 2)
+        )
+        while pending:
+            results, elapsed = pending.popleft().result()
+            slice_timings.append(elapsed)
+            next_chunk = next(slices, None)
+            if next_chunk is not None:
+                pending.append(
+                    executor.submit(_read_member_slice, zip_path, next_chunk, max_size, cancel_token)
+                )
+            for info, records, error in results:
+                yield info, _replay_records(records, error)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_cached_section(member_name: str, cached: str) -> Iterator[_MemberRecord]:
+    # "0": o membro não produziu texto (binário); "1" + corpo da seção
+    if cached.startswith("1"):
+        yield member_name, f"\n--- {member_name} ---\n" + cached[1:], 0
+
+
+def _iter_caching_section(
+    records: Iterator[_MemberRecord], section_cache: ExtractionCache, key: str
+) -> Iterator[_MemberRecord]:
+    """Repassa os registros de um membro e grava a seção completa no cache ao final."""
+    chunks: List[str] = []
+    for member_name, chunk, nbytes in records:
+        chunks.append(chunk)
+        yield member_name, chunk, nbytes
+    text = "".join(chunks)
+    section_cache.put(key, "1" + text.split("\n", 2)[2] if text else "0")
+
+
+def iter_project_data_from_zip(
     zip_path: str,
     config: Dict[str, object],
     progress_cb: Optional[Callable[[str,int], None]] = None,
     step_cb: Optional[Callable[[str,str,str], None]] = None,
-) -> str:
-    """Extrai nomes de arquivos e primeiros bytes de cada arquivo relevante.
-    Mantém implementação simples para evitar travar interface.
-    
-    Segurança: ignora paths suspeitos e arquivos binários para evitar ruído e riscos.
+    section_cache: Optional[ExtractionCache] = None,
+    previous_manifest: Optional[Manifest] = None,
+    bytes_cb: Optional[Callable[[int, int], None]] = None,
+    cancel_token: Optional[CancelToken] = None,
+) -> Iterator[ProjectRecord]:
+    """Versão em streaming da extração: produz ``(member_name, text_chunk)``.
+
+    Os membros são lidos e decodificados sob demanda, um bloco por vez, de modo
+    que o consumo de memória não depende do número de arquivos nem de
+    ``max_file_size_kb``. Concatenar os trechos de um membro reproduz a seção
+    ``--- nome ---`` gerada por :func:`extract_project_data_from_zip`.
+
+    Com ``section_cache``, cada seção lida é guardada por (caminho relativo,
+    CRC32, tamanho); com ``previous_manifest`` também, os membros inalterados
+    desde o manifesto vêm do cache em vez de serem descompactados.
+
+    ``bytes_cb(lidos, total)`` acompanha os bytes dos membros selecionados
+    (limitados a ``max_file_size_kb`` cada), a cada trecho produzido.
+    ``cancel_token`` é verificado entre membros e trechos; o cancelamento
+    levanta :class:`JobCancelledException`.
     """
-    if not os.path.isfile(zip_path):
+    if not os.path.exists(zip_path):
         raise FileNotFoundError(zip_path)
 
     def emit_progress(msg: str, val: int):
@@ -74,72 +481,245 @@ def extract_project_data_from_zip(
         if step_cb:
             step_cb(name, status, details)
 
-    emit_step("ZIP", "progress", "Abrindo arquivo…")
-    emit_progress("Iniciando análise do arquivo ZIP", 5)
+    def check_cancelled():
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
+    label = source_label(zip_path)
+    emit_step(label, "progress", "Abrindo arquivo…")
+    emit_progress(f"Iniciando análise do projeto ({label})", 5)
 
-    data_parts: List[str] = []
-    
     try:
-        with zipfile.ZipFile(zip_path, "r") as zf:
-            members = zf.infolist()
+        with open_source(zip_path) as source:
+            members = source.infolist()
             total = len(members)
             max_files = int(config.get("max_files", DEFAULT_MAX_FILES))
             max_size = int(config.get("max_file_size_kb", DEFAULT_MAX_FILE_SIZE_KB)) * 1024
 
-            emit_progress(f"Encontrados {total} arquivos no ZIP", 10)
+            emit_progress(f"Encontrados {total} arquivos no projeto", 10)
             emit_step("Análise", "progress", f"{total} arquivos encontrados")
 
-            # Processar arquivos
-            files_to_process = min(total, max_files)
-            for idx, info in enumerate(members[:max_files]):
-
+            # Selecionar arquivos (paths suspeitos e diretórios não consomem leitura)
+            candidates: List[zipfile.ZipInfo] = []
+            for info in members:
                 if not _is_safe_member_path(info.filename):
                     emit_step("Segurança", "warning", f"Path ignorado: {info.filename}")
                     continue
-                
+                if not info.is_dir():
+                    candidates.append(info)
+
+            # Filtros por categoria e ranking usam apenas o diretório central
+            root = common_root([info.filename for info in candidates])
+            listed = candidates
+            if config.get("respect_gitignore", True):
+                matcher, gitignore_count = build_ignore_matcher(source, candidates, root)
+                candidates, pruned_files, pruned_bytes = prune_members(candidates, matcher)
+                if pruned_files:
+                    emit_step(
+                        "Ignorados",
+                        "info",
+                        f"{pruned_files} arquivos ({pruned_bytes / 1024:.1f} KB) por "
+                        f"{gitignore_count} .gitignore e padrões da aplicação",
+                    )
+
+            # Imagens, fontes e arquivos compactados saem pelos metadados, sem leitura
+            texts: List[zipfile.ZipInfo] = []
+            binary_files = binary_bytes = 0
+            for info in candidates:
+                if is_binary_member(info):
+                    binary_files += 1
+                    binary_bytes += info.file_size
+                else:
+                    texts.append(info)
+            candidates = texts
+            if binary_files:
+                emit_step(
+                    "Binários",
+                    "info",
+                    f"{binary_files} arquivos ({binary_bytes / 1024:.1f} KB) ignorados pela "
+                    "extensão ou taxa de compressão",
+                )
+
+            candidates, skipped = filter_members(candidates, excluded_categories(config), root)
+            if skipped:
+                emit_step("Filtros", "info", f"Ignorados - {format_skip_stats(skipped)}")
+
+            to_read = rank_members(candidates, max_files, root)
+            emit_step("Ranking", "info", f"{len(to_read)} de {len(candidates)} arquivos selecionados")
+
+            # Regeneração incremental: seções de membros inalterados vêm do cache
+            section_keys: Dict[str, str] = {}
+            cached_sections: Dict[str, str] = {}
+            if section_cache is not None:
+                for info in to_read:
+                    relative_path = relative_member_path(info.filename, root)
+                    key = section_cache_key(relative_path, info.CRC, info.file_size, max_size)
+                    section_keys[info.filename] = key
+                    if previous_manifest and previous_manifest.get(relative_path) == (info.CRC, info.file_size):
+                        cached = section_cache.get(key)
+                        if cached is not None:
+                            cached_sections[info.filename] = cached
+            if previous_manifest is not None:
+                current_manifest = {
+                    relative_member_path(info.filename, root): (info.CRC, info.file_size) for info in listed
+                }
+                diff = diff_manifests(previous_manifest, current_manifest)
+                emit_step(
+                    "Incremental",
+                    "info",
+                    f"{diff.summary()}; {len(cached_sections)} seções reaproveitadas",
+                )
+            to_extract = [info for info in to_read if info.filename not in cached_sections]
+
+            workers = max(1, int(config.get("extract_workers", DEFAULT_EXTRACT_WORKERS)))
+            slice_timings: List[float] = []
+            started_at = time.perf_counter()
+            if workers > 1 and len(to_extract) > 1 and source.supports_parallel:
+                extracted = _iter_parallel_member_records(
+                    zip_path, to_extract, max_size, workers, slice_timings, cancel_token
+                )
+            else:
+                workers = 1
+                source.prepare(to_extract, max_size)
+                extracted = ((info, _iter_member_records(source, info, max_size)) for info in to_extract)
+
+            def member_results() -> Iterator[Tuple[zipfile.ZipInfo, Iterator[_MemberRecord]]]:
+                # Intercala cache e extração mantendo a ordem do ranking
+                try:
+                    for info in to_read:
+                        if info.filename in cached_sections:
+                            yield info, _iter_cached_section(info.filename, cached_sections[info.filename])
+                            continue
+                        _, records = next(extracted)
+                        if section_cache is not None:
+                            records = _iter_caching_section(records, section_cache, section_keys[info.filename])
+                        yield info, records
+                finally:
+                    # Encerra o pool de threads do modo paralelo
+                    extracted.close()
+
+            # Processar arquivos
+            files_to_process = len(to_read)
+            total_bytes = sum(min(info.file_size, max_size) for info in to_read)
+            done_bytes = 0
+            for idx, (info, records) in enumerate(member_results()):
+                check_cancelled()
                 # Calcular progresso (10% a 80% da operação)
                 progress_percent = int(10 + (70 * (idx + 1) / files_to_process))
                 emit_progress(f"Processando {info.filename}", progress_percent)
-                
-                if info.is_dir():
-                    continue
+                member_budget = min(info.file_size, max_size)
                     
                 try:
-                    with zf.open(info) as fp:
-                        raw = fp.read(max_size)
-                        if _is_probably_binary(raw):
-                            continue
-                        try:
-                            text = raw.decode("utf-8")
-                        except UnicodeDecodeError:
-                            text = raw.decode("latin-1", errors="ignore")
-                        
-                        if len(raw) == max_size:
-                            text += "\n…[TRUNCADO]"
-                            
-                        data_parts.append(f"\n--- {info.filename} ---\n{text}")
-                        
-                        # Progresso incremental para arquivos grandes
-                        if idx % 5 == 0:  # Atualizar a cada 5 arquivos
-                            emit_step("Arquivo", "info", f"Processado: {info.filename}")
+                    member_bytes = 0
+                    for member_name, text, nbytes in records:
+                        check_cancelled()
+                        yield member_name, text
+                        if bytes_cb and nbytes:
+                            # Bytes lidos do membro, não caracteres decodificados
+                            member_bytes = min(member_budget, member_bytes + nbytes)
+                            bytes_cb(done_bytes + member_bytes, total_bytes)
+
+                    # Progresso incremental para arquivos grandes
+                    if idx % 5 == 0:  # Atualizar a cada 5 arquivos
+                        emit_step("Arquivo", "info", f"Processado: {info.filename}")
                             
+                except JobCancelledException:
+                    raise
                 except Exception as e:
-                    data_parts.append(f"\n--- {info.filename} (erro ao ler: {e}) ---\n")
+                    yield info.filename, f"\n--- {info.filename} (erro ao ler: {e}) ---\n"
                     emit_step("Erro", "warning", f"Erro em {info.filename}: {e}")
 
+                # Binários e membros truncados completam a cota do membro
+                done_bytes += member_budget
+                if bytes_cb:
+                    bytes_cb(done_bytes, total_bytes)
+
+            if workers > 1:
+                elapsed = time.perf_counter() - started_at
+                speedup = sum(slice_timings) / elapsed if elapsed > 0 else 1.0
+                emit_step(
+                    "Paralelo",
+                    "info",
+                    f"{workers} threads em {elapsed:.2f}s (speedup estimado {speedup:.1f}x)",
+                )
+
             emit_progress("Finalizando extração de dados", 85)
-            emit_step("ZIP", "success", f"{min(total, max_files)} arquivos analisados")
+            emit_step(label, "success", f"{files_to_process} arquivos analisados")
             
+    except JobCancelledException:
+        emit_step(label, "warning", "Extração cancelada")
+        raise
     except Exception as e:
-        emit_step("ZIP", "error", f"Erro ao processar ZIP: {e}")
+        emit_step(label, "error", f"Erro ao processar {label}: {e}")
         raise
 
     emit_progress("Dados extraídos com sucesso", 90)
-    result = "\n".join(data_parts)
+
+
+def write_project_data(records: Iterable[ProjectRecord], out: TextIO) -> int:
+    """Escreve os registros da extração direto no buffer do prompt.
+
+    Membros consecutivos são separados por uma quebra de linha, exatamente como
+    o antigo ``"\\n".join`` das seções. Retorna o total de caracteres escritos.
+    """
+    written = 0
+    previous_member: Optional[str] = None
+    for member_name, chunk in records:
+        if previous_member is not None and member_name != previous_member:
+            written += out.write("\n")
+        written += out.write(chunk)
+        previous_member = member_name
+    return written
+
+
+def extract_project_data_from_zip(
+    zip_path: str,
+    config: Dict[str, object],
+    progress_cb: Optional[Callable[[str,int], None]] = None,
+    step_cb: Optional[Callable[[str,str,str], None]] = None,
+    cache: Optional[ExtractionCache] = None,
+    section_cache: Optional[ExtractionCache] = None,
+    previous_manifest: Optional[Manifest] = None,
+    bytes_cb: Optional[Callable[[int, int], None]] = None,
+    cancel_token: Optional[CancelToken] = None,
+) -> str:
+    """Extrai nomes de arquivos e primeiros bytes de cada arquivo relevante.
+    Invólucro sobre :func:`iter_project_data_from_zip` que materializa o texto.
+    Com ``cache``, um arquivo já visto com a mesma configuração não é relido;
+    ``section_cache``/``previous_manifest`` ativam a regeneração incremental.
+    
+    Segurança: ignora paths suspeitos e arquivos binários para evitar ruído e riscos.
+    """
+    cache_key: Optional[str] = None
+    if cache is not None and os.path.exists(zip_path):
+        try:
+            cache_key = cache.build_key(zip_path, config)
+        except (OSError, ValueError, zipfile.BadZipFile, tarfile.TarError):
+            cache_key = None
+        cached = cache.get(cache_key) if cache_key else None
+        if cached is not None:
+            if step_cb:
+                step_cb("Cache", "success", f"Extração reutilizada ({len(cached) // 1024}KB, sem descompactar)")
+            if progress_cb:
+                progress_cb("Dados extraídos do cache", 90)
+            if bytes_cb:
+                bytes_cb(len(cached), len(cached))
+            return cached
+
+    buffer = io.StringIO()
+    records = iter_project_data_from_zip(
+        zip_path, config, progress_cb, step_cb, section_cache, previous_manifest, bytes_cb, cancel_token
+    )
+    write_project_data(records, buffer)
+    result = buffer.getvalue()
     
     # Log do tamanho final dos dados
     data_size_kb = len(result) // 1024
-    emit_step("Dados", "success", f"Extraídos {data_size_kb}KB de dados")
+    if step_cb:
+        step_cb("Dados", "success", f"Extraídos {data_size_kb}KB de dados")
+
+    if cache is not None and cache_key:
+        cache.put(cache_key, result)
     
     return result
 
@@ -0,0 +1,92 @@
+# gerador_readme_ia/gui/progress_channel.py
+"""Canal de progresso entre threads de trabalho e a barra de progresso da GUI.
+
+Workers podem reportar a cada trecho extraído; o canal guarda só o estado mais
+recente e agenda, via ``after()``, no máximo ``max_rate`` atualizações por
+segundo na thread da UI. Não depende do Tk: ``schedule`` e ``render`` são
+injetados (``widget.after`` e o método que desenha a barra).
+"""
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+DEFAULT_MAX_RATE = 30.0
+# Abaixo disso o ETA ainda é ruído (poucos bytes ou pouco tempo medido)
+MIN_ETA_FRACTION = 0.02
+MIN_ETA_ELAPSED = 0.5
+
+
+class ProgressState(NamedTuple):
+    message: str
+    percent: float
+    eta_seconds: Optional[float]
+
+
+class ProgressChannel:
+    """Agrega o progresso de uma fase (``start``–``end`` da barra) e coalesce as entregas."""
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], object],
+        render: Callable[[str, float, Optional[float]], None],
+        max_rate: float = DEFAULT_MAX_RATE,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._schedule = schedule
+        self._render = render
+        self._min_interval = 1.0 / max_rate
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = ProgressState("", 0.0, None)
+        self._flush_pending = False
+        self._last_flush = float("-inf")
+        self._phase_message = ""
+        self._phase_start = 0.0
+        self._phase_end = 100.0
+        self._phase_started_at = clock()
+        self.flush_count = 0
+
+    def set(self, message: str, percent: float):
+        """Posição fixa da barra (marcos entre fases), sem ETA."""
+        with self._lock:
+            self._phase_message = message
+            self._phase_start = self._phase_end = percent
+            self._state = ProgressState(message, percent, None)
+        self._request_flush()
+
+    def start_phase(self, message: str, start: float, end: float):
+        """Inicia uma fase medida, que ocupa de ``start`` a ``end`` na barra."""
+        with self._lock:
+            self._phase_message = message
+            self._phase_start, self._phase_end = start, end
+            self._phase_started_at = self._clock()
+            self._state = ProgressState(message, start, None)
+        self._request_flush()
+
+    def update_bytes(self, done: int, total: int):
+        """Progresso da fase atual em bytes; seguro a partir de qualquer thread."""
+        fraction = min(1.0, done / total) if total > 0 else 1.0
+        with self._lock:
+            elapsed = self._clock() - self._phase_started_at
+            eta = None
+            if MIN_ETA_FRACTION <= fraction < 1.0 and elapsed >= MIN_ETA_ELAPSED:
+                eta = elapsed * (1.0 - fraction) / fraction
+            percent = self._phase_start + (self._phase_end - self._phase_start) * fraction
+            self._state = ProgressState(self._phase_message, percent, eta)
+        self._request_flush()
+
+    def _request_flush(self):
+        with self._lock:
+            if self._flush_pending:
+                return
+            self._flush_pending = True
+            wait = max(0.0, self._min_interval - (self._clock() - self._last_flush))
+        self._schedule(int(wait * 1000), self._flush)
+
+    def _flush(self):
+        with self._lock:
+            self._flush_pending = False
+            self._last_flush = self._clock()
+            state = self._state
+        self.flush_count += 1
+        self._render(*state)
@@ -0,0 +1,185 @@
+# gerador_readme_ia/gui/summarizer.py
+"""Geração em duas fases (map-reduce) para projetos maiores que a janela de contexto.
+
+Na fase de mapa os dados extraídos são agrupados por diretório de topo e cada
+grupo é resumido em paralelo por um modelo barato (``SUMMARY_MODEL``). Na fase
+de redução os resumos concatenados alimentam o prompt do estilo escolhido.
+Resumos ficam em cache pelo hash do grupo: diretórios inalterados não são
+resumidos de novo na próxima execução.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from ..constants import APP_NAME, PROMPT_SUMMARIZE_GROUP, SUMMARY_MODEL
+from ..utils.cancellation import CancelToken
+from ..utils.extraction_cache import ExtractionCache
+from ..utils.path_filters import common_root
+from .logic import (
+    build_prompt,
+    estimate_tokens,
+    pack_project_data,
+    prompt_overhead_tokens,
+    split_sections,
+)
+
+logger = logging.getLogger(f"{APP_NAME}.summarizer")
+
+ROOT_GROUP = "(raiz)"
+DEFAULT_SUMMARY_WORKERS = 4
+# Teto por chamada de resumo, mesmo em modelos com janela enorme
+MAX_GROUP_TOKENS = 24_000
+# Incrementar quando o prompt de resumo mudar, invalidando resumos antigos
+SUMMARY_CACHE_VERSION = 1
+
+_SECTION_HEADER_RE = re.compile(r"\n?--- (.+?)(?: \(erro ao ler: .*\))? ---\n")
+
+
+def needs_map_reduce(project_data: str, config: Dict[str, object]) -> bool:
+    """Se o prompt completo estoura ``config["token_budget"]``."""
+    token_budget = int(config.get("token_budget") or 0)
+    if token_budget <= 0:
+        return False
+    return estimate_tokens(project_data) + prompt_overhead_tokens(config) > token_budget
+
+
+def group_sections(project_data: str) -> Dict[str, str]:
+    """Agrupa as seções ``--- arquivo ---`` por diretório de topo, na ordem de relevância."""
+    sections: List[tuple[str, str]] = []
+    for section in split_sections(project_data):
+        match = _SECTION_HEADER_RE.match(section)
+        if match:
+            sections.append((match.group(1), section.strip("\n")))
+
+    root = common_root([path for path, _ in sections])
+    groups: Dict[str, List[str]] = {}
+    for path, section in sections:
+        parts = path[len(root):].split("/", 1)
+        group = f"{parts[0]}/" if len(parts) > 1 else ROOT_GROUP
+        groups.setdefault(group, []).append(section)
+    return {group: "\n\n".join(items) for group, items in groups.items()}
+
+
+def group_cache_key(model_name: str, group: str, group_data: str) -> str:
+    payload = "\0".join((str(SUMMARY_CACHE_VERSION), model_name, group, group_data))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def summarize_groups(
+    groups: Dict[str, str],
+    client,
+    cache: Optional[ExtractionCache] = None,
+    workers: int = DEFAULT_SUMMARY_WORKERS,
+    step_cb: Optional[Callable[[str, str, str], None]] = None,
+    cancel_token: Optional[CancelToken] = None,
+) -> Dict[str, str]:
+    """Fase de mapa: um resumo por grupo, com chamadas paralelas ao ``client``."""
+    def emit_step(name: str, status: str, details: str = ""):
+        if step_cb:
+            step_cb(name, status, details)
+
+    group_budget = min(MAX_GROUP_TOKENS, client.get_prompt_token_budget())
+    summaries: Dict[str, str] = {}
+    pending: Dict[str, tuple[str, str]] = {}
+    for group, group_data in groups.items():
+        key = group_cache_key(client.model_name, group, group_data)
+        cached = cache.get(key) if cache is not None else None
+        if cached is not None:
+            summaries[group] = cached
+        else:
+            pending[group] = (key, group_data)
+
+    if summaries:
+        emit_step("Resumos", "info", f"{len(summaries)} de {len(groups)} grupos reaproveitados do cache")
+
+    def summarize(group: str) -> str:
+        key, group_data = pending[group]
+        overhead = estimate_tokens(PROMPT_SUMMARIZE_GROUP.format(group=group, project_data=""))
+        prompt = PROMPT_SUMMARIZE_GROUP.format(
+            group=group,
+            project_data=pack_project_data(group_data, group_budget - overhead),
+        )
+        summary = (
+            client.send_conversational_prompt(prompt, use_cache=False, cancel_token=cancel_token) or ""
+        ).strip()
+        if summary and cache is not None:
+            cache.put(key, summary)
+        emit_step("Resumo", "success", f"{group} resumido")
+        return summary
+
+    if pending:
+        emit_step("Resumos", "progress", f"Resumindo {len(pending)} grupos com {client.model_name.replace('models/', '')}…")
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="summary") as executor:
+            for group, summary in zip(pending, executor.map(summarize, pending), strict=True):
+                summaries[group] = summary
+
+    # Mantém a ordem de relevância dos grupos
+    return {group: summaries[group] for group in groups if summaries.get(group)}
+
+
+def build_map_reduce_prompt(
+    project_data: str,
+    config: Dict[str, object],
+    client,
+    cache: Optional[ExtractionCache] = None,
+    workers: int = DEFAULT_SUMMARY_WORKERS,
+    step_cb: Optional[Callable[[str, str, str], None]] = None,
+    cancel_token: Optional[CancelToken] = None,
+) -> str:
+    """Fase de redução: prompt do estilo escolhido a partir dos resumos por diretório."""
+    groups = group_sections(project_data)
+    summaries = summarize_groups(groups, client, cache, workers, step_cb, cancel_token)
+    summarized_data = "\n".join(
+        f"\n--- {group} (resumo) ---\n{summary}" for group, summary in summaries.items()
+    )
+    logger.info(
+        f"Map-reduce: {len(groups)} grupos, {estimate_tokens(project_data):,} -> "
+        f"{estimate_tokens(summarized_data):,} tokens estimados."
+    )
+    return build_prompt(summarized_data, config)
+
+
+def build_generation_prompt(
+    project_data: str,
+    config: Dict[str, object],
+    client=None,
+    cache: Optional[ExtractionCache] = None,
+    step_cb: Optional[Callable[[str, str, str], None]] = None,
+    cancel_token: Optional[CancelToken] = None,
+) -> str:
+    """Prompt final: direto quando cabe no orçamento; em duas fases quando
+    ``config["map_reduce"]`` está ativo e os dados não cabem.
+
+    ``client`` é o cliente principal; o de resumo é derivado dele só se preciso.
+    """
+    if client is not None and config.get("map_reduce") and needs_map_reduce(project_data, config):
+        if step_cb:
+            step_cb("Map-reduce", "info", "Projeto maior que o contexto: resumindo por diretório")
+        return build_map_reduce_prompt(
+            project_data,
+            config,
+            create_summary_client(client),
+            cache,
+            step_cb=step_cb,
+            cancel_token=cancel_token,
+        )
+    return build_prompt(project_data, config)
+
+
+def create_summary_client(client):
+    """Cliente do modelo de resumo, reaproveitando chave, caches e catálogo do principal."""
+    if client.model_name.replace("models/", "") == SUMMARY_MODEL:
+        return client
+    # Importado aqui para o CLI carregar este módulo sem google-generativeai (--help)
+    from ..ia_client.gemini_client import GeminiClient
+
+    return GeminiClient(
+        client.api_key,
+        SUMMARY_MODEL,
+        response_cache=client.response_cache,
+        model_catalog=client.model_catalog,
+    )
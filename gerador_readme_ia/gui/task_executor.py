@@ -0,0 +1,173 @@
+# gerador_readme_ia/gui/task_executor.py
+"""Executor de tarefas da GUI com lanes separadas e limitadas.
+
+Chamadas de rede (validação, Gemini) e trabalho de CPU (extração) usam pools
+próprios, para que uma extração pesada não atrase a validação da chave e
+vice-versa. Cada tarefa devolve um ``concurrent.futures.Future``; o callback
+de conclusão é entregue na thread da UI via ``schedule`` (``widget.after``).
+
+As threads são daemon, como as antigas threads avulsas da janela: uma
+chamada de rede presa não impede o processo de encerrar.
+"""
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from ..constants import APP_NAME
+
+logger = logging.getLogger(f"{APP_NAME}.task_executor")
+
+LANE_NETWORK = "network"
+LANE_CPU = "cpu"
+
+DEFAULT_LANE_WORKERS: Dict[str, int] = {
+    LANE_NETWORK: 4,
+    LANE_CPU: max(1, min(4, (os.cpu_count() or 2) - 1)),
+}
+
+
+class _Lane:
+    """Fila com até ``max_workers`` threads daemon, criadas sob demanda.
+
+    Uma thread nova nasce sempre que há mais itens aguardando do que threads
+    livres para pegá-los, de modo que uma rajada de envios roda em paralelo.
+    """
+
+    def __init__(self, name: str, max_workers: int):
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self._queue: "queue.SimpleQueue[Optional[tuple]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        # Itens na fila ainda não retirados por nenhuma thread
+        self._pending = 0
+
+    def submit(self, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Future:
+        future: Future = Future()
+        thread = None
+        with self._lock:
+            self._pending += 1
+            if self._pending > self._idle and len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._run,
+                    name=f"gui-{self.name}-{len(self._threads) + 1}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+        self._queue.put((future, fn, args, kwargs))
+        if thread is not None:
+            thread.start()
+        return future
+
+    def _run(self):
+        while True:
+            with self._lock:
+                self._idle += 1
+            item = self._queue.get()
+            with self._lock:
+                self._idle -= 1
+                if item is not None:
+                    self._pending -= 1
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            # Solta a tupla antes de executar: argumentos grandes morrem com a tarefa
+            del item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+            del future, fn, args, kwargs
+
+    @property
+    def thread_count(self) -> int:
+        return len(self._threads)
+
+    def shutdown(self):
+        """Cancela o que ainda está na fila e encerra as threads ao ficarem livres."""
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                item[0].cancel()
+        for _ in self._threads:
+            self._queue.put(None)
+
+
+class TaskExecutor:
+    """Pools por lane com conclusão entregue na thread da UI."""
+
+    def __init__(
+        self,
+        schedule: Callable[[int, Callable[[], None]], object],
+        lane_workers: Optional[Dict[str, int]] = None,
+    ):
+        self._schedule = schedule
+        workers = dict(DEFAULT_LANE_WORKERS, **(lane_workers or {}))
+        self._lanes = {name: _Lane(name, count) for name, count in workers.items()}
+        self._pending: Set[Future] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(
+        self,
+        lane: str,
+        fn: Callable[..., Any],
+        *args,
+        on_done: Optional[Callable[[Future], None]] = None,
+        **kwargs,
+    ) -> Future:
+        """Executa ``fn`` na lane; ``on_done(future)`` roda depois na thread da UI."""
+        if self._closed:
+            raise RuntimeError("TaskExecutor já foi encerrado")
+        future = self._lanes[lane].submit(fn, args, kwargs)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(lambda done: self._on_future_done(done, on_done))
+        return future
+
+    def _on_future_done(self, future: Future, on_done: Optional[Callable[[Future], None]]):
+        with self._lock:
+            self._pending.discard(future)
+        if on_done is None or self._closed:
+            return
+        try:
+            self._schedule(0, lambda: on_done(future))
+        except Exception:
+            # Janela já destruída: não há mais a quem entregar o resultado
+            logger.debug("Conclusão de tarefa descartada.", exc_info=True)
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def thread_count(self, lane: Optional[str] = None) -> int:
+        lanes = [self._lanes[lane]] if lane else self._lanes.values()
+        return sum(item.thread_count for item in lanes)
+
+    def shutdown(self, timeout: float = 1.0) -> bool:
+        """Cancela tarefas na fila e espera até ``timeout`` pelas em execução.
+
+        Retorna ``True`` se todas terminaram; as que restarem são threads
+        daemon e não seguram o encerramento do processo.
+        """
+        self._closed = True
+        for lane in self._lanes.values():
+            lane.shutdown()
+        with self._lock:
+            running = list(self._pending)
+        _, not_done = wait(running, timeout=timeout)
+        if not_done:
+            logger.info(f"{len(not_done)} tarefa(s) ainda em execução no encerramento.")
+        return not not_done
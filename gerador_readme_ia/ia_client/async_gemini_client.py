@@ -0,0 +1,219 @@
+# gerador_readme_ia/ia_client/async_gemini_client.py
+"""Cliente Gemini assíncrono (asyncio) com a mesma interface do :class:`GeminiClient`.
+
+Um único event loop pode conduzir dezenas de gerações concorrentes sem uma
+thread por requisição. Cache de respostas, rate limiting, retentativas,
+failover e o mapeamento de erros são os mesmos do cliente síncrono.
+"""
+import asyncio
+import contextvars
+import logging
+from typing import Any, AsyncIterator, Optional
+
+from ..constants import APP_NAME
+from ..utils.cancellation import CancelToken
+from .gemini_client import GeminiClient
+
+logger = logging.getLogger(f"{APP_NAME}.async_gemini_client")
+
+
+class _TaskLocalState:
+    """Equivalente a ``threading.local`` para tarefas asyncio (via ``contextvars``)."""
+
+    def __init__(self):
+        object.__setattr__(self, "_var", contextvars.ContextVar(f"gemini_request_state_{id(self)}"))
+
+    def __getattr__(self, name: str) -> Any:
+        state = self._var.get(None)
+        if state is None or name not in state:
+            raise AttributeError(name)
+        return state[name]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        state = self._var.get(None)
+        if state is None:
+            state = {}
+            self._var.set(state)
+        state[name] = value
+
+    def reset(self) -> None:
+        # Dicionário novo no contexto da tarefa atual: não vaza para outras tarefas
+        self._var.set({})
+
+
+class AsyncGeminiClient(GeminiClient):
+    """Versões ``async`` de envio, streaming, teste de conexão e listagem de modelos.
+
+    A construção reaproveita o :class:`GeminiClient` (a listagem vem do catálogo
+    em cache); dentro de um event loop, prefira ``await AsyncGeminiClient.create(...)``.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._request_state = _TaskLocalState()
+
+    @classmethod
+    async def create(cls, *args, **kwargs) -> "AsyncGeminiClient":
+        """Constrói o cliente fora do event loop (a validação pode ir à rede)."""
+        return await asyncio.to_thread(cls, *args, **kwargs)
+
+    def _begin_request(
+        self,
+        prompt_text: str,
+        generation_config: Any,
+        use_cache: bool,
+        cancel_token: Optional[CancelToken] = None,
+    ):
+        self._request_state.reset()
+        return super()._begin_request(prompt_text, generation_config, use_cache, cancel_token)
+
+    async def _generate_content_async(
+        self,
+        contents: str,
+        generation_config: Any,
+        stream: bool = False,
+        model_name: Optional[str] = None,
+        retry_quota: bool = True,
+    ) -> Any:
+        model_name = model_name or self.model_name
+        return await self.retry_policy.call_async(
+            self._generate_content_once_async,
+            contents,
+            generation_config,
+            stream,
+            model_name,
+            description=f"generate_content_async ({model_name})",
+            retry_if=self._retry_predicate(retry_quota),
+        )
+
+    @staticmethod
+    async def _prefetch_stream_async(response: Any) -> AsyncIterator[Any]:
+        # Mesmo motivo do ``_prefetch_stream`` síncrono: erros do primeiro bloco
+        # passam por retry e failover
+        chunks = response.__aiter__()
+        try:
+            first = await chunks.__anext__()
+        except StopAsyncIteration:
+            first = None
+
+        async def replay() -> AsyncIterator[Any]:
+            if first is None:
+                return
+            yield first
+            async for chunk in chunks:
+                yield chunk
+
+        return replay()
+
+    async def _generate_content_once_async(
+        self, contents: str, generation_config: Any, stream: bool, model_name: str
+    ) -> Any:
+        self._raise_if_cancelled()
+        await self._rate_limiter_for(model_name).acquire_async(self._estimate_tokens(contents))
+        self._raise_if_cancelled()
+        logger.debug(f">>> AsyncGeminiClient: Chamando generate_content_async em '{model_name}'...")
+        response = await self._get_model(model_name).generate_content_async(
+            contents=contents,
+            generation_config=generation_config,
+            stream=stream,
+        )
+        if stream:
+            return await self._prefetch_stream_async(response)
+        return response
+
+    async def _generate_with_failover_async(
+        self, contents: str, generation_config: Any, stream: bool = False
+    ) -> Any:
+        last_quota_error: Optional[Exception] = None
+        chain = self._failover_chain(self._estimate_tokens(contents))
+        for position, model_name in enumerate(chain):
+            is_last = position == len(chain) - 1
+            try:
+                response = await self._generate_content_async(
+                    contents, generation_config, stream, model_name, retry_quota=is_last
+                )
+            except Exception as error:
+                if self._should_skip_fallback(position, error):
+                    logger.warning(f"Fallback '{model_name}' indisponível ({type(error).__name__}); tentando o próximo.")
+                    continue
+                if not self._is_quota_error(error):
+                    raise
+                self._mark_quota_exhausted(model_name, error)
+                last_quota_error = error
+                continue
+            self._record_served_model(model_name)
+            return response
+        raise last_quota_error
+
+    async def send_conversational_prompt(
+        self, prompt_text: str, use_cache: bool = True, cancel_token: Optional[CancelToken] = None
+    ) -> Optional[str]:
+        logger.info(f"Enviando prompt (async) para o modelo: {self.model_name}. Tamanho (aprox): {len(prompt_text):,} chars.")
+        generation_config = self._build_generation_config()
+        cache_key, cached = self._begin_request(prompt_text, generation_config, use_cache, cancel_token)
+        try:
+            if cached is not None:
+                return cached
+            response = await self._generate_with_failover_async(prompt_text, generation_config)
+            return self._finish_response(response, cache_key)
+
+        except Exception as error:
+            self._handle_runtime_exception(error, "chamada assíncrona à API Gemini")
+        finally:
+            self._end_request()
+
+    async def stream_conversational_prompt(
+        self, prompt_text: str, use_cache: bool = True, cancel_token: Optional[CancelToken] = None
+    ) -> AsyncIterator[str]:
+        logger.info(f"Enviando prompt (async, streaming) para o modelo: {self.model_name}. Tamanho (aprox): {len(prompt_text):,} chars.")
+        generation_config = self._build_generation_config()
+        cache_key, cached = self._begin_request(prompt_text, generation_config, use_cache, cancel_token)
+        try:
+            if cached is not None:
+                yield cached
+                return
+
+            received: list[str] = []
+            try:
+                response = await self._generate_with_failover_async(prompt_text, generation_config, stream=True)
+                async for chunk in response:
+                    self._raise_if_cancelled()
+                    self._raise_if_blocked(chunk, "Solicitação")
+                    delta = self._extract_chunk_text(chunk)
+                    if delta:
+                        received.append(delta)
+                        yield delta
+
+            except Exception as error:
+                self._handle_runtime_exception(error, "chamada assíncrona à API Gemini (streaming)")
+
+            self._finish_stream(received, cache_key)
+        finally:
+            self._end_request()
+
+    async def test_connection(self) -> bool:
+        logger.info(f">>> AsyncGeminiClient test_connection: Testando com modelo '{self.model_name}'...")
+        self._request_state.reset()
+        try:
+            response = await self._generate_content_async(
+                contents="Test connection. Please respond with just 'OK'",
+                generation_config=self._build_test_generation_config(),
+            )
+            return self._finish_test_response(response)
+
+        except Exception as error:
+            self._handle_test_exception(error)
+
+    async def list_models(self, force_refresh: bool = False) -> list[str]:
+        """Modelos com generateContent visíveis para a API Key deste cliente."""
+        return await asyncio.to_thread(
+            self.model_catalog.get_generation_model_names, self.api_key, force_refresh
+        )
+
+    @staticmethod
+    async def validate_api_key(api_key: str) -> bool:
+        return await asyncio.to_thread(GeminiClient.validate_api_key, api_key)
+
+    @staticmethod
+    async def get_available_models(api_key: str) -> list[str]:
+        return await asyncio.to_thread(GeminiClient.get_available_models, api_key)
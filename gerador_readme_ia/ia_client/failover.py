@@ -0,0 +1,57 @@
+# gerador_readme_ia/ia_client/failover.py
+"""Controle de cooldown de modelos para a cadeia de failover por quota.
+
+Um modelo que acabou de responder 429 fica em cooldown e é pulado pelos
+clientes do processo até o prazo expirar.
+"""
+import logging
+import threading
+import time
+from typing import Callable, Dict
+
+from ..constants import APP_NAME
+
+logger = logging.getLogger(f"{APP_NAME}.failover")
+
+DEFAULT_QUOTA_COOLDOWN_SECONDS = 60.0
+
+
+class ModelCooldownTracker:
+    """Registra até quando cada modelo deve ser evitado."""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._until: Dict[str, float] = {}
+
+    @staticmethod
+    def _key(model_name: str) -> str:
+        return model_name.replace("models/", "")
+
+    def mark_exhausted(self, model_name: str, cooldown_seconds: float = DEFAULT_QUOTA_COOLDOWN_SECONDS) -> None:
+        with self._lock:
+            self._until[self._key(model_name)] = self._clock() + cooldown_seconds
+        logger.warning(f"Modelo '{self._key(model_name)}' em cooldown por {cooldown_seconds:.0f}s (quota).")
+
+    def remaining(self, model_name: str) -> float:
+        """Segundos restantes de cooldown (0 se o modelo está liberado)."""
+        with self._lock:
+            until = self._until.get(self._key(model_name))
+            if until is None:
+                return 0.0
+            remaining = until - self._clock()
+            if remaining <= 0:
+                del self._until[self._key(model_name)]
+                return 0.0
+            return remaining
+
+    def is_cooling_down(self, model_name: str) -> bool:
+        return self.remaining(model_name) > 0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._until.clear()
+
+
+# Compartilhado por todos os clientes do processo
+model_cooldowns = ModelCooldownTracker()
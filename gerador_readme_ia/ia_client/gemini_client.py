@@ -1,13 +1,36 @@
 # gerador_readme_ia/ia_client/gemini_client.py
+import itertools
 import logging
-from typing import Any, Optional
+import threading
+from typing import Any, Callable, Iterator, Optional, Sequence
 
 import google.generativeai as genai
-
-from ..constants import APP_NAME
+from google.api_core import exceptions as google_exceptions
+
+from ..constants import (
+    APP_NAME,
+    CHARS_PER_TOKEN,
+    DEFAULT_CONTEXT_WINDOW,
+    KNOWN_WORKING_MODELS,
+    MAX_OUTPUT_TOKENS,
+    MODEL_CONTEXT_WINDOWS,
+)
+from ..utils.cancellation import CancelToken, JobCancelledException
+from .failover import DEFAULT_QUOTA_COOLDOWN_SECONDS, model_cooldowns
+from .model_catalog import ModelCatalog, get_model_catalog
+from .rate_limiter import ModelRateLimiter, get_rate_limiter
+from .response_cache import ResponseCache
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy, get_retry_after, is_retryable_error
 
 logger = logging.getLogger(f"{APP_NAME}.gemini_client")
 
+# Fração da janela reservada para imprecisão da estimativa de tokens
+PROMPT_BUDGET_SAFETY_RATIO = 0.9
+
+# Num fallback (nunca no modelo principal), estes erros só tiram o modelo da cadeia:
+# modelos aposentados ou não liberados para a chave não devem interromper o failover
+FALLBACK_SKIP_EXCEPTIONS = (google_exceptions.NotFound, google_exceptions.PermissionDenied)
+
 class QuotaExceededException(Exception):
     """Exceção específica para quota excedida"""
     def __init__(self, message, model_name=None):
@@ -21,6 +44,15 @@ class GeminiClient:
             return model_name
         return f"models/{model_name}"
 
+    @staticmethod
+    def get_context_window(model_name: str) -> int:
+        """Janela de contexto conhecida para o modelo (prefixo mais longo)."""
+        display_name = model_name.replace("models/", "")
+        matches = [name for name in MODEL_CONTEXT_WINDOWS if display_name.startswith(name)]
+        if not matches:
+            return DEFAULT_CONTEXT_WINDOW
+        return MODEL_CONTEXT_WINDOWS[max(matches, key=len)]
+
     @staticmethod
     def _is_quota_error(error: Exception) -> bool:
         error_msg = str(error).lower()
@@ -86,13 +118,13 @@ class GeminiClient:
     def _model_supports_generation(model: Any, expected_name: str) -> bool:
         if not hasattr(model, "name") or model.name != expected_name:
             return False
-        if not hasattr(model, "supported_generation_methods"):
+        if not getattr(model, "supported_generation_methods", None):
             return True
         return "generateContent" in model.supported_generation_methods
 
     def _validate_model_availability(self, model_name: str) -> None:
         try:
-            available_models = list(genai.list_models())
+            available_models = self.model_catalog.list_models(self.api_key)
             if any(self._model_supports_generation(model, model_name) for model in available_models):
                 return
             raise ValueError(f"Modelo '{model_name}' não encontrado ou não suporta generateContent")
@@ -172,7 +204,7 @@ class GeminiClient:
     def _build_generation_config() -> Any:
         return genai.types.GenerationConfig(
             temperature=0.5,
-            max_output_tokens=8192,
+            max_output_tokens=MAX_OUTPUT_TOKENS,
             top_p=0.8,
             top_k=40,
         )
@@ -185,13 +217,167 @@ class GeminiClient:
             top_p=0.8,
         )
 
-    def _generate_content(self, contents: str, generation_config: Any) -> Any:
-        logger.debug(">>> GeminiClient: Chamando model.generate_content...")
-        response = self.model.generate_content(contents=contents, generation_config=generation_config)
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        return -(-len(text) // CHARS_PER_TOKEN)
+
+    def _generate_content(
+        self,
+        contents: str,
+        generation_config: Any,
+        stream: bool = False,
+        model_name: Optional[str] = None,
+        retry_quota: bool = True,
+    ) -> Any:
+        model_name = model_name or self.model_name
+        return self.retry_policy.call(
+            self._generate_content_once,
+            contents,
+            generation_config,
+            stream,
+            model_name,
+            description=f"generate_content ({model_name})",
+            retry_if=self._retry_predicate(retry_quota),
+        )
+
+    @classmethod
+    def _is_retryable_non_quota_error(cls, error: Exception) -> bool:
+        return is_retryable_error(error) and not cls._is_quota_error(error)
+
+    @classmethod
+    def _retry_predicate(cls, retry_quota: bool) -> Callable[[Exception], bool]:
+        return is_retryable_error if retry_quota else cls._is_retryable_non_quota_error
+
+    def _rate_limiter_for(self, model_name: str) -> ModelRateLimiter:
+        return self.rate_limiter if model_name == self.model_name else get_rate_limiter(model_name)
+
+    def _get_model(self, model_name: str) -> Any:
+        if model_name == self.model_name:
+            return self.model
+        with self._fallback_lock:
+            model = self._fallback_models.get(model_name)
+            if model is None:
+                logger.info(f">>> GeminiClient: Inicializando modelo de fallback '{model_name}'.")
+                model = genai.GenerativeModel(
+                    model_name=model_name,
+                    safety_settings=self._build_safety_settings(),
+                )
+                self._fallback_models[model_name] = model
+            return model
+
+    @staticmethod
+    def _prefetch_stream(response: Any) -> Iterator[Any]:
+        # Busca o primeiro bloco já dentro da tentativa, para que 429/5xx no
+        # início do streaming passem por retry e failover
+        chunks = iter(response)
+        first = next(chunks, None)
+        if first is None:
+            return iter(())
+        return itertools.chain([first], chunks)
+
+    def _generate_content_once(
+        self, contents: str, generation_config: Any, stream: bool, model_name: str
+    ) -> Any:
+        # Espera na fila do limitador compartilhado em vez de receber 429
+        self._raise_if_cancelled()
+        self._rate_limiter_for(model_name).acquire(self._estimate_tokens(contents))
+        self._raise_if_cancelled()
+        logger.debug(f">>> GeminiClient: Chamando generate_content em '{model_name}'...")
+        response = self._get_model(model_name).generate_content(
+            contents=contents,
+            generation_config=generation_config,
+            stream=stream,
+        )
         logger.debug(f">>> GeminiClient: Resposta bruta do Gemini: {type(response)}")
+        if stream:
+            return self._prefetch_stream(response)
         return response
 
+    def _failover_chain(self, prompt_tokens: int = 0) -> list[str]:
+        """Modelo principal seguido dos fallbacks, pulando os que estão em cooldown.
+
+        O prompt foi dimensionado para o modelo principal: fallbacks cuja janela
+        de contexto não comporta ``prompt_tokens`` mais a saída ficam de fora,
+        pois trocariam uma quota (recuperável) por um InvalidArgument.
+        """
+        required = prompt_tokens + MAX_OUTPUT_TOKENS
+        chain = [self.model_name] + [
+            name for name in self._catalog_fallbacks()
+            if name != self.model_name and self.get_context_window(name) >= required
+        ]
+        available = [name for name in chain if not model_cooldowns.is_cooling_down(name)]
+        return available or [self.model_name]
+
+    def _catalog_fallbacks(self) -> list[str]:
+        """Fallbacks que o catálogo da API Key lista com generateContent (filtrado uma vez)."""
+        if self._checked_fallbacks is not None:
+            return self._checked_fallbacks
+        try:
+            available = set(self.model_catalog.get_generation_model_names(self.api_key))
+        except Exception as error:
+            # Sem catálogo, a cadeia segue inteira; erros de fallback são pulados na chamada
+            logger.warning(f"Catálogo de modelos indisponível; fallbacks não filtrados: {error}")
+            return self.fallback_models
+        checked = [name for name in self.fallback_models if name.replace("models/", "") in available]
+        dropped = [name for name in self.fallback_models if name not in checked]
+        if dropped:
+            logger.info(f"Fallbacks fora do catálogo da API Key ignorados: {', '.join(dropped)}")
+        self._checked_fallbacks = checked
+        return checked
+
+    @staticmethod
+    def _should_skip_fallback(position: int, error: Exception) -> bool:
+        return position > 0 and isinstance(error, FALLBACK_SKIP_EXCEPTIONS)
+
+    def _generate_with_failover(self, contents: str, generation_config: Any, stream: bool = False) -> Any:
+        """Tenta o modelo principal e, em quota excedida, os próximos da cadeia."""
+        last_quota_error: Optional[Exception] = None
+        chain = self._failover_chain(self._estimate_tokens(contents))
+        for position, model_name in enumerate(chain):
+            # Com fallback disponível, quota excedida troca de modelo em vez de aguardar
+            is_last = position == len(chain) - 1
+            try:
+                response = self._generate_content(
+                    contents, generation_config, stream, model_name, retry_quota=is_last
+                )
+            except Exception as error:
+                if self._should_skip_fallback(position, error):
+                    logger.warning(f"Fallback '{model_name}' indisponível ({type(error).__name__}); tentando o próximo.")
+                    continue
+                if not self._is_quota_error(error):
+                    raise
+                self._mark_quota_exhausted(model_name, error)
+                last_quota_error = error
+                continue
+            self._record_served_model(model_name)
+            return response
+        raise last_quota_error
+
+    @staticmethod
+    def _mark_quota_exhausted(model_name: str, error: Exception) -> None:
+        model_cooldowns.mark_exhausted(model_name, get_retry_after(error) or DEFAULT_QUOTA_COOLDOWN_SECONDS)
+
+    def _record_served_model(self, model_name: str) -> None:
+        self._request_state.served_by = model_name.replace("models/", "")
+        if model_name != self.model_name:
+            logger.warning(
+                f"Failover: requisição atendida por '{model_name}' (principal: '{self.model_name}')."
+            )
+
+    @property
+    def last_response_cached(self) -> bool:
+        """Se a última chamada desta thread foi atendida pelo cache de respostas."""
+        return getattr(self._request_state, "cached", False)
+
+    @property
+    def last_served_model(self) -> Optional[str]:
+        """Modelo que atendeu a última chamada desta thread (sem prefixo ``models/``)."""
+        return getattr(self._request_state, "served_by", None)
+
     def _handle_runtime_exception(self, error: Exception, operation: str) -> None:
+        if isinstance(error, JobCancelledException):
+            logger.info(f"{operation} cancelada (modelo {self.model_name}).")
+            raise
         if self._is_quota_error(error):
             self._raise_quota_exception(self.model_name, error)
         logger.error(
@@ -200,13 +386,35 @@ class GeminiClient:
         )
         raise
 
-    def __init__(self, api_key: str, model_name: str):
+    def __init__(
+        self,
+        api_key: str,
+        model_name: str,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[ModelRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        fallback_models: Optional[Sequence[str]] = None,
+        model_catalog: Optional[ModelCatalog] = None,
+    ):
         logger.info(f">>> GeminiClient __init__: Iniciando com modelo '{model_name}' e API Key fornecida.")
         self._validate_init_inputs(api_key, model_name)
 
         normalized_model_name = self._normalize_model_name(model_name)
         self.api_key = api_key
         self.model_name = normalized_model_name
+        self.response_cache = response_cache
+        self.rate_limiter = rate_limiter or get_rate_limiter(normalized_model_name)
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.model_catalog = model_catalog or get_model_catalog()
+        # Cadeia de failover por quota; lista vazia desativa
+        if fallback_models is None:
+            fallback_models = KNOWN_WORKING_MODELS
+        self.fallback_models = [self._normalize_model_name(name) for name in fallback_models]
+        self._fallback_models: dict[str, Any] = {}
+        self._checked_fallbacks: Optional[list[str]] = None
+        self._fallback_lock = threading.Lock()
+        # Estado por thread: o mesmo cliente pode ser usado por vários workers
+        self._request_state = threading.local()
 
         try:
             logger.debug(">>> GeminiClient __init__: Configurando genai...")
@@ -227,50 +435,184 @@ class GeminiClient:
             mapped_error = self._map_init_exception(normalized_model_name, error)
             raise mapped_error from error
 
-    def send_conversational_prompt(self, prompt_text: str) -> Optional[str]:
+    def _get_cached_response(self, cache_key: str) -> Optional[str]:
+        cached = self.response_cache.get(cache_key)
+        rate = self.response_cache.hit_rate * 100
+        if cached is not None:
+            logger.info(f"Cache de respostas: HIT ({cache_key[:12]}…). Taxa de acerto: {rate:.0f}%.")
+        else:
+            logger.info(f"Cache de respostas: MISS ({cache_key[:12]}…). Taxa de acerto: {rate:.0f}%.")
+        return cached
+
+    def _begin_request(
+        self,
+        prompt_text: str,
+        generation_config: Any,
+        use_cache: bool,
+        cancel_token: Optional[CancelToken] = None,
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Zera o estado da requisição e consulta o cache: ``(chave, resposta em cache)``.
+
+        O ``cancel_token`` só fica associado à thread depois desta verificação e
+        até :meth:`_end_request`, chamado ao fim de toda requisição.
+        """
+        self._reset_request_state()
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+        self._request_state.cancel_token = cancel_token
+        if not use_cache or self.response_cache is None:
+            return None, None
+        cache_key = ResponseCache.build_key(self.model_name, generation_config, prompt_text)
+        cached = self._get_cached_response(cache_key)
+        if cached is not None:
+            self._request_state.cached = True
+        return cache_key, cached
+
+    def _reset_request_state(self) -> None:
+        self._request_state.cached = False
+        self._request_state.served_by = None
+        self._request_state.cancel_token = None
+
+    def _end_request(self) -> None:
+        # O token é do job: não pode sobreviver numa thread reaproveitada pelo executor
+        self._request_state.cancel_token = None
+
+    def _finish_response(self, response: Any, cache_key: Optional[str]) -> Optional[str]:
+        self._raise_if_blocked(response, "Solicitação")
+        response_text = self._extract_response_text(response)
+        if response_text:
+            logger.info("Resposta textual recebida do Gemini.")
+            if cache_key is not None:
+                self.response_cache.put(cache_key, self.last_served_model, response_text)
+            return response_text
+
+        logger.warning("Resposta do Gemini não continha conteúdo textual esperado.")
+        return None
+
+    def _finish_stream(self, received: list[str], cache_key: Optional[str]) -> None:
+        if not received:
+            logger.warning("Streaming do Gemini terminou sem conteúdo textual.")
+            return
+        logger.info(f"Streaming concluído: {len(received)} blocos recebidos do Gemini.")
+        if cache_key is not None:
+            self.response_cache.put(cache_key, self.last_served_model, "".join(received))
+
+    def _raise_if_cancelled(self) -> None:
+        """Verificação de cancelamento da requisição atual (thread ou tarefa)."""
+        cancel_token = getattr(self._request_state, "cancel_token", None)
+        if cancel_token is not None:
+            cancel_token.raise_if_cancelled()
+
+    def send_conversational_prompt(
+        self, prompt_text: str, use_cache: bool = True, cancel_token: Optional[CancelToken] = None
+    ) -> Optional[str]:
+        """Envia o prompt; com ``use_cache`` e um ``response_cache`` configurado,
+        prompts idênticos (mesmo modelo e configuração) retornam do cache.
+
+        ``cancel_token`` é verificado antes de cada tentativa e após a fila do
+        limitador de taxa; uma chamada já em voo não é interrompida.
+        """
         logger.info(f"Enviando prompt para o modelo: {self.model_name}. Tamanho (aprox): {len(prompt_text):,} chars.")
+        generation_config = self._build_generation_config()
+        cache_key, cached = self._begin_request(prompt_text, generation_config, use_cache, cancel_token)
         try:
-            response = self._generate_content(
-                contents=prompt_text,
-                generation_config=self._build_generation_config(),
-            )
+            if cached is not None:
+                return cached
+            response = self._generate_with_failover(prompt_text, generation_config)
+            return self._finish_response(response, cache_key)
 
-            self._raise_if_blocked(response, "Solicitação")
-            response_text = self._extract_response_text(response)
-            if response_text:
-                logger.info("Resposta textual recebida do Gemini.")
-                return response_text
+        except Exception as error:
+            self._handle_runtime_exception(error, "chamada à API Gemini")
+        finally:
+            self._end_request()
 
-            logger.warning("Resposta do Gemini não continha conteúdo textual esperado.")
+    @classmethod
+    def _extract_chunk_text(cls, chunk: Any) -> Optional[str]:
+        # Blocos finais do streaming podem vir sem partes; ``.text`` levanta ValueError
+        try:
+            return cls._extract_response_text(chunk)
+        except ValueError:
             return None
 
+    def stream_conversational_prompt(
+        self, prompt_text: str, use_cache: bool = True, cancel_token: Optional[CancelToken] = None
+    ) -> Iterator[str]:
+        """Versão em streaming de :meth:`send_conversational_prompt`: produz deltas de texto.
+
+        Um acerto de cache é entregue como um único delta; a resposta completa
+        só é gravada no cache quando o streaming termina sem erro. Com
+        ``cancel_token``, o cancelamento também é verificado a cada bloco.
+        """
+        logger.info(f"Enviando prompt (streaming) para o modelo: {self.model_name}. Tamanho (aprox): {len(prompt_text):,} chars.")
+        generation_config = self._build_generation_config()
+        cache_key, cached = self._begin_request(prompt_text, generation_config, use_cache, cancel_token)
+        try:
+            if cached is not None:
+                yield cached
+                return
+            yield from self._stream_response(prompt_text, generation_config, cache_key)
+        finally:
+            self._end_request()
+
+    def _stream_response(
+        self, prompt_text: str, generation_config: Any, cache_key: Optional[str]
+    ) -> Iterator[str]:
+        received: list[str] = []
+        try:
+            response = self._generate_with_failover(prompt_text, generation_config, stream=True)
+            for chunk in response:
+                self._raise_if_cancelled()
+                self._raise_if_blocked(chunk, "Solicitação")
+                delta = self._extract_chunk_text(chunk)
+                if delta:
+                    received.append(delta)
+                    yield delta
+
         except Exception as error:
-            self._handle_runtime_exception(error, "chamada à API Gemini")
+            self._handle_runtime_exception(error, "chamada à API Gemini (streaming)")
+
+        self._finish_stream(received, cache_key)
 
     def test_connection(self) -> bool:
         logger.info(f">>> GeminiClient test_connection: Testando com modelo '{self.model_name}'...")
+        # Sem job: nada de token ou estado deixado por uma geração anterior nesta thread
+        self._reset_request_state()
         try:
             response = self._generate_content(
                 contents="Test connection. Please respond with just 'OK'",
                 generation_config=self._build_test_generation_config(),
             )
-
-            self._raise_if_blocked(response, "Prompt de teste")
-            if self._extract_response_text(response):
-                logger.info(f">>> GeminiClient test_connection: Resposta recebida de '{self.model_name}'. Conexão OK.")
-                return True
-            logger.warning(">>> GeminiClient test_connection: Resposta vazia, mas sem erro de API. Considerando conexão OK.")
-            return True
+            return self._finish_test_response(response)
                 
         except Exception as error:
-            logger.error(
-                f">>> GeminiClient test_connection: EXCEÇÃO CRÍTICA no teste: {type(error).__name__} - {error}",
-                exc_info=True,
-            )
-            mapped_error = self._map_test_connection_exception(error)
-            if mapped_error is error:
-                raise
-            raise mapped_error from error
+            self._handle_test_exception(error)
+
+    def _finish_test_response(self, response: Any) -> bool:
+        self._raise_if_blocked(response, "Prompt de teste")
+        if self._extract_response_text(response):
+            logger.info(f">>> GeminiClient test_connection: Resposta recebida de '{self.model_name}'. Conexão OK.")
+            return True
+        logger.warning(">>> GeminiClient test_connection: Resposta vazia, mas sem erro de API. Considerando conexão OK.")
+        return True
+
+    def _handle_test_exception(self, error: Exception) -> None:
+        logger.error(
+            f">>> GeminiClient test_connection: EXCEÇÃO CRÍTICA no teste: {type(error).__name__} - {error}",
+            exc_info=True,
+        )
+        mapped_error = self._map_test_connection_exception(error)
+        if mapped_error is error:
+            raise
+        raise mapped_error from error
+
+    def get_prompt_token_budget(self) -> int:
+        """Tokens disponíveis para o prompt no modelo atual, já descontada a saída."""
+        available = self.get_context_window(self.model_name) - MAX_OUTPUT_TOKENS
+        return max(0, int(available * PROMPT_BUDGET_SAFETY_RATIO))
+
+    def get_rate_limit_status(self) -> dict[str, float]:
+        """Níveis dos buckets RPM/TPM e tempos de espera na fila do modelo atual."""
+        return self.rate_limiter.snapshot()
 
     def close(self):
         logger.info(f"Cliente Gemini ({self.model_name}) 'fechado'.")
@@ -279,9 +621,8 @@ class GeminiClient:
     def validate_api_key(api_key: str) -> bool:
         """Valida uma API Key sem criar uma instância completa"""
         try:
-            genai.configure(api_key=api_key)
-            # Tenta listar modelos como teste básico
-            models = list(genai.list_models())
+            # Usa o catálogo em cache; só lista na rede se o TTL expirou
+            models = get_model_catalog().list_models(api_key)
             return len(models) > 0
         except Exception:
             return False
@@ -290,9 +631,7 @@ class GeminiClient:
     def get_available_models(api_key: str) -> list[str]:
         """Obtém lista de modelos disponíveis"""
         try:
-            genai.configure(api_key=api_key)
-            models_data = list(genai.list_models())
-            available_models = []
+            available_models = get_model_catalog().get_generation_model_names(api_key)
             
             # Modelos conhecidos que funcionam bem (fallback)
             known_working_models = [
@@ -302,21 +641,6 @@ class GeminiClient:
                 'gemini-2.0-flash-exp'
             ]
             
-            for model in models_data:
-                if hasattr(model, 'name'):
-                    model_name = model.name
-                    
-                    # Filtrar apenas modelos que suportam generateContent
-                    if hasattr(model, 'supported_generation_methods'):
-                        if 'generateContent' in model.supported_generation_methods:
-                            # Remover prefixo models/ para exibição
-                            display_name = model_name.replace('models/', '') if model_name.startswith('models/') else model_name
-                            available_models.append(display_name)
-                    else:
-                        # Se não tem info sobre métodos, incluir mesmo assim
-                        display_name = model_name.replace('models/', '') if model_name.startswith('models/') else model_name
-                        available_models.append(display_name)
-            
             # Se não encontrou modelos, usar lista conhecida
             if not available_models:
                 logger.warning("Nenhum modelo encontrado via API, usando lista conhecida")
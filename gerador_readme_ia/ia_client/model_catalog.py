@@ -0,0 +1,175 @@
+# gerador_readme_ia/ia_client/model_catalog.py
+"""Catálogo de modelos do Gemini com cache em memória e em disco.
+
+``genai.list_models()`` é uma ida à rede; validação da API Key, criação do
+cliente e o diálogo de modelos consultam este catálogo, que lista no máximo
+uma vez por janela de TTL para cada chave. O cache é indexado pelo hash da
+API Key — a chave em si nunca é gravada em disco.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import google.generativeai as genai
+from appdirs import user_cache_dir
+
+from ..constants import APP_AUTHOR, APP_NAME
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy
+
+logger = logging.getLogger(f"{APP_NAME}.model_catalog")
+
+DEFAULT_CATALOG_TTL_SECONDS = 6 * 60 * 60
+CATALOG_CACHE_DIR_NAME = "models"
+
+
+class CatalogModel(NamedTuple):
+    """Dados do modelo que o app usa (o objeto do SDK não é serializável)."""
+    name: str
+    supported_generation_methods: Tuple[str, ...] = ()
+
+    @property
+    def display_name(self) -> str:
+        return self.name.replace("models/", "")
+
+    @property
+    def supports_generation(self) -> bool:
+        # Sem informação de métodos, o modelo é mantido (comportamento anterior)
+        return not self.supported_generation_methods or "generateContent" in self.supported_generation_methods
+
+
+class ModelCatalog:
+    """Lista de modelos por API Key, reaproveitada enquanto o TTL não expira."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl_seconds: float = DEFAULT_CATALOG_TTL_SECONDS,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.retry_policy = retry_policy
+        self._clock = clock
+        # Um único lock: chamadas simultâneas esperam a listagem em curso
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, List[CatalogModel]]] = {}
+        self.fetch_count = 0
+
+    @staticmethod
+    def key_hash(api_key: str) -> str:
+        return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+    def _cache_path(self, key_hash: str) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        return os.path.join(self.cache_dir, f"{key_hash[:32]}.json")
+
+    def _is_fresh(self, fetched_at: float) -> bool:
+        return self._clock() - fetched_at < self.ttl_seconds
+
+    def _load_from_disk(self, key_hash: str) -> Optional[Tuple[float, List[CatalogModel]]]:
+        path = self._cache_path(key_hash)
+        if path is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+            if payload.get("key_hash") != key_hash:
+                return None
+            models = [CatalogModel(name, tuple(methods)) for name, methods in payload["models"]]
+            return float(payload["fetched_at"]), models
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Cache de modelos ilegível ({path}): {e}")
+            return None
+
+    def _save_to_disk(self, key_hash: str, fetched_at: float, models: List[CatalogModel]) -> None:
+        path = self._cache_path(key_hash)
+        if path is None:
+            return
+        payload = {
+            "key_hash": key_hash,
+            "fetched_at": fetched_at,
+            "models": [[model.name, list(model.supported_generation_methods)] for model in models],
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar o cache de modelos: {e}")
+
+    def _fetch(self, api_key: str) -> List[CatalogModel]:
+        genai.configure(api_key=api_key)
+        raw_models = self.retry_policy.call(lambda: list(genai.list_models()), description="list_models")
+        self.fetch_count += 1
+        return [
+            CatalogModel(model.name, tuple(getattr(model, "supported_generation_methods", None) or ()))
+            for model in raw_models
+            if getattr(model, "name", None)
+        ]
+
+    def list_models(self, api_key: str, force_refresh: bool = False) -> List[CatalogModel]:
+        """Modelos visíveis para a API Key; só vai à rede se o cache expirou."""
+        key_hash = self.key_hash(api_key)
+        with self._lock:
+            if not force_refresh:
+                entry = self._entries.get(key_hash)
+                if entry is None:
+                    entry = self._load_from_disk(key_hash)
+                    if entry is not None and self._is_fresh(entry[0]):
+                        logger.debug("Catálogo de modelos carregado do disco.")
+                        self._entries[key_hash] = entry
+                if entry is not None and self._is_fresh(entry[0]):
+                    return list(entry[1])
+
+            models = self._fetch(api_key)
+            fetched_at = self._clock()
+            self._entries[key_hash] = (fetched_at, models)
+            self._save_to_disk(key_hash, fetched_at, models)
+            logger.info(f"Catálogo de modelos atualizado: {len(models)} modelos.")
+            return list(models)
+
+    def get_generation_model_names(self, api_key: str, force_refresh: bool = False) -> List[str]:
+        """Nomes de exibição (sem ``models/``) dos modelos que suportam generateContent."""
+        return [
+            model.display_name
+            for model in self.list_models(api_key, force_refresh)
+            if model.supports_generation
+        ]
+
+    def invalidate(self, api_key: Optional[str] = None) -> None:
+        """Descarta o cache de uma chave (ou de todas, em memória)."""
+        with self._lock:
+            if api_key is None:
+                self._entries.clear()
+                return
+            key_hash = self.key_hash(api_key)
+            self._entries.pop(key_hash, None)
+            path = self._cache_path(key_hash)
+            if path is not None and os.path.exists(path):
+                try:
+                    os.remove(path)
+                except OSError as e:
+                    logger.warning(f"Não foi possível remover o cache de modelos: {e}")
+
+
+_default_catalog: Optional[ModelCatalog] = None
+_default_catalog_lock = threading.Lock()
+
+
+def get_model_catalog() -> ModelCatalog:
+    """Catálogo compartilhado pelo processo, persistido no cache do usuário."""
+    global _default_catalog
+    with _default_catalog_lock:
+        if _default_catalog is None:
+            _default_catalog = ModelCatalog(
+                os.path.join(user_cache_dir(APP_NAME, APP_AUTHOR), CATALOG_CACHE_DIR_NAME)
+            )
+        return _default_catalog
@@ -0,0 +1,206 @@
+# gerador_readme_ia/ia_client/rate_limiter.py
+"""Limitador de taxa no cliente (RPM e TPM por modelo) compartilhado no processo.
+
+Cada modelo tem dois token buckets: um de requisições por minuto e outro de
+tokens por minuto. Quem chama ``acquire`` entra numa fila FIFO e espera a
+vez, em vez de estourar a quota e receber 429.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+from ..constants import APP_NAME, DEFAULT_MODEL_RATE_LIMITS, MODEL_RATE_LIMITS
+
+logger = logging.getLogger(f"{APP_NAME}.rate_limiter")
+
+# Intervalo de nova verificação de corrotinas enquanto há chamadores síncronos na fila
+ASYNC_POLL_INTERVAL = 0.05
+
+
+class TokenBucket:
+    """Bucket que reabastece ``capacity`` unidades a cada ``period`` segundos.
+
+    Não é thread-safe; o :class:`ModelRateLimiter` serializa o acesso.
+    """
+
+    def __init__(self, capacity: float, period: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period
+        self._clock = clock
+        self._level = self.capacity
+        self._updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._level = min(self.capacity, self._level + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    @property
+    def level(self) -> float:
+        self._refill()
+        return self._level
+
+    def time_until(self, amount: float) -> float:
+        """Segundos até haver ``amount`` disponível (0 se já houver)."""
+        self._refill()
+        # Pedidos maiores que o bucket esperam apenas até ele encher
+        amount = min(amount, self.capacity)
+        if self._level >= amount:
+            return 0.0
+        return (amount - self._level) / self.rate
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self._level -= min(amount, self.capacity)
+
+
+class ModelRateLimiter:
+    """Limites RPM/TPM de um modelo, com fila FIFO de chamadores."""
+
+    def __init__(
+        self,
+        model_name: str,
+        requests_per_minute: float,
+        tokens_per_minute: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Optional[Callable[[float], None]] = None,
+    ):
+        self.model_name = model_name
+        self._clock = clock
+        self._requests = TokenBucket(requests_per_minute, clock=clock)
+        self._tokens = TokenBucket(tokens_per_minute, clock=clock)
+        self._condition = threading.Condition()
+        self._sleep = sleep
+        self._queue: deque = deque()
+        self._next_ticket = 0
+        self.total_requests = 0
+        self.total_wait_seconds = 0.0
+        self.last_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _wait(self, seconds: float) -> None:
+        if self._sleep is not None:
+            # Relógio/sono injetados (testes): libera o lock enquanto "dorme"
+            self._condition.release()
+            try:
+                self._sleep(seconds)
+            finally:
+                self._condition.acquire()
+        else:
+            self._condition.wait(timeout=seconds)
+
+    def _record_wait(self, started_at: float) -> float:
+        waited = self._clock() - started_at
+        self.total_requests += 1
+        self.total_wait_seconds += waited
+        self.last_wait_seconds = waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return waited
+
+    def acquire(self, estimated_tokens: int = 0) -> float:
+        """Bloqueia até a requisição caber nos dois buckets; retorna a espera (s)."""
+        started_at = self._clock()
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self._queue.append(ticket)
+            try:
+                while True:
+                    if self._queue[0] == ticket:
+                        delay = max(
+                            self._requests.time_until(1),
+                            self._tokens.time_until(estimated_tokens),
+                        )
+                        if delay <= 0:
+                            self._requests.consume(1)
+                            self._tokens.consume(estimated_tokens)
+                            break
+                        self._wait(delay)
+                    else:
+                        self._condition.wait()
+            finally:
+                self._queue.remove(ticket)
+                self._condition.notify_all()
+
+            waited = self._record_wait(started_at)
+
+        if waited > 0.05:
+            logger.info(f"Rate limiter ({self.model_name}): requisição aguardou {waited:.2f}s na fila.")
+        return waited
+
+    async def acquire_async(self, estimated_tokens: int = 0) -> float:
+        """Versão assíncrona de :meth:`acquire`: espera com ``asyncio.sleep``.
+
+        Chamadores síncronos já na fila têm prioridade; a corrotina só consome
+        dos buckets quando a fila está vazia.
+        """
+        started_at = self._clock()
+        while True:
+            with self._condition:
+                delay = ASYNC_POLL_INTERVAL
+                if not self._queue:
+                    delay = max(
+                        self._requests.time_until(1),
+                        self._tokens.time_until(estimated_tokens),
+                    )
+                    if delay <= 0:
+                        self._requests.consume(1)
+                        self._tokens.consume(estimated_tokens)
+                        waited = self._record_wait(started_at)
+                        break
+            await asyncio.sleep(delay)
+
+        if waited > 0.05:
+            logger.info(f"Rate limiter ({self.model_name}): requisição assíncrona aguardou {waited:.2f}s.")
+        return waited
+
+    def snapshot(self) -> Dict[str, float]:
+        """Níveis atuais dos buckets e métricas de espera, para monitoramento."""
+        with self._condition:
+            average_wait = self.total_wait_seconds / self.total_requests if self.total_requests else 0.0
+            return {
+                "requests_available": self._requests.level,
+                "requests_capacity": self._requests.capacity,
+                "tokens_available": self._tokens.level,
+                "tokens_capacity": self._tokens.capacity,
+                "queue_length": len(self._queue),
+                "total_requests": self.total_requests,
+                "last_wait_seconds": self.last_wait_seconds,
+                "average_wait_seconds": average_wait,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+
+_registry: Dict[str, ModelRateLimiter] = {}
+_registry_lock = threading.Lock()
+
+
+def get_model_limits(model_name: str) -> Tuple[float, float]:
+    """(RPM, TPM) configurados para o modelo, pelo prefixo mais longo conhecido."""
+    display_name = model_name.replace("models/", "")
+    matches = [name for name in MODEL_RATE_LIMITS if display_name.startswith(name)]
+    if not matches:
+        return DEFAULT_MODEL_RATE_LIMITS
+    return MODEL_RATE_LIMITS[max(matches, key=len)]
+
+
+def get_rate_limiter(model_name: str) -> ModelRateLimiter:
+    """Limitador compartilhado por todos os clientes do processo para o modelo."""
+    display_name = model_name.replace("models/", "")
+    with _registry_lock:
+        limiter = _registry.get(display_name)
+        if limiter is None:
+            requests_per_minute, tokens_per_minute = get_model_limits(display_name)
+            limiter = ModelRateLimiter(display_name, requests_per_minute, tokens_per_minute)
+            _registry[display_name] = limiter
+        return limiter
+
+
+def get_rate_limiter_snapshots() -> Dict[str, Dict[str, float]]:
+    """Snapshot de todos os limitadores ativos no processo."""
+    with _registry_lock:
+        limiters = list(_registry.values())
+    return {limiter.model_name: limiter.snapshot() for limiter in limiters}
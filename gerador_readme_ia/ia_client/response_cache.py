@@ -0,0 +1,126 @@
+# gerador_readme_ia/ia_client/response_cache.py
+"""Cache local (SQLite) de respostas do Gemini, com TTL e limite de tamanho."""
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from ..constants import APP_NAME
+
+logger = logging.getLogger(f"{APP_NAME}.response_cache")
+
+RESPONSE_CACHE_FILE_NAME = "responses.sqlite3"
+DEFAULT_RESPONSE_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_RESPONSE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+class ResponseCache:
+    """Guarda respostas por hash de (modelo, configuração de geração, prompt).
+
+    Entradas expiram após ``ttl_seconds``; acima de ``max_bytes`` as menos
+    acessadas são removidas. Contadores de acertos/erros permitem medir a taxa
+    de acerto pelos logs.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        ttl_seconds: float = DEFAULT_RESPONSE_TTL_SECONDS,
+        max_bytes: int = DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+    ):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " model TEXT NOT NULL,"
+            " response TEXT NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _serialize_generation_config(generation_config: Any) -> Any:
+        if dataclasses.is_dataclass(generation_config):
+            return dataclasses.asdict(generation_config)
+        if isinstance(generation_config, dict):
+            return generation_config
+        return repr(generation_config)
+
+    @classmethod
+    def build_key(cls, model_name: str, generation_config: Any, prompt_text: str) -> str:
+        payload = json.dumps(
+            {
+                "model": model_name,
+                "generation_config": cls._serialize_generation_config(generation_config),
+                "prompt": prompt_text,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key: str) -> Optional[str]:
+        """Resposta em cache ainda válida, ou ``None``."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self.hits += 1
+            return row[0]
+
+    def put(self, key: str, model_name: str, response_text: str) -> None:
+        now = time.time()
+        size = len(response_text.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, model, response, size, created_at, last_access)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, model_name, response_text, size, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        self._conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            logger.debug(f"Resposta removida do cache (limite de tamanho): {key[:12]}…")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
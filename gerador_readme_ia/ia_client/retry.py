@@ -0,0 +1,158 @@
+# gerador_readme_ia/ia_client/retry.py
+"""Política de retentativas com backoff exponencial e jitter para o Gemini.
+
+Erros transitórios (429, 5xx, timeouts) são repetidos; erros definitivos
+(401/403, modelo inexistente, prompt bloqueado) sobem na primeira tentativa.
+Uma dica de espera presente no erro (``retry_delay``/"retry in Xs") tem
+prioridade sobre o backoff calculado.
+"""
+import asyncio
+import logging
+import random
+import re
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from google.api_core import exceptions as google_exceptions
+
+from ..constants import APP_NAME
+from ..utils.cancellation import JobCancelledException
+
+logger = logging.getLogger(f"{APP_NAME}.retry")
+
+T = TypeVar("T")
+
+RETRYABLE_EXCEPTIONS = (
+    google_exceptions.TooManyRequests,
+    google_exceptions.ResourceExhausted,
+    google_exceptions.InternalServerError,
+    google_exceptions.BadGateway,
+    google_exceptions.ServiceUnavailable,
+    google_exceptions.GatewayTimeout,
+    google_exceptions.DeadlineExceeded,
+    TimeoutError,
+    ConnectionResetError,
+)
+
+FATAL_EXCEPTIONS = (
+    JobCancelledException,
+    google_exceptions.Unauthenticated,
+    google_exceptions.PermissionDenied,
+    google_exceptions.NotFound,
+    google_exceptions.InvalidArgument,
+    ValueError,  # prompt bloqueado / resposta inválida
+)
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+_RETRYABLE_MESSAGE_MARKERS = ("429", "quota", "rate limit", "503", "unavailable", "timed out", "timeout", "deadline")
+_RETRY_AFTER_PATTERNS = (
+    re.compile(r"retry[_ ]delay\s*\{\s*seconds:\s*(\d+(?:\.\d+)?)", re.IGNORECASE),
+    re.compile(r"retry (?:in|after) (\d+(?:\.\d+)?)\s*s", re.IGNORECASE),
+)
+
+
+def is_retryable_error(error: Exception) -> bool:
+    """Classifica o erro como transitório (vale repetir) ou definitivo."""
+    if isinstance(error, FATAL_EXCEPTIONS):
+        return False
+    if isinstance(error, RETRYABLE_EXCEPTIONS):
+        return True
+    code = getattr(error, "code", None)
+    if isinstance(code, int):
+        return code in RETRYABLE_STATUS_CODES
+    error_msg = str(error).lower()
+    return any(marker in error_msg for marker in _RETRYABLE_MESSAGE_MARKERS)
+
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """Segundos sugeridos pelo servidor antes de tentar de novo, se houver."""
+    retry_after = getattr(error, "retry_after", None)
+    if isinstance(retry_after, (int, float)):
+        return float(retry_after)
+    error_msg = str(error)
+    for pattern in _RETRY_AFTER_PATTERNS:
+        match = pattern.search(error_msg)
+        if match:
+            return float(match.group(1))
+    return None
+
+
+class RetryPolicy:
+    """Executa chamadas repetindo erros transitórios com backoff exponencial."""
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: float = 0.5,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+        async_sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self._sleep = sleep
+        self._async_sleep = async_sleep
+        self._rng = rng
+
+    def compute_delay(self, attempt: int, error: Exception) -> float:
+        """Espera antes da tentativa ``attempt + 1`` (``attempt`` começa em 1)."""
+        retry_after = get_retry_after(error)
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        # Jitter proporcional espalha clientes que falharam juntos
+        return backoff * (1 - self.jitter + self.jitter * self._rng())
+
+    def call(
+        self,
+        func: Callable[..., T],
+        *args,
+        description: str = "chamada ao Gemini",
+        retry_if: Callable[[Exception], bool] = is_retryable_error,
+        **kwargs,
+    ) -> T:
+        attempt = 1
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as error:
+                if attempt >= self.max_attempts or not retry_if(error):
+                    raise
+                delay = self.compute_delay(attempt, error)
+                logger.warning(
+                    f"{description}: tentativa {attempt}/{self.max_attempts} falhou "
+                    f"({type(error).__name__}: {error}). Nova tentativa em {delay:.1f}s."
+                )
+                self._sleep(delay)
+                attempt += 1
+
+    async def call_async(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args,
+        description: str = "chamada ao Gemini",
+        retry_if: Callable[[Exception], bool] = is_retryable_error,
+        **kwargs,
+    ) -> T:
+        """Versão de :meth:`call` para corrotinas; espera sem bloquear o event loop."""
+        attempt = 1
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except Exception as error:
+                if attempt >= self.max_attempts or not retry_if(error):
+                    raise
+                delay = self.compute_delay(attempt, error)
+                logger.warning(
+                    f"{description}: tentativa {attempt}/{self.max_attempts} falhou "
+                    f"({type(error).__name__}: {error}). Nova tentativa em {delay:.1f}s."
+                )
+                await self._async_sleep(delay)
+                attempt += 1
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
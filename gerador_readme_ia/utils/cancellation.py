@@ -0,0 +1,33 @@
+# gerador_readme_ia/utils/cancellation.py
+"""Cancelamento cooperativo de trabalhos longos (extração e chamadas à IA).
+
+A GUI cria um :class:`CancelToken` por job; extrator e cliente Gemini chamam
+``raise_if_cancelled()`` entre membros, trechos e tentativas, de modo que o
+cancelamento vale em milissegundos sem matar threads.
+"""
+import threading
+
+
+class JobCancelledException(Exception):
+    """Levantada no ponto de verificação seguinte a um ``CancelToken.cancel()``."""
+
+    def __init__(self, message: str = "Operação cancelada pelo usuário"):
+        super().__init__(message)
+
+
+class CancelToken:
+    """Sinal de cancelamento compartilhado entre a UI e as threads de trabalho."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise JobCancelledException()
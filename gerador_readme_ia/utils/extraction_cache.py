@@ -0,0 +1,154 @@
+# gerador_readme_ia/utils/extraction_cache.py
+"""Cache em disco, endereçado por conteúdo, dos dados extraídos de um ZIP."""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+from ..constants import APP_NAME
+from .sources import open_source
+
+logger = logging.getLogger(f"{APP_NAME}.extraction_cache")
+
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_FILE_SUFFIX = ".txt"
+
+# Incrementar quando o formato da extração mudar, invalidando entradas antigas
+CACHE_FORMAT_VERSION = 3
+
+# Chaves de configuração que alteram o resultado da extração
+EXTRACTION_CONFIG_KEYS = (
+    "max_files",
+    "max_file_size_kb",
+    "include_tests",
+    "include_docs",
+    "include_config",
+    "respect_gitignore",
+)
+
+
+class ExtractionCache:
+    """Guarda o texto extraído por chave de arquivo + configuração, com despejo LRU.
+
+    O uso recente é registrado no ``mtime`` de cada entrada; quando o total
+    ultrapassa ``max_bytes``, as entradas menos usadas são removidas. O total é
+    mantido em memória, então o diretório só é varrido na primeira gravação e
+    quando o limite é de fato excedido.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._lock = threading.Lock()
+        # None até a primeira varredura; jobs da fila compartilham a instância
+        self._total_bytes: Optional[int] = None
+
+    @staticmethod
+    def build_key(zip_path: str, config: Dict[str, object]) -> str:
+        """Chave a partir de tamanho, mtime e CRCs do diretório central (sem descompactar).
+
+        Também aceita pastas e tarballs (ver :func:`open_source`).
+        """
+        stat = os.stat(zip_path)
+        with open_source(zip_path) as source:
+            central_directory = source.fingerprint()
+        payload = {
+            "version": CACHE_FORMAT_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "members": central_directory,
+            "config": {key: config.get(key) for key in EXTRACTION_CONFIG_KEYS},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + CACHE_FILE_SUFFIX)
+
+    def get(self, key: str) -> Optional[str]:
+        """Retorna os dados em cache (marcando uso recente) ou ``None``."""
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = f.read()
+            os.utime(path, None)
+            return data
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Falha ao ler cache de extração {path}: {e}")
+            return None
+
+    def put(self, key: str, data: str) -> None:
+        """Grava a entrada de forma atômica e aplica o limite de tamanho."""
+        path = self._entry_path(key)
+        encoded = data.encode("utf-8")
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+            with self._lock:
+                replaced = self._file_size(path)
+                os.replace(tmp_path, path)
+                if self._total_bytes is not None:
+                    self._total_bytes += len(encoded) - replaced
+        except OSError as e:
+            logger.warning(f"Falha ao gravar cache de extração: {e}")
+            return
+        with self._lock:
+            if self._total_bytes is None or self._total_bytes > self.max_bytes:
+                self._evict()
+
+    @staticmethod
+    def _file_size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    def _evict(self) -> None:
+        """Varre o diretório, recalcula o total e remove as entradas menos usadas.
+
+        Outro processo pode remover entradas durante a varredura; elas apenas
+        deixam de contar.
+        """
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(CACHE_FILE_SUFFIX):
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                logger.debug(f"Entrada de cache removida (LRU): {path}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Não foi possível remover entrada de cache {path}: {e}")
+                continue
+            total -= size
+        self._total_bytes = total
+
+    def clear(self) -> None:
+        """Remove todas as entradas."""
+        with self._lock:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith(CACHE_FILE_SUFFIX):
+                        try:
+                            os.remove(entry.path)
+                        except FileNotFoundError:
+                            pass
+            self._total_bytes = 0
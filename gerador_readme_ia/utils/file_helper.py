@@ -3,6 +3,7 @@ import logging
 from pathlib import Path
 
 from ..constants import APP_NAME
+from .sources import source_stem
 
 # Obter o logger configurado para este módulo
 logger = logging.getLogger(f"{APP_NAME}.file_helper")
@@ -21,7 +22,7 @@ def get_readme_output_filename(zip_file_basename: str, output_dir: str) -> str:
             logger.error(f"Não foi possível criar o diretório de saída '{output_dir}': {e}. Usando diretório atual como fallback.", exc_info=True)
             output_path = Path(".")
 
-    base_name_for_readme = Path(zip_file_basename).stem
+    base_name_for_readme = source_stem(zip_file_basename)
 
     output_filename = output_path / f"{base_name_for_readme}_README.md"
     
@@ -0,0 +1,194 @@
+# gerador_readme_ia/utils/ignore_rules.py
+"""Regras de ``.gitignore`` aplicadas aos membros antes de qualquer leitura.
+
+Os ``.gitignore`` encontrados no projeto (em qualquer pasta) e uma lista
+padrão da aplicação são compilados uma única vez em regexes sobre o nome
+completo do membro. Saídas de build, dependências vendorizadas e lockfiles
+deixam de consumir o limite de arquivos e o tempo de descompactação.
+
+Diferença conhecida em relação ao git: uma negação (``!padrão``) reinclui o
+arquivo mesmo quando uma pasta acima dele foi ignorada.
+"""
+import logging
+import re
+from typing import Iterable, List, NamedTuple, Optional, Pattern, Sequence, Tuple
+
+from ..constants import APP_NAME
+
+logger = logging.getLogger(f"{APP_NAME}.ignore_rules")
+
+GITIGNORE_FILE_NAME = ".gitignore"
+# .gitignore maiores que isso são lidos só até o limite
+MAX_GITIGNORE_BYTES = 64 * 1024
+
+# Padrões da aplicação, no formato do .gitignore, relativos à raiz do projeto.
+# Nomes genéricos de saída (build/, dist/...) ficam ancorados na raiz: em
+# subpastas costumam ser código-fonte (``src/pkg/build/__init__.py``).
+DEFAULT_IGNORE_PATTERNS: Tuple[str, ...] = (
+    ".git/", ".hg/", ".svn/",
+    "node_modules/", "bower_components/", "jspm_packages/",
+    "venv/", ".venv/", "__pycache__/", "*.py[cod]", "*.egg-info/", ".eggs/",
+    ".tox/", ".nox/", ".mypy_cache/", ".pytest_cache/", ".ruff_cache/", "htmlcov/",
+    "/dist/", "/build/", "/target/", "/out/", ".next/", ".nuxt/", ".gradle/",
+    "/coverage/", ".coverage", "*.min.js", "*.min.css", "*.map",
+    "package-lock.json", "yarn.lock", "pnpm-lock.yaml", "poetry.lock", "Pipfile.lock",
+    "Cargo.lock", "composer.lock", "Gemfile.lock", "go.sum",
+    ".DS_Store", "Thumbs.db", ".idea/", ".vscode/",
+)
+
+
+class IgnoreRule(NamedTuple):
+    pattern: Pattern[str]
+    negated: bool
+
+
+def _translate_glob(glob: str) -> str:
+    """Glob do .gitignore → regex (``*`` e ``?`` não cruzam ``/``; ``**`` cruza)."""
+    parts: List[str] = []
+    i = 0
+    while i < len(glob):
+        char = glob[i]
+        if glob.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif glob.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif char == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif char == "?":
+            parts.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = glob.find("]", i + 2)
+            if end == -1:
+                parts.append(re.escape(char))
+                i += 1
+                continue
+            body = glob[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            parts.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+            i = end + 1
+        elif char == "\\" and i + 1 < len(glob):
+            parts.append(re.escape(glob[i + 1]))
+            i += 2
+        else:
+            parts.append(re.escape(char))
+            i += 1
+    return "".join(parts)
+
+
+def compile_gitignore_line(line: str, base: str = "") -> Optional[IgnoreRule]:
+    """Compila uma linha de .gitignore relativa à pasta ``base`` (ex.: ``proj/``).
+
+    A regex casa com o nome completo do membro, inclusive quando o padrão
+    ignora uma pasta acima dele.
+    """
+    line = line.rstrip("\n\r")
+    if not line.endswith("\\ "):
+        line = line.rstrip(" ")
+    if not line or line.startswith("#"):
+        return None
+    negated = line.startswith("!")
+    if negated:
+        line = line[1:]
+    elif line.startswith("\\"):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    # Com "/" no início ou no meio, o padrão é relativo à pasta do .gitignore
+    anchored = "/" in line
+    glob = line.lstrip("/")
+    if not glob:
+        return None
+
+    prefix = re.escape(base) + ("" if anchored else "(?:.*/)?")
+    # Pasta: casa só com o conteúdo; arquivo: com ele mesmo ou com o conteúdo
+    suffix = "/.*" if dir_only else "(?:/.*)?"
+    return IgnoreRule(re.compile(f"{prefix}{_translate_glob(glob)}{suffix}\\Z", re.DOTALL), negated)
+
+
+class IgnoreMatcher:
+    """Conjunto de regras compiladas; a última regra que casar decide, como no git."""
+
+    def __init__(self, rules: Iterable[IgnoreRule] = ()):
+        self._rules: List[IgnoreRule] = list(rules)
+        self._combined: Optional[Pattern[str]] = None
+        self._has_negations = any(rule.negated for rule in self._rules)
+        if self._rules and not self._has_negations:
+            # Caso comum: uma única regex para todas as regras
+            self._combined = re.compile(
+                "|".join(f"(?:{rule.pattern.pattern})" for rule in self._rules), re.DOTALL
+            )
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], base: str = "") -> "IgnoreMatcher":
+        return cls(rule for line in lines if (rule := compile_gitignore_line(line, base)))
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def is_ignored(self, path: str) -> bool:
+        if self._combined is not None:
+            return self._combined.match(path) is not None
+        for rule in reversed(self._rules):
+            if rule.pattern.match(path):
+                return not rule.negated
+        return False
+
+
+def gitignore_base(member_name: str) -> str:
+    """Pasta (com ``/`` final) de um membro ``.gitignore``, ou ``""`` na raiz."""
+    normalized = member_name.replace("\\", "/")
+    return normalized[:normalized.rfind("/") + 1]
+
+
+def is_gitignore_member(member_name: str) -> bool:
+    return member_name.replace("\\", "/").rsplit("/", 1)[-1] == GITIGNORE_FILE_NAME
+
+
+def build_ignore_matcher(
+    source,
+    members: Sequence,
+    root: str = "",
+    default_patterns: Sequence[str] = DEFAULT_IGNORE_PATTERNS,
+) -> Tuple[IgnoreMatcher, int]:
+    """Compila os padrões padrão e os ``.gitignore`` de ``members`` lidos de ``source``.
+
+    Arquivos mais rasos vêm antes, para que regras de subpastas prevaleçam.
+    Retorna o matcher e quantos ``.gitignore`` foram usados.
+    """
+    rules = [rule for line in default_patterns if (rule := compile_gitignore_line(line, root))]
+    gitignores = sorted(
+        (info for info in members if is_gitignore_member(info.filename)),
+        key=lambda info: info.filename.count("/"),
+    )
+    # Tarballs: uma única passada no fluxo para todos os .gitignore
+    source.prepare(gitignores, MAX_GITIGNORE_BYTES)
+    used = 0
+    for info in gitignores:
+        try:
+            with source.open(info) as fp:
+                text = fp.read(MAX_GITIGNORE_BYTES).decode("utf-8", errors="ignore")
+        except Exception as e:
+            logger.warning(f".gitignore ignorado ({info.filename}): {e}")
+            continue
+        base = gitignore_base(info.filename)
+        rules.extend(rule for line in text.splitlines() if (rule := compile_gitignore_line(line, base)))
+        used += 1
+    return IgnoreMatcher(rules), used
+
+
+def prune_members(members: Sequence, matcher: IgnoreMatcher) -> Tuple[List, int, int]:
+    """Remove membros ignorados; retorna (mantidos, arquivos podados, bytes poupados)."""
+    kept = []
+    pruned_files = pruned_bytes = 0
+    for info in members:
+        if matcher.is_ignored(info.filename):
+            pruned_files += 1
+            pruned_bytes += info.file_size
+        else:
+            kept.append(info)
+    return kept, pruned_files, pruned_bytes
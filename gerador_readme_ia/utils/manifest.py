@@ -0,0 +1,103 @@
+# gerador_readme_ia/utils/manifest.py
+"""Manifesto da extração (membro → CRC32, tamanho) gravado ao lado do README.
+
+Na regeneração incremental, o diretório central do novo ZIP é comparado com o
+manifesto anterior: membros inalterados reaproveitam a seção já extraída (cache
+de seções) e só os alterados ou novos são descompactados de novo.
+"""
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+from ..constants import APP_NAME
+from .extraction_cache import CACHE_FORMAT_VERSION
+from .path_filters import common_root
+from .sources import open_source, source_stem
+
+logger = logging.getLogger(f"{APP_NAME}.manifest")
+
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_FORMAT_VERSION = 1
+
+# caminho relativo à raiz comum do ZIP → (CRC32, tamanho descompactado)
+Manifest = Dict[str, Tuple[int, int]]
+
+
+class ManifestDiff(NamedTuple):
+    added: FrozenSet[str]
+    changed: FrozenSet[str]
+    removed: FrozenSet[str]
+    unchanged: FrozenSet[str]
+
+    def summary(self) -> str:
+        return (
+            f"{len(self.unchanged)} inalterados, {len(self.changed)} alterados, "
+            f"{len(self.added)} novos, {len(self.removed)} removidos"
+        )
+
+
+def relative_member_path(member_name: str, root: str) -> str:
+    """Caminho sem a pasta raiz (ex.: ``repo-1.2/``), estável entre releases."""
+    return member_name[len(root):] if root and member_name.startswith(root) else member_name
+
+
+def build_manifest(zip_path: str) -> Manifest:
+    """Manifesto a partir do diretório central, sem descompactar nada."""
+    with open_source(zip_path) as source:
+        infos = [info for info in source.infolist() if not info.is_dir()]
+    root = common_root([info.filename for info in infos])
+    return {relative_member_path(info.filename, root): (info.CRC, info.file_size) for info in infos}
+
+
+def manifest_path_for(zip_path: str, output_dir: str) -> str:
+    """``<output_dir>/<nome do zip>.manifest.json``, ao lado dos READMEs gerados."""
+    return os.path.join(output_dir, source_stem(zip_path) + MANIFEST_SUFFIX)
+
+
+def save_manifest(path: str, manifest: Manifest, archive_name: str = "") -> None:
+    payload = {
+        "version": MANIFEST_FORMAT_VERSION,
+        "archive": archive_name,
+        "members": {name: list(entry) for name, entry in sorted(manifest.items())},
+    }
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=1)
+    os.replace(tmp_path, path)
+    logger.debug(f"Manifesto gravado: {path} ({len(manifest)} membros)")
+
+
+def load_manifest(path: str) -> Optional[Manifest]:
+    """Manifesto salvo, ou ``None`` se ausente, ilegível ou de outro formato."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != MANIFEST_FORMAT_VERSION:
+            return None
+        return {name: (int(crc), int(size)) for name, (crc, size) in payload["members"].items()}
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Manifesto ignorado ({path}): {e}")
+        return None
+
+
+def diff_manifests(previous: Manifest, current: Manifest) -> ManifestDiff:
+    added = frozenset(current.keys() - previous.keys())
+    removed = frozenset(previous.keys() - current.keys())
+    common = current.keys() & previous.keys()
+    changed = frozenset(name for name in common if current[name] != previous[name])
+    return ManifestDiff(added, changed, removed, frozenset(common - changed))
+
+
+def section_cache_key(relative_path: str, crc: int, size: int, max_size: int) -> str:
+    """Chave da seção extraída de um membro no cache de seções.
+
+    Inclui ``CACHE_FORMAT_VERSION``: se o formato da extração mudar, as seções
+    antigas deixam de ser reaproveitadas.
+    """
+    payload = f"{MANIFEST_FORMAT_VERSION}\0{CACHE_FORMAT_VERSION}\0{relative_path}\0{crc}\0{size}\0{max_size}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,134 @@
+# gerador_readme_ia/utils/path_filters.py
+"""Classificação de caminhos por categoria (testes, documentação, configuração).
+
+As regras são globs (ou regex com prefixo ``re:``) aplicados ao caminho relativo
+à raiz do projeto, sempre com ``/`` inicial, sem diferenciar maiúsculas. Cada
+categoria é compilada uma única vez em uma regex combinada.
+"""
+import fnmatch
+import logging
+import re
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+from ..constants import APP_NAME
+
+logger = logging.getLogger(f"{APP_NAME}.path_filters")
+
+CATEGORY_TESTS = "tests"
+CATEGORY_DOCS = "docs"
+CATEGORY_CONFIG = "config"
+
+CATEGORY_LABELS: Dict[str, str] = {
+    CATEGORY_TESTS: "testes",
+    CATEGORY_DOCS: "documentação",
+    CATEGORY_CONFIG: "configurações",
+}
+
+# Chave de configuração da GUI -> categoria controlada por ela
+CONFIG_CATEGORY_KEYS: Dict[str, str] = {
+    "include_tests": CATEGORY_TESTS,
+    "include_docs": CATEGORY_DOCS,
+    "include_config": CATEGORY_CONFIG,
+}
+
+# Arquivos que descrevem o projeto nunca são filtrados, mesmo sendo .md/.toml/.json
+ALWAYS_KEEP_RULES: Tuple[str, ...] = (
+    "/readme*",
+    "*/pyproject.toml", "*/setup.py", "*/setup.cfg", "*/requirements*.txt",
+    "*/package.json", "*/cargo.toml", "*/go.mod", "*/pom.xml", "*/composer.json",
+    "*/build.gradle", "*/build.gradle.kts", "*/gemfile",
+)
+
+# A ordem importa: o primeiro grupo que casar define a categoria
+DEFAULT_CATEGORY_RULES: Dict[str, Tuple[str, ...]] = {
+    CATEGORY_TESTS: (
+        "*/tests/*", "*/test/*", "*/__tests__/*", "*/spec/*", "*/e2e/*",
+        "*/test_*.py", "*_test.py", "*_test.go", "*/conftest.py",
+        "re:.*\\.(test|spec)\\.[cm]?[jt]sx?$",
+    ),
+    CATEGORY_DOCS: (
+        "*/docs/*", "*/doc/*", "*/documentation/*",
+        "*.md", "*.rst", "*.adoc", "*.txt",
+        "*/license*", "*/changelog*", "*/authors*",
+    ),
+    CATEGORY_CONFIG: (
+        "*.toml", "*.ini", "*.cfg", "*.conf", "*.yml", "*.yaml", "*.json",
+        "*/.*rc", "*/.env*", "*/.editorconfig", "*/.gitattributes", "*/.gitignore",
+        "*/.github/*",
+    ),
+}
+
+
+def common_root(names: Sequence[str]) -> str:
+    """Prefixo de pasta única compartilhado por todos os membros (ex.: ``repo-main/``)."""
+    if not names:
+        return ""
+    first = names[0].replace("\\", "/").split("/", 1)[0] + "/"
+    if all(name.replace("\\", "/").startswith(first) for name in names):
+        return first
+    return ""
+
+
+def compile_rules(rules: Iterable[str]) -> Optional[Pattern[str]]:
+    """Compila globs/regex em uma única regex; ``None`` se não houver regras."""
+    sources: List[str] = []
+    for rule in rules:
+        if rule.startswith("re:"):
+            sources.append(f"(?:{rule[3:]})")
+        else:
+            sources.append(f"(?:{fnmatch.translate(rule)})")
+    if not sources:
+        return None
+    return re.compile("|".join(sources), re.IGNORECASE)
+
+
+class PathClassifier:
+    """Atribui uma categoria a cada caminho a partir de regras pré-compiladas."""
+
+    def __init__(
+        self,
+        category_rules: Optional[Dict[str, Sequence[str]]] = None,
+        keep_rules: Sequence[str] = ALWAYS_KEEP_RULES,
+    ):
+        rules = DEFAULT_CATEGORY_RULES if category_rules is None else category_rules
+        self._keep = compile_rules(keep_rules)
+        self._categories: List[Tuple[str, Pattern[str]]] = []
+        for category, patterns in rules.items():
+            compiled = compile_rules(patterns)
+            if compiled is not None:
+                self._categories.append((category, compiled))
+
+    @staticmethod
+    def _normalize(path: str, root: str) -> str:
+        normalized = path.replace("\\", "/")
+        if root and normalized.startswith(root):
+            normalized = normalized[len(root):]
+        return "/" + normalized.lstrip("/")
+
+    def classify(self, path: str, root: str = "") -> Optional[str]:
+        """Retorna a categoria do caminho, ou ``None`` para código comum."""
+        normalized = self._normalize(path, root)
+        if self._keep is not None and self._keep.match(normalized):
+            return None
+        for category, pattern in self._categories:
+            if pattern.match(normalized):
+                return category
+        return None
+
+
+def excluded_categories(config: Dict[str, object]) -> frozenset:
+    """Categorias desativadas na configuração (ausente = incluída)."""
+    return frozenset(
+        category
+        for key, category in CONFIG_CATEGORY_KEYS.items()
+        if not config.get(key, True)
+    )
+
+
+def format_skip_stats(stats: Dict[str, Dict[str, int]]) -> str:
+    """Resumo legível das estatísticas produzidas pelo filtro."""
+    parts = []
+    for category, values in stats.items():
+        label = CATEGORY_LABELS.get(category, category)
+        parts.append(f"{label}: {values['files']} arquivos ({values['bytes'] / 1024:.1f} KB)")
+    return "; ".join(parts)
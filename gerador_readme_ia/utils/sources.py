@@ -0,0 +1,276 @@
+# gerador_readme_ia/utils/sources.py
+"""Fontes de projeto plugáveis: ZIP, diretório e tarball (.tar.gz / .tar.zst).
+
+Todas expõem a mesma interface mínima de ``zipfile.ZipFile`` usada pela
+extração (``infolist()``, ``open(membro)``, ``close()``), com membros que
+imitam ``zipfile.ZipInfo`` (``filename``, ``file_size``, ``CRC``, ``is_dir()``).
+Assim, uma pasta de checkout alimenta o mesmo pipeline sem ser compactada.
+"""
+import io
+import logging
+import os
+import tarfile
+import zipfile
+import zlib
+from pathlib import Path
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ..constants import APP_NAME
+from .ignore_rules import MAX_GITIGNORE_BYTES, is_gitignore_member
+
+logger = logging.getLogger(f"{APP_NAME}.sources")
+
+TAR_SUFFIXES = (".tar.gz", ".tgz", ".tar.zst", ".tar.zstd", ".tar")
+ARCHIVE_SUFFIXES = (".zip",) + TAR_SUFFIXES
+
+# Pastas nunca percorridas na entrada por diretório (podadas antes do scandir)
+PRUNED_DIR_NAMES = frozenset({
+    ".git", ".hg", ".svn", "node_modules", "venv", ".venv", "env", "__pycache__",
+    ".tox", ".nox", ".mypy_cache", ".pytest_cache", ".ruff_cache", ".idea", ".vscode",
+})
+
+
+class SourceMember:
+    """Membro de uma fonte com os atributos de ``zipfile.ZipInfo`` usados na extração.
+
+    Diretórios e tarballs não guardam CRC32; ``CRC`` é então uma impressão digital
+    de (tamanho, mtime), estável enquanto o arquivo não muda.
+    """
+
+    __slots__ = ("filename", "file_size", "compress_size", "CRC", "location")
+
+    def __init__(self, filename: str, file_size: int, crc: int, location: str = ""):
+        self.filename = filename
+        self.file_size = file_size
+        self.compress_size = file_size
+        self.CRC = crc
+        self.location = location
+
+    def is_dir(self) -> bool:
+        return False
+
+    def __repr__(self) -> str:
+        return f"SourceMember({self.filename!r}, {self.file_size})"
+
+
+def _fingerprint(size: int, mtime: float) -> int:
+    return zlib.crc32(f"{size}:{mtime}".encode("ascii"))
+
+
+def source_stem(path: str) -> str:
+    """Nome do projeto sem extensões de arquivo (``proj.tar.gz`` → ``proj``)."""
+    name = os.path.basename(os.path.normpath(path))
+    lowered = name.lower()
+    for suffix in ARCHIVE_SUFFIXES:
+        if lowered.endswith(suffix):
+            return name[:-len(suffix)]
+    return Path(name).stem if os.path.isfile(path) else name
+
+
+def source_label(path: str) -> str:
+    """Rótulo curto do tipo de fonte, para o console."""
+    if os.path.isdir(path):
+        return "Pasta"
+    if path.lower().endswith(TAR_SUFFIXES):
+        return "TAR"
+    return "ZIP"
+
+
+def is_supported_source(path: str) -> bool:
+    return os.path.isdir(path) or path.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def source_size(path: str) -> int:
+    """Bytes de entrada: tamanho do arquivo, ou soma dos arquivos lidos da pasta."""
+    if os.path.isdir(path):
+        return sum(member.file_size for member in DirectorySource(path).infolist())
+    return os.path.getsize(path)
+
+
+class ProjectSource:
+    """Interface comum; subclasses implementam listagem e leitura de membros."""
+
+    #: Se workers podem reabrir a fonte e ler membros em paralelo
+    supports_parallel = True
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def infolist(self) -> List:
+        raise NotImplementedError
+
+    def open(self, member) -> IO[bytes]:
+        raise NotImplementedError
+
+    def prepare(self, members: Sequence, max_size: int) -> None:
+        """Chamado com os membros selecionados antes da leitura (padrão: nada)."""
+
+    def fingerprint(self) -> List[Tuple[str, int, int]]:
+        """(nome, CRC, tamanho) de cada membro, para chaves de cache."""
+        return [(member.filename, member.CRC, member.file_size) for member in self.infolist()]
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "ProjectSource":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ZipSource(ProjectSource):
+    """ZIP com acesso aleatório pelo diretório central."""
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._zf = zipfile.ZipFile(path, "r")
+
+    def infolist(self) -> List[zipfile.ZipInfo]:
+        return self._zf.infolist()
+
+    def open(self, member) -> IO[bytes]:
+        return self._zf.open(member)
+
+    def close(self) -> None:
+        self._zf.close()
+
+
+class DirectorySource(ProjectSource):
+    """Pasta local percorrida com ``os.scandir``; pastas pesadas são podadas cedo.
+
+    Os nomes recebem o nome da pasta como raiz (``proj/src/app.py``), como num
+    ZIP do mesmo checkout. Links simbólicos não são seguidos.
+    """
+
+    def __init__(self, path: str, pruned_dirs: Iterable[str] = PRUNED_DIR_NAMES):
+        super().__init__(os.path.abspath(path))
+        self.pruned_dirs = frozenset(pruned_dirs)
+        self._members: Optional[List[SourceMember]] = None
+
+    def _walk(self) -> Iterator[SourceMember]:
+        root_name = os.path.basename(self.path.rstrip(os.sep)) or "projeto"
+        stack = [(self.path, root_name)]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                entries = sorted(os.scandir(directory), key=lambda entry: entry.name)
+            except OSError as e:
+                logger.warning(f"Pasta ignorada ({directory}): {e}")
+                continue
+            subdirs = []
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in self.pruned_dirs:
+                        subdirs.append((entry.path, f"{prefix}/{entry.name}"))
+                elif entry.is_file(follow_symlinks=False):
+                    stat = entry.stat(follow_symlinks=False)
+                    yield SourceMember(
+                        f"{prefix}/{entry.name}",
+                        stat.st_size,
+                        _fingerprint(stat.st_size, stat.st_mtime_ns),
+                        entry.path,
+                    )
+            # Ordem estável e parecida com a de um ZIP: arquivos antes das subpastas
+            stack.extend(reversed(subdirs))
+
+    def infolist(self) -> List[SourceMember]:
+        if self._members is None:
+            self._members = list(self._walk())
+        return self._members
+
+    def open(self, member: SourceMember) -> IO[bytes]:
+        return open(member.location, "rb")
+
+
+class TarSource(ProjectSource):
+    """Tarball lido em streaming (gzip ou zstd): uma passada lista os membros
+    (guardando já os ``.gitignore``) e outra, em ordem do arquivo, guarda os
+    primeiros ``max_size + 1`` bytes dos selecionados — sem seeks para trás no
+    fluxo comprimido. O byte extra deixa o leitor detectar o truncamento.
+    """
+
+    supports_parallel = False
+
+    def __init__(self, path: str):
+        super().__init__(path)
+        self._members: Optional[List[SourceMember]] = None
+        # nome → (bytes lidos, limite pedido)
+        self._prefetched: Dict[str, Tuple[bytes, int]] = {}
+
+    def _open_stream(self) -> Tuple[tarfile.TarFile, List[IO[bytes]]]:
+        if self.path.lower().endswith((".tar.zst", ".tar.zstd")):
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ValueError(
+                    "Arquivos .tar.zst exigem o pacote opcional 'zstandard' (pip install zstandard)."
+                ) from e
+            raw = open(self.path, "rb")
+            reader = zstandard.ZstdDecompressor().stream_reader(raw)
+            return tarfile.open(fileobj=reader, mode="r|"), [reader, raw]
+        return tarfile.open(self.path, mode="r|*"), []
+
+    def _iter_stream(self) -> Iterator[Tuple[tarfile.TarFile, tarfile.TarInfo]]:
+        tar, handles = self._open_stream()
+        try:
+            for tarinfo in tar:
+                # Só arquivos regulares: links e dispositivos são ignorados
+                if tarinfo.isfile():
+                    yield tar, tarinfo
+        finally:
+            tar.close()
+            for handle in handles:
+                handle.close()
+
+    def _prefetch(self, tar: tarfile.TarFile, tarinfo: tarfile.TarInfo, max_size: int) -> None:
+        fp = tar.extractfile(tarinfo)
+        data = fp.read(max_size + 1) if fp is not None else b""
+        self._prefetched[tarinfo.name] = (data, max_size)
+
+    def infolist(self) -> List[SourceMember]:
+        if self._members is None:
+            members = []
+            for tar, tarinfo in self._iter_stream():
+                members.append(
+                    SourceMember(tarinfo.name, tarinfo.size, _fingerprint(tarinfo.size, tarinfo.mtime))
+                )
+                # As regras de ignorados não custam outra descompactação completa
+                if is_gitignore_member(tarinfo.name):
+                    self._prefetch(tar, tarinfo, MAX_GITIGNORE_BYTES)
+            self._members = members
+        return self._members
+
+    def prepare(self, members: Sequence, max_size: int) -> None:
+        wanted = {
+            member.filename for member in members
+            if self._prefetched.get(member.filename, (b"", -1))[1] < max_size
+        }
+        if not wanted:
+            return
+        for tar, tarinfo in self._iter_stream():
+            if tarinfo.name in wanted:
+                self._prefetch(tar, tarinfo, max_size)
+                wanted.discard(tarinfo.name)
+                if not wanted:
+                    break
+
+    def open(self, member) -> IO[bytes]:
+        if member.filename not in self._prefetched:
+            self.prepare([member], member.file_size)
+        return io.BytesIO(self._prefetched[member.filename][0])
+
+    def fingerprint(self) -> List[Tuple[str, int, int]]:
+        # Listar exigiria descompactar tudo; tamanho e mtime do arquivo bastam
+        return []
+
+
+def open_source(path: str) -> ProjectSource:
+    """Fonte adequada ao caminho (pasta, tarball ou ZIP)."""
+    if os.path.isdir(path):
+        return DirectorySource(path)
+    if path.lower().endswith(TAR_SUFFIXES):
+        return TarSource(path)
+    return ZipSource(path)
@@ -0,0 +1,105 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from gerador_readme_ia.ia_client import gemini_client
+from gerador_readme_ia.ia_client.async_gemini_client import AsyncGeminiClient
+from gerador_readme_ia.ia_client.failover import model_cooldowns
+from gerador_readme_ia.ia_client.gemini_client import GeminiClient, QuotaExceededException
+from gerador_readme_ia.ia_client.rate_limiter import ModelRateLimiter
+from gerador_readme_ia.ia_client.retry import RetryPolicy
+
+
+class FakeAsyncModel:
+  def __init__(self, text: str = "# README", error: Exception = None) -> None:
+    self.text = text
+    self.error = error
+    self.calls = 0
+
+  async def generate_content_async(self, contents, generation_config=None, stream=False, **kwargs):
+    self.calls += 1
+    await asyncio.sleep(0)
+    if self.error is not None:
+      raise self.error
+    if stream:
+      async def chunks():
+        for char in self.text:
+          yield SimpleNamespace(text=char, prompt_feedback=None)
+      return chunks()
+    return SimpleNamespace(text=self.text, prompt_feedback=None)
+
+
+class FakeCatalog:
+  def __init__(self, names=("gemini-1.5-flash", "gemini-1.5-pro", "gemini-1.0-pro", "gemini-2.0-flash")) -> None:
+    self.names = list(names)
+
+  def list_models(self, api_key, force_refresh=False):
+    return [SimpleNamespace(name=f"models/{name}", supported_generation_methods=["generateContent"]) for name in self.names]
+
+  def get_generation_model_names(self, api_key, force_refresh=False):
+    return list(self.names)
+
+
+def _client(model: FakeAsyncModel, monkeypatch: pytest.MonkeyPatch, **kwargs) -> AsyncGeminiClient:
+  monkeypatch.setattr(gemini_client.genai, "configure", lambda **kw: None)
+  monkeypatch.setattr(GeminiClient, "_create_model", lambda self, name: model)
+  monkeypatch.setattr(gemini_client, "get_model_catalog", FakeCatalog)
+  limiter = ModelRateLimiter("gemini-1.5-flash", 1_000, 10_000_000)
+  return AsyncGeminiClient("chave", "gemini-1.5-flash", rate_limiter=limiter, **kwargs)
+
+
+def test_concurrent_prompts_share_one_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+  model = FakeAsyncModel()
+  client = _client(model, monkeypatch)
+
+  async def run():
+    return await asyncio.gather(*(client.send_conversational_prompt(f"prompt {i}") for i in range(20)))
+
+  assert asyncio.run(run()) == ["# README"] * 20
+  assert model.calls == 20
+
+
+def test_stream_yields_deltas_asynchronously(monkeypatch: pytest.MonkeyPatch) -> None:
+  client = _client(FakeAsyncModel(), monkeypatch)
+
+  async def run():
+    return [delta async for delta in client.stream_conversational_prompt("prompt")]
+
+  assert asyncio.run(run()) == list("# README")
+
+
+def test_quota_errors_are_mapped_like_the_sync_client(monkeypatch: pytest.MonkeyPatch) -> None:
+  model = FakeAsyncModel(error=google_exceptions.ResourceExhausted("429 Quota exceeded"))
+  client = _client(
+    model,
+    monkeypatch,
+    fallback_models=[],
+    retry_policy=RetryPolicy(max_attempts=2, async_sleep=lambda seconds: asyncio.sleep(0)),
+  )
+  model_cooldowns.reset()
+
+  with pytest.raises(QuotaExceededException):
+    asyncio.run(client.send_conversational_prompt("prompt"))
+  with pytest.raises(QuotaExceededException):
+    asyncio.run(client.test_connection())
+  assert model.calls == 4
+  model_cooldowns.reset()
+
+
+def test_fallback_not_found_is_skipped_like_the_sync_client(monkeypatch: pytest.MonkeyPatch) -> None:
+  primary = FakeAsyncModel(error=google_exceptions.ResourceExhausted("429 Quota exceeded"))
+  fallbacks = {
+    "models/gemini-1.0-pro": FakeAsyncModel(error=google_exceptions.NotFound("404 model not found")),
+    "models/gemini-1.5-pro": FakeAsyncModel(text="# README do 1.5-pro"),
+  }
+  monkeypatch.setattr(
+    gemini_client.genai, "GenerativeModel", lambda model_name, safety_settings=None: fallbacks[model_name]
+  )
+  client = _client(primary, monkeypatch, fallback_models=["gemini-1.0-pro", "gemini-1.5-pro"])
+  model_cooldowns.reset()
+
+  assert asyncio.run(client.send_conversational_prompt("prompt")) == "# README do 1.5-pro"
+  assert fallbacks["models/gemini-1.0-pro"].calls == 1
+  model_cooldowns.reset()
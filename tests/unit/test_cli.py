@@ -0,0 +1,44 @@
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+from gerador_readme_ia.cli import find_archives, format_summary, run_batch
+
+
+class FakeClient:
+  def __init__(self) -> None:
+    self.prompts = []
+
+  def send_conversational_prompt(self, prompt: str, use_cache: bool = True) -> str:
+    self.prompts.append(prompt)
+    return "```markdown\n# Projeto\n```"
+
+
+def _make_zip(path: Path) -> None:
+  with zipfile.ZipFile(path, "w") as zf:
+    zf.writestr("main.py", "print('oi')\n")
+
+
+def test_run_batch_writes_one_readme_per_archive(tmp_path: Path) -> None:
+  for name in ("alpha.zip", "beta.zip"):
+    _make_zip(tmp_path / name)
+  (tmp_path / "notas.txt").write_text("x", encoding="utf-8")
+  output_dir = tmp_path / "saida"
+  client = FakeClient()
+
+  archives = find_archives(str(tmp_path))
+  results = run_batch(archives, str(output_dir), {"readme_style": "minimalista"}, client, workers=2)
+
+  assert [Path(result.zip_path).name for result in results] == ["alpha.zip", "beta.zip"]
+  assert all(result.error is None for result in results)
+  assert (output_dir / "alpha_README.md").read_text(encoding="utf-8") == "# Projeto"
+  assert len(client.prompts) == 2
+  assert "2 gerados, 0 com erro" in format_summary(results, 1.0)
+
+
+def test_cli_module_does_not_import_customtkinter() -> None:
+  code = "import sys, gerador_readme_ia.cli; sys.exit('customtkinter' in sys.modules)"
+  completed = subprocess.run([sys.executable, "-c", code], capture_output=True)
+
+  assert completed.returncode == 0
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+import pytest
+
+from gerador_readme_ia import config_manager
+from gerador_readme_ia.config_manager import ConfigManager
+
+
+@pytest.fixture
+def manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> ConfigManager:
+  monkeypatch.setattr(config_manager, "user_config_dir", lambda *args: str(tmp_path))
+  return ConfigManager()
+
+
+def test_last_validated_at_is_tied_to_the_validated_key(manager: ConfigManager) -> None:
+  manager.set_last_validated_at("chave-a", 1_700_000_000)
+
+  assert manager.get_last_validated_at("chave-a") == 1_700_000_000
+  assert manager.get_last_validated_at("chave-b") is None
+  assert "chave-a" not in Path(manager.get_config_file_path()).read_text(encoding="utf-8")
+
+
+def test_clear_api_key_forgets_validation(manager: ConfigManager) -> None:
+  manager.set_api_key("chave-a")
+  manager.set_last_validated_at("chave-a", 1_700_000_000)
+
+  manager.clear_api_key()
+
+  assert ConfigManager().get_last_validated_at("chave-a") is None
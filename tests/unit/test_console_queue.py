@@ -0,0 +1,35 @@
+import threading
+
+from gerador_readme_ia.gui.ctk_widgets import ConsoleLineQueue, format_console_line
+
+
+def test_console_queue_collects_lines_from_many_threads_in_one_drain() -> None:
+  lines = ConsoleLineQueue(max_lines=10_000)
+  workers = [
+    threading.Thread(target=lambda idx=idx: [lines.put(f"{idx}:{n}") for n in range(500)])
+    for idx in range(4)
+  ]
+  for worker in workers:
+    worker.start()
+  for worker in workers:
+    worker.join()
+
+  drained, dropped = lines.drain()
+
+  assert len(drained) == 2000
+  assert dropped == 0
+  assert lines.drain() == ([], 0)
+
+
+def test_console_queue_keeps_only_the_newest_lines_when_flooded() -> None:
+  lines = ConsoleLineQueue(max_lines=3)
+  for n in range(10):
+    lines.put(str(n))
+
+  assert lines.drain() == (["7", "8", "9"], 7)
+
+
+def test_format_console_line_includes_status_symbol_and_details() -> None:
+  line = format_console_line("Ranking", "success", "3 arquivos")
+
+  assert line.endswith("[OK] Ranking - 3 arquivos")
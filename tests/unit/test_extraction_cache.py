@@ -0,0 +1,93 @@
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from gerador_readme_ia.gui import logic
+from gerador_readme_ia.utils.extraction_cache import ExtractionCache
+
+
+def _make_zip(tmp_path: Path) -> str:
+  zip_path = tmp_path / "projeto.zip"
+  with zipfile.ZipFile(zip_path, "w") as zf:
+    zf.writestr("main.py", "print('oi')\n")
+  return str(zip_path)
+
+
+def test_cache_hit_skips_extraction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+  zip_path = _make_zip(tmp_path)
+  cache = ExtractionCache(str(tmp_path / "cache"))
+  first = logic.extract_project_data_from_zip(zip_path, {}, cache=cache)
+
+  def fail(*args, **kwargs):
+    raise AssertionError("extração não deveria ser executada")
+
+  monkeypatch.setattr(logic, "iter_project_data_from_zip", fail)
+  steps = []
+  second = logic.extract_project_data_from_zip(
+    zip_path, {}, step_cb=lambda name, status, details: steps.append(name), cache=cache
+  )
+
+  assert second == first
+  assert steps == ["Cache"]
+
+
+def test_cache_key_depends_on_extraction_config(tmp_path: Path) -> None:
+  zip_path = _make_zip(tmp_path)
+
+  assert ExtractionCache.build_key(zip_path, {"max_files": 10}) != ExtractionCache.build_key(
+    zip_path, {"max_files": 20}
+  )
+  assert ExtractionCache.build_key(zip_path, {"extract_workers": 4}) == ExtractionCache.build_key(
+    zip_path, {}
+  )
+
+
+def test_put_evicts_least_recently_used_entries(tmp_path: Path) -> None:
+  cache = ExtractionCache(str(tmp_path / "cache"), max_bytes=150)
+  cache.put("antiga", "a" * 100)
+  os.utime(cache._entry_path("antiga"), (1, 1))
+  cache.put("nova", "b" * 100)
+
+  assert cache.get("antiga") is None
+  assert cache.get("nova") == "b" * 100
+
+
+def test_put_scans_the_directory_only_when_over_the_limit(
+  tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  cache = ExtractionCache(str(tmp_path / "cache"), max_bytes=1_000)
+  scans = []
+  real_scandir = os.scandir
+  monkeypatch.setattr(os, "scandir", lambda path: scans.append(path) or real_scandir(path))
+
+  for n in range(9):
+    cache.put(f"chave{n}", "x" * 100)
+  cache.put("chave0", "y" * 100)  # sobrescrever não conta em dobro
+
+  assert len(scans) == 1
+  cache.put("extra", "z" * 200)
+
+  assert len(scans) == 2
+  assert cache._total_bytes <= 1_000
+
+
+def test_eviction_tolerates_entries_removed_concurrently(
+  tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+  cache = ExtractionCache(str(tmp_path / "cache"), max_bytes=150)
+  cache.put("antiga", "a" * 100)
+  os.utime(cache._entry_path("antiga"), (1, 1))
+  real_remove = os.remove
+
+  def remove_twice(path):
+    real_remove(path)
+    real_remove(path)  # simula outro job removendo a mesma entrada antes
+
+  monkeypatch.setattr(os, "remove", remove_twice)
+
+  cache.put("nova", "b" * 100)
+
+  assert cache.get("antiga") is None
+  assert cache.get("nova") == "b" * 100
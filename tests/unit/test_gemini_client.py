@@ -0,0 +1,205 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from gerador_readme_ia.ia_client import gemini_client
+from gerador_readme_ia.ia_client.failover import model_cooldowns
+from gerador_readme_ia.ia_client.gemini_client import GeminiClient, QuotaExceededException
+from gerador_readme_ia.ia_client.response_cache import ResponseCache
+from gerador_readme_ia.ia_client.retry import RetryPolicy
+from gerador_readme_ia.utils.cancellation import CancelToken, JobCancelledException
+
+
+class FakeModel:
+  def __init__(self, text: str = "# README", error: Exception = None) -> None:
+    self.text = text
+    self.error = error
+    self.calls = 0
+
+  def generate_content(self, contents, generation_config=None, stream=False, **kwargs):
+    self.calls += 1
+    if self.error is not None:
+      raise self.error
+    if stream:
+      return [SimpleNamespace(text=char, prompt_feedback=None) for char in self.text]
+    return SimpleNamespace(text=self.text, prompt_feedback=None)
+
+
+class FakeCatalog:
+  def __init__(self, names=("gemini-1.5-flash", "gemini-1.5-pro", "gemini-1.0-pro", "gemini-2.0-flash")) -> None:
+    self.names = list(names)
+
+  def list_models(self, api_key, force_refresh=False):
+    return [SimpleNamespace(name=f"models/{name}", supported_generation_methods=["generateContent"]) for name in self.names]
+
+  def get_generation_model_names(self, api_key, force_refresh=False):
+    return list(self.names)
+
+
+@pytest.fixture
+def fake_model(monkeypatch: pytest.MonkeyPatch) -> FakeModel:
+  model = FakeModel()
+  monkeypatch.setattr(gemini_client.genai, "configure", lambda **kwargs: None)
+  monkeypatch.setattr(GeminiClient, "_create_model", lambda self, name: model)
+  monkeypatch.setattr(gemini_client, "get_model_catalog", FakeCatalog)
+  return model
+
+
+def test_get_context_window_matches_longest_known_prefix() -> None:
+  assert GeminiClient.get_context_window("models/gemini-1.5-pro-002") == 2_097_152
+  assert GeminiClient.get_context_window("gemini-1.0-pro") == 30_720
+  assert GeminiClient.get_context_window("modelo-desconhecido") == 30_720
+
+
+def test_response_cache_returns_identical_prompt_without_calling_model(
+  tmp_path: Path, fake_model: FakeModel
+) -> None:
+  cache = ResponseCache(str(tmp_path / "responses.sqlite3"))
+  client = GeminiClient("chave", "gemini-1.5-flash", response_cache=cache)
+
+  first = client.send_conversational_prompt("prompt")
+  second = client.send_conversational_prompt("prompt")
+
+  assert first == second == "# README"
+  assert fake_model.calls == 1
+  assert client.last_response_cached
+  assert cache.hits == 1 and cache.misses == 1
+
+
+def test_response_cache_expires_entries_after_ttl(tmp_path: Path) -> None:
+  cache = ResponseCache(str(tmp_path / "responses.sqlite3"), ttl_seconds=-1)
+  key = ResponseCache.build_key("models/gemini-1.5-flash", {"temperature": 0.5}, "prompt")
+  cache.put(key, "models/gemini-1.5-flash", "resposta")
+
+  assert cache.get(key) is None
+
+
+def test_stream_conversational_prompt_yields_deltas_and_fills_cache(
+  tmp_path: Path, fake_model: FakeModel
+) -> None:
+  cache = ResponseCache(str(tmp_path / "responses.sqlite3"))
+  client = GeminiClient("chave", "gemini-1.5-flash", response_cache=cache)
+
+  deltas = list(client.stream_conversational_prompt("prompt"))
+  cached = list(client.stream_conversational_prompt("prompt"))
+
+  assert deltas == list("# README")
+  assert cached == ["# README"]
+  assert fake_model.calls == 1
+
+
+def test_cancelled_stream_stops_between_chunks_without_caching(
+  tmp_path: Path, fake_model: FakeModel
+) -> None:
+  cache = ResponseCache(str(tmp_path / "responses.sqlite3"))
+  client = GeminiClient("chave", "gemini-1.5-flash", response_cache=cache)
+  token = CancelToken()
+  received = []
+
+  with pytest.raises(JobCancelledException):
+    for delta in client.stream_conversational_prompt("prompt", cancel_token=token):
+      received.append(delta)
+      token.cancel()
+
+  assert received == ["#"]
+  with pytest.raises(JobCancelledException):
+    client.send_conversational_prompt("prompt", cancel_token=token)
+  assert fake_model.calls == 1
+  assert cache.misses == 1
+
+
+def test_cancel_token_does_not_outlive_its_request(fake_model: FakeModel) -> None:
+  client = GeminiClient("chave", "gemini-1.5-flash")
+  token = CancelToken()
+
+  assert client.send_conversational_prompt("prompt", use_cache=False, cancel_token=token) == "# README"
+  assert list(client.stream_conversational_prompt("prompt", use_cache=False, cancel_token=token))
+  token.cancel()
+
+  # Mesma thread, job já cancelado: chamadas sem token seguem normalmente
+  assert client.test_connection() is True
+  assert client.send_conversational_prompt("prompt", use_cache=False) == "# README"
+
+
+@pytest.fixture
+def quota_chain(monkeypatch: pytest.MonkeyPatch):
+  primary = FakeModel(error=google_exceptions.ResourceExhausted("429 Quota exceeded"))
+  fallbacks = {}
+
+  def make_fallback(model_name, safety_settings=None):
+    if model_name == "models/gemini-1.0-pro":
+      fallbacks[model_name] = FakeModel(error=google_exceptions.NotFound("404 model not found"))
+    else:
+      fallbacks[model_name] = FakeModel(text=f"# README de {model_name}")
+    return fallbacks[model_name]
+
+  monkeypatch.setattr(gemini_client.genai, "configure", lambda **kwargs: None)
+  monkeypatch.setattr(gemini_client.genai, "GenerativeModel", make_fallback)
+  monkeypatch.setattr(GeminiClient, "_create_model", lambda self, name: primary)
+  monkeypatch.setattr(gemini_client, "get_model_catalog", FakeCatalog)
+  model_cooldowns.reset()
+  yield primary, fallbacks
+  model_cooldowns.reset()
+
+
+def test_quota_error_fails_over_to_next_model_and_reports_it(quota_chain) -> None:
+  primary, fallbacks = quota_chain
+  client = GeminiClient("chave", "gemini-1.5-pro", fallback_models=["gemini-1.5-flash"])
+
+  first = client.send_conversational_prompt("prompt")
+  second = client.send_conversational_prompt("prompt")
+
+  assert first == second == "# README de models/gemini-1.5-flash"
+  assert client.last_served_model == "gemini-1.5-flash"
+  assert primary.calls == 1  # em cooldown na segunda chamada
+  assert model_cooldowns.is_cooling_down("gemini-1.5-pro")
+
+
+def test_failover_skips_fallbacks_whose_context_window_cannot_hold_the_prompt(quota_chain) -> None:
+  primary, fallbacks = quota_chain
+  client = GeminiClient(
+    "chave", "gemini-1.5-flash", fallback_models=["gemini-1.0-pro", "gemini-2.0-flash"]
+  )
+  # ~50k tokens: cabe no 1.5-flash e no 2.0-flash, não nos 30.720 do 1.0-pro
+  prompt = "x" * 200_000
+
+  assert client._failover_chain(client._estimate_tokens(prompt)) == [
+    "models/gemini-1.5-flash", "models/gemini-2.0-flash"
+  ]
+  assert "models/gemini-1.0-pro" in client._failover_chain()
+
+  assert client.send_conversational_prompt(prompt) == "# README de models/gemini-2.0-flash"
+  assert list(fallbacks) == ["models/gemini-2.0-flash"]
+
+
+def test_fallback_not_found_is_skipped_in_favour_of_the_next_model(quota_chain) -> None:
+  primary, fallbacks = quota_chain
+  client = GeminiClient(
+    "chave", "gemini-1.5-flash", fallback_models=["gemini-1.0-pro", "gemini-1.5-pro"]
+  )
+
+  assert client.send_conversational_prompt("prompt") == "# README de models/gemini-1.5-pro"
+  assert client.last_served_model == "gemini-1.5-pro"
+  assert fallbacks["models/gemini-1.0-pro"].calls == 1
+
+
+def test_failover_chain_drops_fallbacks_missing_from_the_catalog(quota_chain) -> None:
+  client = GeminiClient(
+    "chave", "gemini-1.5-flash", fallback_models=["gemini-2.0-flash-exp", "gemini-1.5-pro"]
+  )
+
+  assert client._failover_chain() == ["models/gemini-1.5-flash", "models/gemini-1.5-pro"]
+
+
+def test_quota_error_without_fallback_raises_quota_exception(quota_chain) -> None:
+  client = GeminiClient(
+    "chave",
+    "gemini-1.5-pro",
+    fallback_models=[],
+    retry_policy=RetryPolicy(max_attempts=2, sleep=lambda seconds: None),
+  )
+
+  with pytest.raises(QuotaExceededException):
+    client.send_conversational_prompt("prompt")
@@ -0,0 +1,61 @@
+import zipfile
+from pathlib import Path
+
+from gerador_readme_ia.gui.logic import iter_project_data_from_zip
+from gerador_readme_ia.utils.ignore_rules import DEFAULT_IGNORE_PATTERNS, IgnoreMatcher
+
+
+def test_gitignore_semantics_for_anchors_directories_and_negation() -> None:
+  matcher = IgnoreMatcher.from_lines(
+    ["# comentário", "build/", "*.log", "!keep.log", "/secret.txt", "docs/*.tmp"], base="proj/"
+  )
+
+  assert matcher.is_ignored("proj/src/build/out.py")
+  assert not matcher.is_ignored("proj/build.py")
+  assert matcher.is_ignored("proj/logs/app.log")
+  assert not matcher.is_ignored("proj/keep.log")
+  assert matcher.is_ignored("proj/secret.txt")
+  assert not matcher.is_ignored("proj/sub/secret.txt")
+  assert matcher.is_ignored("proj/docs/a.tmp")
+  assert not matcher.is_ignored("proj/docs/sub/a.tmp")
+
+
+def test_anchored_directory_pattern_matches_only_at_its_base() -> None:
+  matcher = IgnoreMatcher.from_lines(["/build/"], base="proj/")
+
+  assert matcher.is_ignored("proj/build/x.py")
+  assert not matcher.is_ignored("proj/src/build/x.py")
+  assert not matcher.is_ignored("proj/build")
+
+
+def test_default_output_dirs_are_pruned_only_at_the_project_root() -> None:
+  matcher = IgnoreMatcher.from_lines(DEFAULT_IGNORE_PATTERNS, base="proj/")
+
+  assert matcher.is_ignored("proj/build/lib/app.py")
+  assert matcher.is_ignored("proj/dist/bundle.js")
+  assert matcher.is_ignored("proj/web/node_modules/react/index.js")
+  assert not matcher.is_ignored("proj/src/mypkg/build/__init__.py")
+  assert not matcher.is_ignored("proj/tools/out/main.go")
+  assert not matcher.is_ignored("proj/src/dist/util.ts")
+  assert not matcher.is_ignored("proj/crates/core/target/lib.rs")
+
+
+def test_extraction_prunes_gitignored_members_before_ranking(tmp_path: Path) -> None:
+  zip_path = tmp_path / "proj.zip"
+  with zipfile.ZipFile(zip_path, "w") as zf:
+    zf.writestr("proj/.gitignore", "generated/\n")
+    zf.writestr("proj/app.py", "print('oi')\n")
+    zf.writestr("proj/pkg/generated/schema.py", "X = 1\n")
+    zf.writestr("proj/package-lock.json", "{}")
+  steps = []
+
+  records = list(iter_project_data_from_zip(
+    str(zip_path), {"include_config": False},
+    step_cb=lambda name, status, details: steps.append((name, details)),
+  ))
+
+  assert [name for name, _ in records] == ["proj/app.py"]
+  assert ("Ignorados", "2 arquivos (0.0 KB) por 1 .gitignore e padrões da aplicação") in steps
+
+  unfiltered = list(iter_project_data_from_zip(str(zip_path), {"respect_gitignore": False}))
+  assert "proj/pkg/generated/schema.py" in [name for name, _ in unfiltered]
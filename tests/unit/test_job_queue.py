@@ -0,0 +1,86 @@
+import zipfile
+from pathlib import Path
+
+from gerador_readme_ia.gui.job_queue import (
+  QUEUE_CANCELLED,
+  QUEUE_DONE,
+  QUEUE_QUEUED,
+  QUEUE_RUNNING,
+  GenerationQueue,
+  queue_concurrency,
+  save_generated_readme,
+)
+from gerador_readme_ia.gui.jobs import GenerationJob
+from gerador_readme_ia.utils.manifest import load_manifest, manifest_path_for
+
+
+def _make_job(entry) -> GenerationJob:
+  return GenerationJob(entry.source_path, {})
+
+
+def test_start_ready_respects_the_concurrency_limit_in_fifo_order() -> None:
+  queue = GenerationQueue(max_concurrent=2)
+  entries = [queue.add(f"/projetos/p{n}.zip") for n in range(4)]
+
+  started = queue.start_ready(_make_job)
+
+  assert started == entries[:2]
+  assert [entry.status for entry in entries] == [QUEUE_RUNNING, QUEUE_RUNNING, QUEUE_QUEUED, QUEUE_QUEUED]
+  assert queue.start_ready(_make_job) == []
+
+  queue.finish(entries[0], QUEUE_DONE, output_path="/saida/p0_README.md")
+
+  assert entries[0].job is None
+  assert queue.start_ready(_make_job) == [entries[2]]
+
+
+def test_add_ignores_projects_already_pending_but_allows_requeue_after_finish() -> None:
+  queue = GenerationQueue()
+  first = queue.add("/projetos/app.zip")
+
+  assert queue.add("/projetos/app.zip") is None
+
+  queue.start_ready(_make_job)
+  queue.finish(first, QUEUE_DONE)
+
+  assert queue.add("/projetos/app.zip") is not None
+
+
+def test_cancel_all_finishes_queued_and_signals_running_jobs() -> None:
+  queue = GenerationQueue(max_concurrent=1)
+  running, waiting = queue.add("a.zip"), queue.add("b.zip")
+  queue.start_ready(_make_job)
+
+  cancelled = queue.cancel_all()
+
+  assert cancelled == [waiting]
+  assert waiting.status == QUEUE_CANCELLED
+  assert running.status == QUEUE_RUNNING and running.job.cancelled
+  assert not queue.is_idle
+
+  queue.finish(running, QUEUE_CANCELLED)
+
+  assert queue.is_idle
+  assert queue.clear_finished() == [running, waiting]
+  assert queue.entries == []
+
+
+def test_queue_concurrency_follows_model_rpm() -> None:
+  assert queue_concurrency("models/gemini-1.5-pro") == 1
+  assert queue_concurrency("gemini-2.0-flash") == 4
+  assert queue_concurrency("gemini-2.0-flash", limit=2) == 2
+
+
+def test_save_generated_readme_never_overwrites_and_writes_manifest(tmp_path: Path) -> None:
+  archive = tmp_path / "app.zip"
+  with zipfile.ZipFile(archive, "w") as zf:
+    zf.writestr("app/main.py", "print('oi')\n")
+  output_dir = tmp_path / "saida"
+
+  first = save_generated_readme(str(archive), "# App\n", str(output_dir))
+  second = save_generated_readme(str(archive), "# App v2\n", str(output_dir))
+
+  assert first.endswith("app_README.md")
+  assert second.endswith("app_README_1.md")
+  assert Path(first).read_text(encoding="utf-8") == "# App\n"
+  assert load_manifest(manifest_path_for(str(archive), str(output_dir)))
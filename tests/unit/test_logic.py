@@ -1,4 +1,32 @@
-from gerador_readme_ia.gui.logic import build_prompt, clean_readme_content
+import io
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from gerador_readme_ia.gui.logic import (
+  BINARY_SNIFF_SIZE,
+  _iter_member_text,
+  build_prompt,
+  clean_readme_content,
+  estimate_tokens,
+  extract_project_data_from_zip,
+  is_binary_member,
+  iter_project_data_from_zip,
+  pack_project_data,
+  rank_members,
+  write_project_data,
+)
+from gerador_readme_ia.utils.cancellation import CancelToken, JobCancelledException
+
+
+def _make_zip(tmp_path: Path, members: dict) -> str:
+  zip_path = tmp_path / "projeto.zip"
+  with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    for name, content in members.items():
+      zf.writestr(name, content)
+  return str(zip_path)
 
 
 def test_clean_readme_content_removes_fence_wrapper() -> None:
@@ -34,3 +62,201 @@ def test_build_prompt_with_flags_adds_expected_sections() -> None:
 
   assert "Inclua badges informativos." in prompt
   assert "Inclua índice" in prompt
+
+
+def test_iter_project_data_streams_chunks_and_skips_binary(tmp_path: Path) -> None:
+  zip_path = _make_zip(
+    tmp_path,
+    {
+      "src/main.py": "print('oi')\n",
+      "assets/logo.png": b"\x89PNG\x00\x00",
+      "../fora.txt": "x",
+    },
+  )
+
+  records = list(iter_project_data_from_zip(zip_path, {"max_file_size_kb": 5}))
+
+  assert [name for name, _ in records] == ["src/main.py"]
+  assert records[0][1] == "\n--- src/main.py ---\nprint('oi')\n"
+
+
+def test_write_project_data_matches_string_wrapper(tmp_path: Path) -> None:
+  zip_path = _make_zip(
+    tmp_path,
+    {
+      "README.md": "# Projeto\n" * 300,
+      "app.py": "import os\n",
+    },
+  )
+  config = {"max_file_size_kb": 1}
+
+  buffer = io.StringIO()
+  written = write_project_data(iter_project_data_from_zip(zip_path, config), buffer)
+
+  assert buffer.getvalue() == extract_project_data_from_zip(zip_path, config)
+  assert written == len(buffer.getvalue())
+  assert "…[TRUNCADO]" in buffer.getvalue()
+
+
+def test_parallel_extraction_preserves_archive_order(tmp_path: Path) -> None:
+  members = {f"pkg/mod_{idx:02d}.py": f"VALOR = {idx}\n" for idx in range(25)}
+  zip_path = _make_zip(tmp_path, members)
+  steps = []
+
+  sequential = extract_project_data_from_zip(zip_path, {"max_files": 50})
+  parallel = extract_project_data_from_zip(
+    zip_path,
+    {"max_files": 50, "extract_workers": 4},
+    step_cb=lambda name, status, details: steps.append(name),
+  )
+
+  assert parallel == sequential
+  assert "Paralelo" in steps
+
+
+def test_rank_members_prefers_key_files_over_tooling_noise() -> None:
+  names = [
+    "repo-main/.github/workflows/ci.yml",
+    "repo-main/vendor/lib/util.js",
+    "repo-main/src/pkg/deep/helpers.py",
+    "repo-main/pyproject.toml",
+    "repo-main/README.md",
+  ]
+  members = [zipfile.ZipInfo(name) for name in names]
+
+  selected = [info.filename for info in rank_members(members, 2)]
+
+  assert selected == ["repo-main/README.md", "repo-main/pyproject.toml"]
+
+
+def test_excluded_categories_are_never_read(tmp_path: Path) -> None:
+  zip_path = _make_zip(
+    tmp_path,
+    {
+      "app/main.py": "print('app')\n",
+      "tests/test_main.py": "def test_x(): pass\n",
+      "docs/guia.md": "# Guia\n",
+    },
+  )
+  steps = []
+
+  data = extract_project_data_from_zip(
+    zip_path,
+    {"include_tests": False, "include_docs": False},
+    step_cb=lambda name, status, details: steps.append((name, details)),
+  )
+
+  assert "app/main.py" in data
+  assert "test_main.py" not in data
+  assert "guia.md" not in data
+  assert any(name == "Filtros" and "testes: 1 arquivos" in details for name, details in steps)
+
+
+def test_pack_project_data_keeps_leading_sections_and_truncates_tail() -> None:
+  sections = [f"\n--- arquivo_{idx}.py ---\n" + "x = 1\n" * 200 for idx in range(5)]
+  project_data = "\n".join(sections)
+
+  packed = pack_project_data(project_data, 700)
+
+  assert estimate_tokens(packed) <= 700
+  assert "--- arquivo_0.py ---" in packed
+  assert "TRUNCADO PARA CABER NO CONTEXTO" in packed
+  assert "arquivo(s) omitido(s)" in packed
+  assert "--- arquivo_4.py ---" not in packed
+
+
+def test_build_prompt_respects_token_budget() -> None:
+  project_data = "\n--- main.py ---\n" + "print('oi')\n" * 20000
+  config = {"readme_style": "minimalista", "token_budget": 6000}
+
+  prompt = build_prompt(project_data, config)
+
+  assert estimate_tokens(prompt) <= 6000
+  assert "--- main.py ---" in prompt
+
+
+def test_binary_members_are_decided_from_zip_metadata(tmp_path: Path) -> None:
+  zip_path = _make_zip(
+    tmp_path,
+    {
+      "fonts/inter.woff2": "nao importa",
+      "data/blob.dat": os.urandom(16 * 1024),
+      "src/app.py": "print('oi')\n" * 2000,
+    },
+  )
+
+  with zipfile.ZipFile(zip_path) as zf:
+    verdicts = {info.filename: is_binary_member(info) for info in zf.infolist()}
+
+  assert verdicts == {"fonts/inter.woff2": True, "data/blob.dat": True, "src/app.py": False}
+
+
+def test_binary_content_costs_only_the_sniff_window() -> None:
+  fp = io.BytesIO(b"\x01\x02\x03\x04" * 64 * 1024)
+
+  assert list(_iter_member_text(fp, 512 * 1024)) == []
+  assert fp.tell() == BINARY_SNIFF_SIZE
+
+
+def test_stray_nul_after_the_sniff_window_does_not_cut_the_section() -> None:
+  content = b"a = 1\n" * 2000 + b"\x00" + b"b = 2\n"
+  text = "".join(chunk for chunk, _ in _iter_member_text(io.BytesIO(content), 512 * 1024))
+
+  assert text.endswith("b = 2\n")
+  assert "TRUNCADO" not in text
+
+
+def test_truncation_marker_only_when_content_exceeds_the_limit() -> None:
+  exact = "".join(chunk for chunk, _ in _iter_member_text(io.BytesIO(b"x" * 1024), 1024))
+  longer = "".join(chunk for chunk, _ in _iter_member_text(io.BytesIO(b"x" * 1025), 1024))
+
+  assert exact == "x" * 1024
+  assert longer == "x" * 1024 + "\n…[TRUNCADO]"
+
+
+def test_bytes_callback_reaches_the_selected_total(tmp_path: Path) -> None:
+  zip_path = _make_zip(
+    tmp_path,
+    {"app.py": "x = 1\n" * 1000, "lib.py": "y = 2\n", "logo.png": b"\x89PNG"},
+  )
+  reports = []
+
+  extract_project_data_from_zip(
+    zip_path, {"max_file_size_kb": 1}, bytes_cb=lambda done, total: reports.append((done, total))
+  )
+
+  assert reports[-1] == (1024 + 6, 1024 + 6)
+  assert [done for done, _ in reports] == sorted(done for done, _ in reports)
+
+
+def test_member_text_reports_raw_bytes_not_decoded_characters() -> None:
+  content = "ação çé\n".encode("utf-8") * 5000
+  chunks = list(_iter_member_text(io.BytesIO(content), 512 * 1024))
+
+  assert sum(nbytes for _, nbytes in chunks) == len(content)
+  assert "".join(text for text, _ in chunks) == content.decode("utf-8")
+
+
+def test_bytes_callback_counts_member_bytes_without_headers(tmp_path: Path) -> None:
+  zip_path = _make_zip(tmp_path, {"src/módulo.py": "é = 1\n" * 10_000})
+  reports = []
+
+  extract_project_data_from_zip(
+    zip_path, {"max_file_size_kb": 512}, bytes_cb=lambda done, total: reports.append((done, total))
+  )
+
+  total = len("é = 1\n".encode("utf-8")) * 10_000
+  assert reports[0] == (BINARY_SNIFF_SIZE, total)
+  assert reports[-1] == (total, total)
+
+
+def test_cancel_token_stops_extraction_at_the_next_member(tmp_path: Path) -> None:
+  zip_path = _make_zip(tmp_path, {f"pkg/mod_{idx:02d}.py": "x = 1\n" for idx in range(20)})
+  token = CancelToken()
+  records = iter_project_data_from_zip(zip_path, {"max_files": 50, "extract_workers": 4}, cancel_token=token)
+
+  next(records)
+  token.cancel()
+
+  with pytest.raises(JobCancelledException):
+    next(records)
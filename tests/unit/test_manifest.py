@@ -0,0 +1,73 @@
+import zipfile
+from pathlib import Path
+
+from gerador_readme_ia.gui.logic import extract_project_data_from_zip
+from gerador_readme_ia.utils import manifest
+from gerador_readme_ia.utils.extraction_cache import ExtractionCache
+from gerador_readme_ia.utils.manifest import (
+  build_manifest,
+  diff_manifests,
+  load_manifest,
+  save_manifest,
+  section_cache_key,
+)
+
+
+def _make_release(path: Path, root: str, members: dict) -> str:
+  with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+    for name, content in members.items():
+      zf.writestr(f"{root}/{name}", content)
+  return str(path)
+
+
+MEMBERS = {
+  "README.md": "# Projeto\n",
+  "src/app.py": "print('v1')\n",
+  "src/util.py": "def util(): ...\n",
+  "logo.png": b"\x89PNG\x00\x00binario",
+}
+
+
+def test_manifest_diff_ignores_release_root_folder(tmp_path: Path) -> None:
+  old = build_manifest(_make_release(tmp_path / "v1.zip", "proj-1.0", MEMBERS))
+  new = build_manifest(_make_release(
+    tmp_path / "v2.zip", "proj-1.1", {**MEMBERS, "src/app.py": "print('v2')\n", "CHANGELOG.md": "x"}
+  ))
+  save_manifest(str(tmp_path / "v1.manifest.json"), old)
+
+  diff = diff_manifests(load_manifest(str(tmp_path / "v1.manifest.json")), new)
+
+  assert diff.changed == {"src/app.py"}
+  assert diff.added == {"CHANGELOG.md"}
+  assert "README.md" in diff.unchanged and not diff.removed
+
+
+def test_incremental_extraction_rereads_only_changed_members(tmp_path: Path, monkeypatch) -> None:
+  section_cache = ExtractionCache(str(tmp_path / "sections"))
+  v1 = _make_release(tmp_path / "v1.zip", "proj-1.0", MEMBERS)
+  extract_project_data_from_zip(v1, {}, section_cache=section_cache)
+  v2 = _make_release(tmp_path / "v2.zip", "proj-1.1", {**MEMBERS, "src/app.py": "print('v2')\n"})
+  full = extract_project_data_from_zip(v2, {})
+
+  opened = []
+  original_open = zipfile.ZipFile.open
+
+  def tracking_open(self, name, *args, **kwargs):
+    opened.append(getattr(name, "filename", name))
+    return original_open(self, name, *args, **kwargs)
+
+  monkeypatch.setattr(zipfile.ZipFile, "open", tracking_open)
+  incremental = extract_project_data_from_zip(
+    v2, {}, section_cache=section_cache, previous_manifest=build_manifest(v1)
+  )
+
+  assert incremental == full
+  assert opened == ["proj-1.1/src/app.py"]
+
+
+def test_section_cache_key_changes_with_the_extraction_format(monkeypatch) -> None:
+  key = section_cache_key("src/app.py", 123, 12, 4096)
+
+  monkeypatch.setattr(manifest, "CACHE_FORMAT_VERSION", manifest.CACHE_FORMAT_VERSION + 1)
+
+  assert section_cache_key("src/app.py", 123, 12, 4096) != key
@@ -0,0 +1,61 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from gerador_readme_ia.ia_client import model_catalog
+from gerador_readme_ia.ia_client.model_catalog import ModelCatalog
+
+
+class FakeClock:
+  def __init__(self) -> None:
+    self.now = 1_000.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+@pytest.fixture
+def listing(monkeypatch: pytest.MonkeyPatch) -> list:
+  calls = []
+  models = [
+    SimpleNamespace(name="models/gemini-1.5-flash", supported_generation_methods=["generateContent"]),
+    SimpleNamespace(name="models/embedding-001", supported_generation_methods=["embedContent"]),
+  ]
+  monkeypatch.setattr(model_catalog.genai, "configure", lambda **kwargs: None)
+  monkeypatch.setattr(model_catalog.genai, "list_models", lambda: calls.append(1) or iter(models))
+  return calls
+
+
+def test_list_models_is_cached_in_memory_until_ttl_expires(listing: list) -> None:
+  clock = FakeClock()
+  catalog = ModelCatalog(ttl_seconds=60, clock=clock)
+
+  catalog.list_models("chave")
+  catalog.list_models("chave")
+  assert len(listing) == 1
+
+  clock.now += 61
+  catalog.list_models("chave")
+  assert len(listing) == 2
+
+
+def test_disk_cache_is_shared_between_instances_without_storing_the_key(
+  tmp_path: Path, listing: list
+) -> None:
+  ModelCatalog(str(tmp_path)).list_models("chave-secreta")
+  names = ModelCatalog(str(tmp_path)).get_generation_model_names("chave-secreta")
+
+  assert names == ["gemini-1.5-flash"]
+  assert len(listing) == 1
+  assert "chave-secreta" not in "".join(path.read_text() for path in tmp_path.iterdir())
+
+
+def test_each_api_key_has_its_own_entry(listing: list) -> None:
+  catalog = ModelCatalog()
+
+  catalog.list_models("chave-a")
+  catalog.list_models("chave-b")
+  catalog.list_models("chave-a", force_refresh=True)
+
+  assert len(listing) == 3
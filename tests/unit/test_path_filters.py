@@ -0,0 +1,31 @@
+from gerador_readme_ia.utils.path_filters import (
+  PathClassifier,
+  common_root,
+  excluded_categories,
+)
+
+
+def test_classify_uses_paths_relative_to_common_root() -> None:
+  classifier = PathClassifier()
+  root = common_root(["repo-main/README.md", "repo-main/tests/test_app.py"])
+
+  assert root == "repo-main/"
+  assert classifier.classify("repo-main/tests/test_app.py", root) == "tests"
+  assert classifier.classify("repo-main/src/button.spec.tsx", root) == "tests"
+  assert classifier.classify("repo-main/docs/setup.md", root) == "docs"
+  assert classifier.classify("repo-main/.github/workflows/ci.yml", root) == "config"
+  assert classifier.classify("repo-main/app/main.py", root) is None
+
+
+def test_project_manifests_and_root_readme_are_never_filtered() -> None:
+  classifier = PathClassifier()
+
+  assert classifier.classify("README.md") is None
+  assert classifier.classify("pyproject.toml") is None
+  assert classifier.classify("web/package.json") is None
+  assert classifier.classify("docs/README.md") == "docs"
+
+
+def test_excluded_categories_defaults_to_including_everything() -> None:
+  assert excluded_categories({}) == frozenset()
+  assert excluded_categories({"include_tests": False, "include_docs": True}) == {"tests"}
@@ -0,0 +1,56 @@
+from gerador_readme_ia.gui.progress_channel import ProgressChannel
+
+
+class FakeClock:
+  def __init__(self) -> None:
+    self.now = 100.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+class FakeScheduler:
+  def __init__(self) -> None:
+    self.jobs = []
+
+  def __call__(self, delay_ms: int, callback) -> None:
+    self.jobs.append((delay_ms, callback))
+
+  def run(self) -> None:
+    jobs, self.jobs = self.jobs, []
+    for _, callback in jobs:
+      callback()
+
+
+def test_updates_are_coalesced_into_one_render_per_tick() -> None:
+  clock = FakeClock()
+  scheduler = FakeScheduler()
+  rendered = []
+  channel = ProgressChannel(scheduler, lambda *state: rendered.append(state), clock=clock)
+
+  channel.start_phase("Extraindo", 10, 40)
+  for done in range(1, 1001):
+    channel.update_bytes(done, 2000)
+  scheduler.run()
+
+  assert len(rendered) == 1
+  assert rendered[0][:2] == ("Extraindo", 25.0)
+
+  channel.update_bytes(1500, 2000)
+  assert scheduler.jobs[0][0] == 33  # respeita o intervalo mínimo de ~1/30 s
+
+
+def test_eta_is_derived_from_the_phase_rate() -> None:
+  clock = FakeClock()
+  scheduler = FakeScheduler()
+  rendered = []
+  channel = ProgressChannel(scheduler, lambda *state: rendered.append(state), clock=clock)
+
+  channel.start_phase("Extraindo", 0, 100)
+  clock.now += 2.0
+  channel.update_bytes(250, 1000)
+  scheduler.run()
+
+  message, percent, eta = rendered[-1]
+  assert percent == 25.0
+  assert eta == 6.0
@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+
+from gerador_readme_ia.ia_client.rate_limiter import (
+  ModelRateLimiter,
+  get_model_limits,
+  get_rate_limiter,
+)
+
+
+class FakeClock:
+  def __init__(self) -> None:
+    self.now = 0.0
+    self.lock = threading.Lock()
+
+  def __call__(self) -> float:
+    return self.now
+
+  def sleep(self, seconds: float) -> None:
+    with self.lock:
+      self.now += seconds
+
+
+def test_acquire_waits_for_request_bucket_instead_of_failing() -> None:
+  clock = FakeClock()
+  limiter = ModelRateLimiter("teste", 2, 1_000_000, clock=clock, sleep=clock.sleep)
+
+  waits = [limiter.acquire(10) for _ in range(3)]
+
+  assert waits[:2] == [0.0, 0.0]
+  assert waits[2] == pytest.approx(30.0)
+  assert limiter.snapshot()["max_wait_seconds"] == pytest.approx(30.0)
+
+
+def test_acquire_accounts_for_tokens_per_minute() -> None:
+  clock = FakeClock()
+  limiter = ModelRateLimiter("teste", 100, 1000, clock=clock, sleep=clock.sleep)
+
+  limiter.acquire(1000)
+  waited = limiter.acquire(500)
+
+  assert waited == pytest.approx(30.0)
+  assert limiter.snapshot()["tokens_available"] == pytest.approx(0.0)
+
+
+def test_limiters_are_shared_per_model_and_use_known_limits() -> None:
+  assert get_rate_limiter("models/gemini-1.5-pro") is get_rate_limiter("gemini-1.5-pro")
+  assert get_model_limits("gemini-1.5-pro-002") == (2, 32_000)
@@ -0,0 +1,47 @@
+import pytest
+from google.api_core import exceptions as google_exceptions
+
+from gerador_readme_ia.ia_client.retry import RetryPolicy, get_retry_after, is_retryable_error
+
+
+def test_retryable_and_fatal_errors_are_distinguished() -> None:
+  assert is_retryable_error(google_exceptions.ResourceExhausted("quota"))
+  assert is_retryable_error(google_exceptions.ServiceUnavailable("indisponível"))
+  assert is_retryable_error(TimeoutError("timed out"))
+  assert not is_retryable_error(google_exceptions.PermissionDenied("403"))
+  assert not is_retryable_error(google_exceptions.Unauthenticated("401"))
+  assert not is_retryable_error(ValueError("PROMPT BLOQUEADO PELA IA"))
+
+
+def test_retry_after_hint_overrides_backoff() -> None:
+  error = google_exceptions.ResourceExhausted("429 Quota exceeded. retry_delay {\n  seconds: 7\n}")
+
+  assert get_retry_after(error) == 7.0
+  assert RetryPolicy(max_delay=30.0).compute_delay(1, error) == 7.0
+
+
+def test_call_retries_transient_errors_with_exponential_backoff() -> None:
+  sleeps = []
+  policy = RetryPolicy(max_attempts=3, base_delay=1.0, jitter=0.0, sleep=sleeps.append)
+  outcomes = [google_exceptions.ServiceUnavailable("503"), google_exceptions.InternalServerError("500"), "ok"]
+
+  def flaky() -> str:
+    outcome = outcomes.pop(0)
+    if isinstance(outcome, Exception):
+      raise outcome
+    return outcome
+
+  assert policy.call(flaky) == "ok"
+  assert sleeps == [1.0, 2.0]
+
+
+def test_call_raises_fatal_errors_immediately() -> None:
+  sleeps = []
+  policy = RetryPolicy(sleep=sleeps.append)
+
+  def forbidden() -> None:
+    raise google_exceptions.PermissionDenied("403 sem permissão")
+
+  with pytest.raises(google_exceptions.PermissionDenied):
+    policy.call(forbidden)
+  assert sleeps == []
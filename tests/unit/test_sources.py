@@ -0,0 +1,92 @@
+import tarfile
+import zipfile
+from pathlib import Path
+
+from gerador_readme_ia.gui.logic import extract_project_data_from_zip
+from gerador_readme_ia.utils.ignore_rules import MAX_GITIGNORE_BYTES
+from gerador_readme_ia.utils.manifest import build_manifest, manifest_path_for
+from gerador_readme_ia.utils.sources import DirectorySource, TarSource, open_source, source_stem
+
+MEMBERS = {
+  "proj/README.md": "# Projeto\n",
+  "proj/src/app.py": "print('oi')\n",
+  "proj/src/util.py": "VALOR = 1\n",
+}
+
+
+def _write_tree(root: Path, members: dict) -> Path:
+  for name, content in members.items():
+    path = root / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+  return root / "proj"
+
+
+def test_directory_source_prunes_heavy_dirs_and_mimics_zip_names(tmp_path: Path) -> None:
+  project = _write_tree(tmp_path, {
+    **MEMBERS,
+    "proj/node_modules/lib/index.js": "x",
+    "proj/.git/HEAD": "ref",
+  })
+
+  with open_source(str(project)) as source:
+    assert isinstance(source, DirectorySource)
+    names = [member.filename for member in source.infolist()]
+
+  assert names == ["proj/README.md", "proj/src/app.py", "proj/src/util.py"]
+
+
+def test_directory_and_tarball_extraction_match_the_zip(tmp_path: Path) -> None:
+  zip_path = tmp_path / "proj.zip"
+  with zipfile.ZipFile(zip_path, "w") as zf:
+    for name, content in MEMBERS.items():
+      zf.writestr(name, content)
+  project = _write_tree(tmp_path / "checkout", MEMBERS)
+  tar_path = tmp_path / "proj.tar.gz"
+  with tarfile.open(tar_path, "w:gz") as tar:
+    tar.add(project, arcname="proj")
+
+  expected = extract_project_data_from_zip(str(zip_path), {})
+
+  assert extract_project_data_from_zip(str(project), {}) == expected
+  assert extract_project_data_from_zip(str(tar_path), {}) == expected
+  assert build_manifest(str(tar_path)).keys() == build_manifest(str(zip_path)).keys()
+
+
+def test_tarball_marks_oversized_members_as_truncated_like_the_zip(tmp_path: Path) -> None:
+  members = {"proj/big.py": "x = 1\n" * 2000, "proj/.gitignore": "*.log\n"}
+  zip_path = tmp_path / "proj.zip"
+  with zipfile.ZipFile(zip_path, "w") as zf:
+    for name, content in members.items():
+      zf.writestr(name, content)
+  project = _write_tree(tmp_path / "checkout", members)
+  tar_path = tmp_path / "proj.tar.gz"
+  with tarfile.open(tar_path, "w:gz") as tar:
+    tar.add(project, arcname="proj")
+  config = {"max_file_size_kb": 1}
+
+  expected = extract_project_data_from_zip(str(zip_path), config)
+
+  assert "…[TRUNCADO]" in expected
+  assert extract_project_data_from_zip(str(tar_path), config) == expected
+
+
+def test_tarball_listing_already_holds_gitignore_bodies(tmp_path: Path) -> None:
+  project = _write_tree(tmp_path, {**MEMBERS, "proj/.gitignore": "*.log\n"})
+  tar_path = tmp_path / "proj.tar.gz"
+  with tarfile.open(tar_path, "w:gz") as tar:
+    tar.add(project, arcname="proj")
+  source = TarSource(str(tar_path))
+  gitignore = next(m for m in source.infolist() if m.filename == "proj/.gitignore")
+  # Sem nova passada no fluxo: prepare dos .gitignore é um no-op
+  source._iter_stream = None
+
+  source.prepare([gitignore], MAX_GITIGNORE_BYTES)
+
+  assert source.open(gitignore).read() == b"*.log\n"
+
+
+def test_source_stem_strips_compound_suffixes(tmp_path: Path) -> None:
+  assert source_stem("releases/proj-1.0.tar.gz") == "proj-1.0"
+  assert source_stem("proj.tar.zst") == "proj"
+  assert manifest_path_for(str(tmp_path / "proj"), "out").endswith("proj.manifest.json")
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from gerador_readme_ia.gui.summarizer import (
+  ROOT_GROUP,
+  build_generation_prompt,
+  build_map_reduce_prompt,
+  group_sections,
+)
+from gerador_readme_ia.utils.extraction_cache import ExtractionCache
+
+PROJECT_DATA = (
+  "\n--- repo/README.md ---\n# Repo\n"
+  "\n--- repo/src/app.py ---\nprint('app')\n"
+  "\n--- repo/docs/guia.md ---\nGuia\n"
+  "\n--- repo/src/util.py ---\ndef util(): ...\n"
+)
+
+
+class FakeSummaryClient:
+  model_name = "models/gemini-1.5-flash"
+
+  def __init__(self) -> None:
+    self.prompts = []
+
+  def get_prompt_token_budget(self) -> int:
+    return 100_000
+
+  def send_conversational_prompt(self, prompt: str, use_cache: bool = True, cancel_token=None) -> str:
+    self.prompts.append(prompt)
+    return f"resumo {len(self.prompts)}"
+
+
+def test_group_sections_by_top_level_directory() -> None:
+  groups = group_sections(PROJECT_DATA)
+
+  assert list(groups) == [ROOT_GROUP, "src/", "docs/"]
+  assert "print('app')" in groups["src/"] and "def util()" in groups["src/"]
+
+
+def test_map_reduce_prompt_reuses_cached_group_summaries(tmp_path: Path) -> None:
+  cache = ExtractionCache(str(tmp_path))
+  config = {"readme_style": "minimalista"}
+
+  first_client = FakeSummaryClient()
+  prompt = build_map_reduce_prompt(PROJECT_DATA, config, first_client, cache)
+  second_client = FakeSummaryClient()
+  build_map_reduce_prompt(PROJECT_DATA, config, second_client, cache)
+
+  assert len(first_client.prompts) == 3
+  assert second_client.prompts == []
+  assert "--- src/ (resumo) ---" in prompt
+  assert "print('app')" not in prompt
+
+
+def test_generation_prompt_is_direct_when_data_fits_the_budget() -> None:
+  client = FakeSummaryClient()
+  config = {"readme_style": "minimalista", "map_reduce": True, "token_budget": 100_000}
+
+  prompt = build_generation_prompt(PROJECT_DATA, config, client)
+
+  assert "print('app')" in prompt
+  assert client.prompts == []
@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+
+from gerador_readme_ia.gui.task_executor import LANE_CPU, LANE_NETWORK, TaskExecutor
+
+
+class FakeScheduler:
+  def __init__(self) -> None:
+    self.callbacks = []
+    self.lock = threading.Lock()
+
+  def __call__(self, delay_ms, callback) -> None:
+    with self.lock:
+      self.callbacks.append(callback)
+
+  def run_all(self) -> None:
+    with self.lock:
+      callbacks, self.callbacks = self.callbacks, []
+    for callback in callbacks:
+      callback()
+
+
+def test_on_done_is_delivered_through_the_scheduler_with_the_future() -> None:
+  scheduled = threading.Event()
+  scheduler = FakeScheduler()
+  executor = TaskExecutor(lambda delay, callback: (scheduler(delay, callback), scheduled.set()))
+  results = []
+
+  executor.submit(LANE_CPU, lambda a, b: a + b, 2, b=3, on_done=results.append)
+  assert scheduled.wait(2)
+
+  # O callback só roda quando a "thread da UI" processa a fila
+  assert results == []
+  scheduler.run_all()
+  assert [done.result() for done in results] == [5]
+
+
+def test_errors_are_kept_in_the_future() -> None:
+  scheduler = FakeScheduler()
+  executor = TaskExecutor(scheduler)
+
+  def boom():
+    raise ValueError("falhou")
+
+  future = executor.submit(LANE_NETWORK, boom)
+
+  assert isinstance(future.exception(timeout=2), ValueError)
+
+
+def test_lane_never_spawns_more_threads_than_its_limit() -> None:
+  executor = TaskExecutor(FakeScheduler(), lane_workers={LANE_NETWORK: 2})
+  release = threading.Event()
+
+  futures = [executor.submit(LANE_NETWORK, release.wait, 2) for _ in range(6)]
+  assert executor.thread_count(LANE_NETWORK) == 2
+  assert executor.thread_count(LANE_CPU) == 0
+
+  release.set()
+  assert all(future.result(timeout=2) for future in futures)
+  assert executor.thread_count(LANE_NETWORK) == 2
+
+
+def test_burst_runs_concurrently_even_with_an_idle_worker() -> None:
+  executor = TaskExecutor(FakeScheduler(), lane_workers={LANE_NETWORK: 4})
+  executor.submit(LANE_NETWORK, lambda: None).result(timeout=2)
+  # Só passa se as quatro tarefas estiverem na barreira ao mesmo tempo
+  barrier = threading.Barrier(4, timeout=2)
+
+  futures = [executor.submit(LANE_NETWORK, barrier.wait) for _ in range(4)]
+
+  assert sorted(future.result(timeout=3) for future in futures) == [0, 1, 2, 3]
+  assert executor.thread_count(LANE_NETWORK) == 4
+
+
+def test_shutdown_cancels_queued_tasks_and_rejects_new_ones() -> None:
+  scheduler = FakeScheduler()
+  executor = TaskExecutor(scheduler, lane_workers={LANE_CPU: 1})
+  started = threading.Event()
+  release = threading.Event()
+
+  def blocker():
+    started.set()
+    release.wait(2)
+
+  running = executor.submit(LANE_CPU, blocker)
+  queued = executor.submit(LANE_CPU, lambda: "nunca", on_done=lambda future: None)
+  assert started.wait(2)
+
+  threading.Timer(0.05, release.set).start()
+  assert executor.shutdown(timeout=2) is True
+
+  assert running.done() and not running.cancelled()
+  assert queued.cancelled()
+  # Depois de encerrado, nada mais é entregue à UI
+  assert scheduler.callbacks == []
+  with pytest.raises(RuntimeError):
+    executor.submit(LANE_CPU, lambda: None)